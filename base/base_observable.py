@@ -1,20 +1,62 @@
+import weakref
+
 from .observer import Observer
 
 
 class BaseObservable:
+    """
+    Subject of the observer pattern. Observers are held through weak references in an
+    insertion-ordered dict keyed by id(observer), so attach and detach are O(1), notify
+    calls observers in the order they were attached, and an observer that is no longer
+    used anywhere else is dropped automatically instead of being kept alive by its subjects.
+    """
     def __init__(self):
-        self.observers = []
+        self._observers = {}
+        # Tuple of the registered references, rebuilt after attach or detach
+        self._snapshot = None
+
+    @property
+    def observers(self):
+        """
+        Live observers in the order they were attached.
+        """
+        return [observer for observer in (ref() for ref in self._observers.values()) if observer is not None]
 
     def attach(self, observer: Observer) -> None:
-        if observer not in self.observers:
-            self.observers.append(observer)
+        key = id(observer)
+        if key in self._observers:
+            return
+        self._observers[key] = weakref.ref(observer, self._forget(key))
+        self._snapshot = None
+
+    def _forget(self, key):
+        # The callback only holds the subject weakly, so registering does not keep it alive
+        subject = weakref.ref(self)
+
+        def forget(ref):
+            observable = subject()
+            if observable is not None and observable._observers.get(key) is ref:
+                del observable._observers[key]
+                observable._snapshot = None
+        return forget
 
     def detach(self, observer: Observer) -> None:
-        try:
-            self.observers.remove(observer)
-        except ValueError:
-            pass
+        if self._observers.pop(id(observer), None) is not None:
+            self._snapshot = None
+
+    def is_attached(self, observer: Observer) -> bool:
+        ref = self._observers.get(id(observer))
+        return ref is not None and ref() is observer
+
+    def detach_all(self) -> None:
+        self._observers.clear()
+        self._snapshot = None
 
     def notify(self) -> None:
-        for observer in self.observers:
-            observer.update(self)
\ No newline at end of file
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._observers.values())
+        for ref in snapshot:
+            observer = ref()
+            if observer is not None:
+                observer.update(self)
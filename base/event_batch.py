@@ -0,0 +1,52 @@
+class EventBatch:
+    """
+    Queue of notifications collected during a step and handed to each subscriber in one
+    call, instead of one update() per notification.
+
+    Ordering guarantees:
+        - A batch lists its subjects in the order they were queued, each subject at most once
+        - Subscribers of a topic get the batch in the order they subscribed
+        - flush() without a topic delivers the topics in the order they were first subscribed
+        - Subjects queued while a batch is being delivered go into the next batch
+
+    Attributes:
+        subscribers (dict): Maps each topic to its list of handlers, called with a list of subjects
+    """
+    def __init__(self):
+        self.subscribers = {}
+        self._queues = {}
+
+    def subscribe(self, topic, handler):
+        """
+        Call handler(subjects) with every batch of topic.
+        """
+        self.subscribers.setdefault(topic, []).append(handler)
+        self._queues.setdefault(topic, {})
+
+    def queue(self, topic, subject):
+        """
+        Add subject to the pending batch of topic.
+        """
+        self._queues[topic][subject] = None
+
+    def pending(self, topic):
+        return len(self._queues[topic])
+
+    def flush(self, topic=None):
+        """
+        Deliver the pending batch of topic, or of every topic, to its subscribers.
+
+        Returns:
+            int: Number of subjects delivered
+        """
+        topics = list(self.subscribers) if topic is None else [topic]
+        delivered = 0
+        for name in topics:
+            batch = list(self._queues[name])
+            if not batch:
+                continue
+            self._queues[name] = {}
+            for handler in self.subscribers[name]:
+                handler(batch)
+            delivered += len(batch)
+        return delivered
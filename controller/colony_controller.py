@@ -0,0 +1,157 @@
+import heapq
+
+from model.buzzness import Bee
+from utils.rng import stream
+
+
+class BeePool:
+    """
+    [1.1.8 Lifecycle] Free list of retired Bee objects, reused for new bees so a long run
+    with births and deaths does not keep allocating bees and their exploration memory.
+
+    Attributes:
+        free (list): Retired bees waiting to be reused
+    """
+    def __init__(self):
+        self.free = []
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, ID, born, hive_pos, hive_size, world_size):
+        """
+        [1.1.8 Lifecycle] A bee in the hive with the given ID, reused when one is free.
+        """
+        if self.free:
+            bee = self.free.pop()
+            bee.reset(ID, born)
+            return bee
+        bee = Bee(ID, (0, 0), hive_pos, hive_size, world_size)
+        bee.born = born
+        return bee
+
+    def release(self, bee):
+        """
+        [1.1.8 Lifecycle] Keep a retired bee for reuse.
+        """
+        self.free.append(bee)
+
+
+class ColonyController:
+    """
+    [2.8 Colony Controller] Ages the bees, retires the ones that die and raises brood from
+    the nectar the hive collects, so the colony grows and shrinks over a run.
+
+    Bees only die inside the hive without nectar, so no load is lost in flight and a dead
+    bee holds nothing the other controllers wait for. A dead bee is removed from the
+    simulation and detached from every controller it observed or was observed by, then
+    kept in a BeePool for the next bee that emerges.
+
+    Every brood_cost nectar loads delivered to the hive lay one egg, which emerges as a
+    new bee brood_time steps later while the colony is below max_bees.
+
+    When several colonies share the world, each has its own ColonyController managing
+    only the bees and hive of its Colony.
+
+    Attributes:
+        simulation (SimulationController): Simulation whose bees are managed
+        setup (callable): Called with every new bee to wire it to the world and controllers
+        colony (Colony): Colony managed, None for the single hive of the simulation
+        hive_controller (HiveController): Controller of the managed hive
+        lifespan (int): Age at which a bee dies, None for no age limit
+        mortality (float): Chance that a bee in the hive dies in a given step
+        brood_cost (int): Nectar loads delivered per egg, None for no brood
+        brood_time (int): Steps from egg to a new bee
+        max_bees (int): Largest colony brood can grow to, None for no limit
+        pool (BeePool): Retired bees kept for reuse
+        brood (list): Heap of the steps the queued eggs emerge at
+        births (int): Number of bees that emerged during the run
+        deaths (int): Number of bees that died during the run
+    """
+    OPTIONS = ("lifespan", "mortality", "brood_cost", "brood_time", "max_bees")
+
+    def __init__(self, simulation, setup, lifespan=None, mortality=0.0, brood_cost=None, brood_time=20,
+                 max_bees=None, seed=None, colony=None):
+        self.simulation = simulation
+        self.setup = setup
+        self.colony = colony
+        self.hive_controller = colony.hive_controller if colony is not None else simulation.hive_controller
+        self._hive_pos = colony.hive_pos if colony is not None else simulation.world.hive_pos
+        self.lifespan = lifespan
+        self.mortality = mortality
+        self.brood_cost = brood_cost
+        self.brood_time = brood_time
+        self.max_bees = max_bees
+        self.pool = BeePool()
+        self.brood = []
+        self.births = 0
+        self.deaths = 0
+        self._nectar_used = 0
+        # Key 0 is never a bee ID, so the colony draws do not overlap any bee's stream
+        self._rng = stream(seed, 0) if colony is None else stream(seed, 0, colony.number)
+
+    def step(self, t):
+        """
+        [2.8 Colony Controller] Apply deaths, egg laying and emergence after timestep t.
+        """
+        # Bees parked on the scheduler while they charge age and die like stepped ones
+        for bee in self.simulation.roster.in_hive():
+            if self.colony is not None and bee not in self.colony:
+                continue
+            if not bee.hasNectar:
+                bee.age = t - bee.born
+                if self._dies(bee):
+                    self.retire(bee)
+
+        if self.brood_cost is not None:
+            delivered = self.hive_controller.nectar_delivered
+            while delivered - self._nectar_used >= self.brood_cost:
+                self._nectar_used += self.brood_cost
+                heapq.heappush(self.brood, t + self.brood_time)
+
+        while self.brood and self.brood[0] <= t:
+            if self.max_bees is not None and self._size() >= self.max_bees:
+                break
+            heapq.heappop(self.brood)
+            self.spawn(t)
+
+    def _size(self):
+        return len(self.colony.bees) if self.colony is not None else len(self.simulation.bees)
+
+    def _dies(self, bee):
+        if self.lifespan is not None and bee.age >= self.lifespan:
+            return True
+        return self.mortality > 0 and self._rng.random() < self.mortality
+
+    def spawn(self, t):
+        """
+        [2.8 Colony Controller] Add a new bee to the hive at timestep t.
+
+        Returns:
+            Bee: The new bee
+        """
+        simulation = self.simulation
+        bee = self.pool.acquire(simulation.new_bee_id(), t, self._hive_pos[:2],
+                                self.hive_controller.hive.hive.shape, simulation.world.world_size)
+        self.setup(bee)
+        simulation.add_bee(bee)
+        if self.colony is not None:
+            self.colony.bees.append(bee)
+        self.births += 1
+        print(f"Bee {bee.ID} emerged in the hive")
+        return bee
+
+    def retire(self, bee):
+        """
+        [2.8 Colony Controller] Remove a dead bee from the simulation and its observers.
+        """
+        simulation = self.simulation
+        simulation.remove_bee(bee)
+        if self.colony is not None:
+            self.colony.bees.remove(bee)
+        self.hive_controller.detach(bee)
+        simulation.world_controller.detach(bee)
+        bee.detach_all()
+        self.pool.release(bee)
+        self.deaths += 1
+        print(f"Bee {bee.ID} died at age {bee.age}")
@@ -0,0 +1,260 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from model.buzzness import Bee, BeeState
+from model.grid import DenseGrid, TiledGrid
+from model.neighbour_mask import NeighbourMasks
+from model.swarm import SwarmArrays, step_swarm
+from model.world import PropertyType
+from utils.rng import stream
+
+
+def _shared_array(shape, dtype, name=None):
+    """
+    Create (name is None) or attach to a shared memory block and view it as an array.
+
+    Returns:
+        tuple: (SharedMemory, numpy.ndarray)
+    """
+    nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    shm = shared_memory.SharedMemory(name=name, create=name is None, size=nbytes)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    if name is None:
+        array[...] = 0
+    return shm, array
+
+
+def strip_of(xs, inhive, hive_x, width, workers):
+    """
+    [2.7 Domain Decomposition] Worker owning each bee: the world is cut into equal vertical
+    strips and bees in the hive belong to the strip holding the hive entrance.
+    """
+    xs = np.where(inhive, hive_x, xs)
+    return np.minimum(xs * workers // width, workers - 1).astype(np.int32)
+
+
+def _strip_worker(rank, conn, spec):
+    """
+    [2.7 Domain Decomposition] Worker process stepping the bees inside one strip.
+
+    Each step it first takes in the bees other strips handed over on the previous step,
+    advances its own bees, then writes the bees that crossed into another strip to its
+    halo buffer. Claims and deliveries go back to the coordinator through conn.
+    """
+    workers = spec["workers"]
+    swarm = SwarmArrays(spec["num_bees"], name=spec["swarm"])
+    shms = []
+    cells = None
+    if spec["grid"][0] == "dense":
+        shm, cells = _shared_array(spec["grid"][2], np.uint8, spec["grid"][1])
+        shms.append(shm)
+        grid = DenseGrid.from_array(cells)
+    else:
+        grid = TiledGrid.open_snapshot(spec["grid"][1])
+    shm, flower_nectar = _shared_array(spec["num_flowers"], np.bool_, spec["flower_nectar"])
+    shms.append(shm)
+    shm, draws = _shared_array(spec["num_bees"], np.float64, spec["draws"])
+    shms.append(shm)
+    shm, halo_ids = _shared_array((2, workers, spec["num_bees"]), np.int32, spec["halo_ids"])
+    shms.append(shm)
+    shm, halo_dest = _shared_array((2, workers, spec["num_bees"]), np.int32, spec["halo_dest"])
+    shms.append(shm)
+    shm, halo_counts = _shared_array((2, workers), np.int32, spec["halo_counts"])
+    shms.append(shm)
+
+    hive_pos, world_size = spec["hive_pos"], spec["world_size"]
+    # The world does not change during a run, so cached blocks never go stale
+    masks = NeighbourMasks(grid)
+    local = np.nonzero(swarm.owner == rank)[0]
+    while True:
+        command, t = conn.recv()
+        if command == "stop":
+            break
+
+        # Take in the bees handed over by the other strips on the previous step
+        previous = (t - 1) % 2
+        incoming = [local]
+        for source in range(workers):
+            count = halo_counts[previous, source]
+            if source != rank and count:
+                ids = halo_ids[previous, source, :count]
+                incoming.append(ids[halo_dest[previous, source, :count] == rank])
+        local = np.concatenate(incoming)
+
+        claims, deliveries = step_swarm(swarm, local, draws, grid, spec["flower_cells"],
+                                        flower_nectar, hive_pos, world_size, masks)
+
+        # Hand over the bees that are now in another strip
+        owners = strip_of(swarm.x[local], swarm.inhive[local], hive_pos[0], world_size[0], workers)
+        crossing = owners != rank
+        current = t % 2
+        leaving = local[crossing]
+        halo_ids[current, rank, :len(leaving)] = leaving
+        halo_dest[current, rank, :len(leaving)] = owners[crossing]
+        halo_counts[current, rank] = len(leaving)
+        swarm.owner[leaving] = owners[crossing]
+        local = local[~crossing]
+
+        conn.send((claims, deliveries))
+
+    grid = masks = cells = flower_nectar = draws = halo_ids = halo_dest = halo_counts = None
+    swarm.close()
+    for shm in shms:
+        shm.close()
+    conn.close()
+
+
+class DomainController:
+    """
+    [2.7 Domain Decomposition] Runs a swarm split into vertical strips of the world, each
+    strip stepped by its own worker process.
+
+    Bee state, the occupancy grid, flower nectar and the halo buffers used to hand over
+    bees crossing a strip border all live in shared memory (tiled grids share their
+    memory-mapped file instead). The coordinator process is the central channel: it
+    settles nectar claims in bee order, feeds deliveries to the HiveController and spreads
+    flower information, so results do not depend on the number of workers.
+
+    Attributes:
+        world (World): The world being simulated
+        hive_controller (HiveController): Controller storing delivered nectar
+        swarm (SwarmArrays): Shared state of every bee
+        workers (int): Number of worker processes
+        nectar_collected (int): Number of times a bee took nectar from a flower
+    """
+    def __init__(self, world, hive_controller, num_bees, workers=2, seed=None):
+        self.world = world
+        self.hive_controller = hive_controller
+        self.workers = workers
+        self.nectar_collected = 0
+        self.hive_xy = (world.hive_pos[0], world.hive_pos[1])
+        self._rng = stream(seed)
+        self._shms = []
+
+        self.swarm = SwarmArrays(num_bees, shared=True)
+        self.swarm.owner[:] = strip_of(self.swarm.x, self.swarm.inhive, self.hive_xy[0],
+                                       world.world_size[0], workers)
+
+        if isinstance(world.grid, TiledGrid):
+            grid_spec = ("tiled", world.grid.snapshot())
+        else:
+            shm, cells = self._share(world.grid.cells.shape, np.uint8)
+            cells[...] = world.grid.cells
+            grid_spec = ("dense", shm.name, cells.shape)
+
+        self.flowers = [p for p in world.properties if p.type == PropertyType.FLOWER]
+        flower_cells = {}
+        for flower_id, flower in enumerate(self.flowers):
+            for x in range(flower.pos[0], flower.pos[0] + flower.width):
+                for y in range(flower.pos[1], flower.pos[1] + flower.height):
+                    flower_cells.setdefault((x, y), flower_id)
+        nectar_shm, self.flower_nectar = self._share(len(self.flowers), np.bool_)
+        self.flower_nectar[:] = [flower.has_nectar for flower in self.flowers]
+        self._flower_ids = {flower: flower_id for flower_id, flower in enumerate(self.flowers)}
+
+        draws_shm, self.draws = self._share(num_bees, np.float64)
+        ids_shm, _ = self._share((2, workers, num_bees), np.int32)
+        dest_shm, _ = self._share((2, workers, num_bees), np.int32)
+        counts_shm, _ = self._share((2, workers), np.int32)
+
+        spec = {"workers": workers, "num_bees": num_bees, "swarm": self.swarm.name,
+                "grid": grid_spec, "num_flowers": len(self.flowers), "flower_cells": flower_cells,
+                "flower_nectar": nectar_shm.name, "draws": draws_shm.name,
+                "halo_ids": ids_shm.name, "halo_dest": dest_shm.name, "halo_counts": counts_shm.name,
+                "hive_pos": self.hive_xy, "world_size": world.world_size}
+        self._connections = []
+        self._processes = []
+        for rank in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_strip_worker, args=(rank, child, spec), daemon=True)
+            process.start()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def _share(self, shape, dtype):
+        shm, array = _shared_array(shape, dtype)
+        self._shms.append(shm)
+        return shm, array
+
+    def step(self, t):
+        """
+        [2.7 Domain Decomposition] Advance every strip by one timestep, then settle nectar
+        claims and hive deliveries centrally.
+        """
+        for flower in self.world.regenerate_nectar(t):
+            self.flower_nectar[self._flower_ids[flower]] = True
+        self.draws[:] = self._rng.random(self.swarm.size)
+
+        for connection in self._connections:
+            connection.send(("step", t))
+        claims, deliveries = [], []
+        for connection in self._connections:
+            worker_claims, worker_deliveries = connection.recv()
+            claims.extend(worker_claims)
+            deliveries.extend(worker_deliveries)
+
+        # [2.1.2 Nectar collection] Lowest bee index wins a contested flower
+        swarm = self.swarm
+        for bee, flower_id in sorted(claims):
+            flower = self.flowers[flower_id]
+            if not flower.has_nectar:
+                continue
+            self.world.deplete_flower(flower)
+            self.flower_nectar[flower_id] = False
+            self.nectar_collected += 1
+            swarm.has_nectar[bee] = True
+            swarm.state[bee] = BeeState.RETURNING.value
+            swarm.target_x[bee], swarm.target_y[bee] = self.hive_xy
+            swarm.known_x[bee], swarm.known_y[bee] = flower.pos
+
+        # [2.2 Hive Controller] Store nectar and share the flower with the other bees
+        for bee in sorted(deliveries):
+            swarm.has_nectar[bee] = False
+            self.hive_controller.store_nectar()
+            if swarm.known_x[bee] >= 0:
+                self._spread_path(int(swarm.known_x[bee]), int(swarm.known_y[bee]))
+
+    def _spread_path(self, x, y):
+        """
+        [2.2.2 Path information sharing] Each bee takes the flower with the usual chance,
+        if it knows no flower or only one at least as far from the hive.
+        """
+        swarm = self.swarm
+        hx, hy = self.hive_xy
+        length = max(abs(x - hx), abs(y - hy))
+        known = swarm.known_x >= 0
+        own = np.maximum(np.abs(swarm.known_x - hx), np.abs(swarm.known_y - hy))
+        chance = self._rng.random(swarm.size)
+        take = (chance > Bee.COMMUNICATION_THRESHOLD) & (~known | (own >= length))
+        swarm.known_x[take] = x
+        swarm.known_y[take] = y
+
+    def positions(self):
+        """
+        [2.7 Domain Decomposition] (x, y) arrays of the bees outside the hive.
+        """
+        outside = ~self.swarm.inhive
+        return self.swarm.x[outside].copy(), self.swarm.y[outside].copy()
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory.
+        """
+        for connection in self._connections:
+            connection.send(("stop", 0))
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._processes = []
+        self.flower_nectar = None
+        self.draws = None
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms = []
+        self.swarm.close()
+        self.swarm.unlink()
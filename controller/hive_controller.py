@@ -1,8 +1,10 @@
+from itertools import count
 from typing import List
 
 from base.base_observable import BaseObservable
 from base.observer import Observer
 from model.buzzness import Bee
+from model.world import World
 
 
 class HiveController(BaseObservable, Observer):
@@ -11,13 +13,27 @@ class HiveController(BaseObservable, Observer):
     
     Attributes:
         hive: The hive instance being controlled
-        path_to_flower: List of moves from hive to a flower
+        path_to_flower: List of moves from hive to a flower, the latest one brought home
+        nectar_delivered: Number of nectar loads bees brought back to the hive
+        deferred: Whether deliveries are queued for resolve_deliveries instead of applied
+        max_sites: Most flower sites the hive remembers
+        sites: Known flower sites, best first, as [site, path, flower, sequence] entries
     """
 
-    def __init__(self, hive):
+    def __init__(self, hive, world=None, max_sites=8):
         super().__init__()
         self.hive = hive
         self.path_to_flower = []
+        self.nectar_delivered = 0
+        self.deferred = False
+        # Insertion-ordered set, a bee notifies more than once in its arrival step
+        self._deliveries = {}
+        self.max_sites = max_sites
+        self.sites = []
+        self._site_seq = count()
+        if world is not None:
+            # Told about depleted flowers so their sites can be dropped
+            world.attach(self)
 
     def __add_nectar(self):
         """
@@ -30,6 +46,59 @@ class HiveController(BaseObservable, Observer):
             else:
                 continue
 
+    def store_nectar(self):
+        """
+        [2.2.1 Nectar storage] Record a delivered nectar load and store it in a comb.
+        """
+        self.nectar_delivered += 1
+        self.__add_nectar()
+
+    @staticmethod
+    def _site_rank(entry):
+        _, path, flower, seq = entry
+        empty = flower is not None and not flower.has_nectar
+        return (empty, len(path), seq)
+
+    def remember_site(self, path: List, flower=None):
+        """
+        [2.2.3 Flower sites] Record a flower site reported by a returning bee.
+        Sites are kept in a bounded priority queue, flowers holding nectar first and
+        then by path length; the worst site is dropped once max_sites are known.
+        A flower that is already empty replaces its old entry with nothing.
+        """
+        # A site is the cell the path ends at, relative to the hive
+        site = (sum(move[0] for move in path), sum(move[1] for move in path))
+        self.sites = [entry for entry in self.sites if entry[0] != site]
+        if flower is not None and not flower.has_nectar:
+            return
+        self.sites.append([site, list(path), flower, next(self._site_seq)])
+        self.sites.sort(key=self._site_rank)
+        del self.sites[self.max_sites:]
+
+    def evict_stale_sites(self):
+        """
+        [2.2.3 Flower sites] Drop the sites whose flower no longer holds nectar.
+        """
+        self.sites = [entry for entry in self.sites if entry[2] is None or entry[2].has_nectar]
+
+    def recruit(self, rng):
+        """
+        [2.2.3 Flower sites] Site a recruited bee is told about, drawn from the known sites
+        with weight 1 / rank so better sites recruit more bees.
+
+        Returns:
+            tuple: (path, flower); the latest path and no flower if no site is known
+        """
+        if not self.sites:
+            return self.path_to_flower, None
+        weights = [1 / (rank + 1) for rank in range(len(self.sites))]
+        draw = rng.uniform(0, sum(weights))
+        for entry, weight in zip(self.sites, weights):
+            draw -= weight
+            if draw < 0:
+                break
+        return entry[1], entry[2]
+
     def __spread_path(self, path: List):
         """
         [2.2.2 Path information sharing] Notify path information to other bees.
@@ -37,17 +106,43 @@ class HiveController(BaseObservable, Observer):
         self.path_to_flower = path
         self.notify()
 
+    def on_arrivals(self, bees):
+        """
+        [2.2.1 Nectar storage] Handle a batch of bees that came home this step, in batch order.
+        Bees of other colonies in the batch are left to their own hive's controller.
+        """
+        for bee in bees:
+            if self.is_attached(bee):
+                self.update(bee)
+
     def update(self, observable: BaseObservable) -> None:
         """
-        update() whenever a bee with nectar comes back to hive
+        update() whenever a bee with nectar comes back to hive, or a flower changes in the world
         """
-        if isinstance(observable, Bee):
+        if isinstance(observable, World):
+            if observable.last_change_kind == "nectar":
+                self.evict_stale_sites()
+        elif isinstance(observable, Bee):
             if observable.inhive:
                 if observable.hasNectar:
+                    if self.deferred:
+                        self._deliveries[observable] = None
+                        return
                     print(f"Bee {observable.ID} came back to hive with nectar")
                     observable.hasNectar = False
-                    self.__add_nectar()
+                    self.store_nectar()
                     if len(observable.path_to_flower) > 0:
-                        self.__spread_path(observable.path_to_flower)
-
+                        self.remember_site(observable.path_to_flower, observable.known_flower)
+                        # Recruits are only told about sites that may still hold nectar
+                        if self.sites:
+                            self.__spread_path(observable.path_to_flower)
 
+    def resolve_deliveries(self):
+        """
+        [2.2.1 Nectar storage] Apply the deliveries queued in deferred mode, in bee ID order.
+        """
+        deliveries, self._deliveries = self._deliveries, {}
+        deferred, self.deferred = self.deferred, False
+        for bee in sorted(deliveries, key=lambda bee: bee.ID):
+            self.update(bee)
+        self.deferred = deferred
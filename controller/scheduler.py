@@ -0,0 +1,77 @@
+class TimingWheel:
+    """
+    [2.5 Scheduler] Hashed timing wheel holding parked items until a future timestep.
+    Scheduling is O(1) and each step only looks at the one slot for that step, so parked
+    items cost nothing until they wake up.
+
+    pop_due must be called for every consecutive timestep, and items must be scheduled
+    for a step after the current one.
+
+    Attributes:
+        size (int): Number of slots; items further ahead stay in their slot for extra rounds
+        slots (list): One list of (wake step, item) per slot
+    """
+    def __init__(self, size=64):
+        self.size = size
+        self.slots = [[] for _ in range(size)]
+        self._count = 0
+        # Wake step of each parked item, so one can be taken off its slot early
+        self._steps = {}
+
+    def __len__(self):
+        return self._count
+
+    def schedule(self, item, step):
+        """
+        [2.5 Scheduler] Park item until timestep step.
+        """
+        self.slots[step % self.size].append((step, item))
+        self._steps[item] = step
+        self._count += 1
+
+    def __contains__(self, item):
+        return item in self._steps
+
+    def remove(self, item):
+        """
+        [2.5 Scheduler] Take a parked item off the wheel before it wakes up.
+
+        Returns:
+            bool: True if the item was parked
+        """
+        step = self._steps.pop(item, None)
+        if step is None:
+            return False
+        index = step % self.size
+        self.slots[index] = [entry for entry in self.slots[index] if entry[1] is not item]
+        self._count -= 1
+        return True
+
+    def pop_due(self, t):
+        """
+        [2.5 Scheduler] Remove and return the items due at timestep t, in scheduling order.
+        """
+        index = t % self.size
+        slot = self.slots[index]
+        if not slot:
+            return []
+        due = [item for step, item in slot if step <= t]
+        if len(due) < len(slot):
+            self.slots[index] = [entry for entry in slot if entry[0] > t]
+        else:
+            self.slots[index] = []
+        self._count -= len(due)
+        for item in due:
+            self._steps.pop(item, None)
+        return due
+
+
+class SimulationClock:
+    """
+    [2.5 Scheduler] Current timestep shared with bees whose positions are computed lazily.
+
+    Attributes:
+        now (int): Timestep being simulated
+    """
+    def __init__(self):
+        self.now = 0
@@ -0,0 +1,257 @@
+import numpy as np
+
+from controller.scheduler import SimulationClock, TimingWheel
+from base.event_batch import EventBatch
+from controller.step_engine import SerialEngine, TwoPhaseEngine
+from model.bee_roster import BeeRoster
+from model.heatmap import VisitHeatmap
+
+
+class SimulationController:
+    """
+    [2.4 Simulation Controller] Advances the world and the bees one timestep at a time
+    and decides when a run can stop early.
+
+    Bees that would only charge in the hive are parked on a timing wheel with their energy
+    applied in bulk, so the per-step cost scales with the active bees. With fast_forward,
+    bees following or returning along a path that cannot touch any property are parked
+    until the end of that stretch and their positions are only computed when observed.
+
+    With batch_dispatch, bees queue their notifications on an EventBatch instead of
+    notifying each controller at once. A step then runs in this order: every active bee
+    picks and takes its move in list order; the WorldController checks all moves in one
+    on_moves call in the same order; each bee then applies the result (alternative moves
+    after a collision still notify at once); finally the HiveController handles the bees
+    that came home in one on_arrivals call. A bee's move is checked after the earlier bees
+    in the list have moved but before any of them has taken an alternative move.
+
+    Stop conditions:
+        nectar_delivered: No flower holds nectar and no bee is still carrying any
+        steady_state: Flower nectar and hive deliveries did not change for steady_window steps
+
+    Attributes:
+        world (World): The world being simulated
+        world_controller (WorldController): Controller handling bee/world collisions
+        hive_controller (HiveController): Controller handling bees in the (first) hive
+        hive_controllers (list): Controller of every colony's hive, when colonies share the world
+        bees (list): Bees in the simulation
+        stop_condition (str): One of the stop conditions above, None to run every step
+        steady_window (int): Number of unchanged steps that count as a steady state
+        park_charging (bool): Whether charging bees are parked instead of stepped
+        fast_forward (bool): Whether bees on collision-free path stretches skip stepping
+        scheduler (TimingWheel): Parked bees keyed by the step they wake up
+        clock (SimulationClock): Current timestep
+        engine (SerialEngine | TwoPhaseEngine): Strategy used to advance the active bees
+        heatmap (VisitHeatmap): Visits per cell over the run, None unless record_visits is set
+        events (EventBatch): Batched bee notifications, None unless batch_dispatch is set
+        roster (BeeRoster): The bees indexed by state, by hive and by ID
+    """
+    STOP_NECTAR_DELIVERED = "nectar_delivered"
+    STOP_STEADY_STATE = "steady_state"
+    STOP_CONDITIONS = (STOP_NECTAR_DELIVERED, STOP_STEADY_STATE)
+
+    def __init__(self, world, world_controller, hive_controller, bees, stop_condition=None, steady_window=100,
+                 park_charging=True, fast_forward=True, engine=None, record_visits=False, batch_dispatch=False):
+        if stop_condition is not None and stop_condition not in self.STOP_CONDITIONS:
+            raise ValueError(f"Unknown stop condition {stop_condition}")
+        self.world = world
+        self.world_controller = world_controller
+        # One controller per colony; a single controller is a one-colony run
+        if not isinstance(hive_controller, (list, tuple)):
+            hive_controller = [hive_controller]
+        self.hive_controllers = list(hive_controller)
+        self.hive_controller = self.hive_controllers[0]
+        self.bees = bees
+        self.stop_condition = stop_condition
+        self.steady_window = steady_window
+        self._last_signature = None
+        self._steady_steps = 0
+        self.park_charging = park_charging
+        # Fast-forwarded bees are not tracked move by move, so indexed runs step every move
+        self.fast_forward = fast_forward and world_controller.bee_index is None
+        self.scheduler = TimingWheel()
+        self.clock = SimulationClock()
+        self.engine = engine if engine is not None else SerialEngine()
+        self.engine.prepare(bees)
+        self.heatmap = VisitHeatmap(world.world_size) if record_visits else None
+        # Insertion-ordered set of bees stepped every timestep
+        self._active = dict.fromkeys(bees)
+        self.roster = BeeRoster(bees)
+        self._next_id = None
+        self.events = None
+        if batch_dispatch:
+            if isinstance(self.engine, TwoPhaseEngine):
+                raise ValueError("Batched dispatch steps bees serially, it cannot use the two-phase engine")
+            self.events = EventBatch()
+            self.events.subscribe("moves", world_controller.on_moves)
+            for controller in self.hive_controllers:
+                self.events.subscribe("arrivals", controller.on_arrivals)
+            for bee in bees:
+                bee.events = self.events
+
+    def step(self, t):
+        """
+        [2.4 Simulation Controller] Advance the simulation to timestep t.
+        """
+        self.clock.now = t
+        self.world.regenerate_nectar(t)
+        for bee in self.scheduler.pop_due(t):
+            bee.finish_fast_forward()
+            self._active[bee] = None
+
+        bees = list(self._active)
+        if self.events is None:
+            wake_steps = self.engine.run(bees, lambda bee: self._advance(bee, t))
+        else:
+            wake_steps = self._advance_batch(bees, t)
+        for bee, wake_step in zip(bees, wake_steps):
+            if wake_step is not None:
+                del self._active[bee]
+                self.scheduler.schedule(bee, wake_step)
+        self.world_controller.share_paths()
+        scent = self.world.scent
+        if scent is not None or self.heatmap is not None:
+            xs, ys = self.bee_positions()
+            if scent is not None:
+                scent.deposit(xs, ys)
+                scent.step(t)
+            if self.heatmap is not None:
+                self.heatmap.add(xs, ys)
+
+    def _park(self, bee, t):
+        """
+        Park a bee that would only charge or follow a collision-free path stretch.
+
+        Returns:
+            int: Timestep the bee should be parked until, None if it is stepped now
+        """
+        if self.park_charging:
+            steps = bee.charging_steps()
+            if steps > 0:
+                bee.charge_in_bulk(steps)
+                return t + steps
+        if self.fast_forward:
+            steps = bee.fast_forward_steps(self.world)
+            if steps > 1:
+                bee.begin_fast_forward(self.clock, steps)
+                return t + steps
+        return None
+
+    def _advance(self, bee, t):
+        """
+        Advance one bee by a timestep, touching only that bee.
+
+        Returns:
+            int: Timestep the bee should be parked until, None if it stays active
+        """
+        wake_step = self._park(bee, t)
+        if wake_step is None:
+            bee.step_change()
+            self.world_controller.track(bee)
+        return wake_step
+
+    def _advance_batch(self, bees, t):
+        """
+        Advance the active bees by a timestep with their notifications batched.
+
+        Returns:
+            list: Timestep each bee should be parked until, None for bees that stay active
+        """
+        wake_steps = [self._park(bee, t) for bee in bees]
+        stepped = [bee for bee, wake_step in zip(bees, wake_steps) if wake_step is None]
+        moving = [bee for bee in stepped if bee.begin_step()]
+        self.events.flush("moves")
+        for bee in moving:
+            bee.end_step()
+        for bee in stepped:
+            self.world_controller.track(bee)
+        self.events.flush("arrivals")
+        return wake_steps
+
+    def _reserve_ids(self):
+        # Worked out before the first bee leaves, so the IDs of dead bees are never reused
+        if self._next_id is None:
+            self._next_id = max((bee.ID for bee in self.bees), default=0) + 1
+
+    def new_bee_id(self):
+        """
+        [1.1.8 Lifecycle] An ID no bee of any colony has used in this run.
+        """
+        self._reserve_ids()
+        ID = self._next_id
+        self._next_id += 1
+        return ID
+
+    def add_bee(self, bee):
+        """
+        [1.1.8 Lifecycle] Add a newly emerged bee, stepped from the next timestep.
+        """
+        self.engine.prepare([bee])
+        bee.events = self.events
+        self.bees.append(bee)
+        self.roster.add(bee)
+        self._active[bee] = None
+
+    def remove_bee(self, bee):
+        """
+        [1.1.8 Lifecycle] Stop stepping a bee that died and forget where it was.
+        """
+        self._reserve_ids()
+        self._active.pop(bee, None)
+        # A bee that dies while parked must not wake up again
+        self.scheduler.remove(bee)
+        self.bees.remove(bee)
+        self.roster.remove(bee)
+        if self.world_controller.bee_index is not None:
+            self.world_controller.bee_index.remove(bee)
+
+    def bee_positions(self):
+        """
+        (xs, ys) arrays with the cell of every bee outside the hive.
+        """
+        cells = [bee.get_pos() for bee in self.roster.outside()]
+        if not cells:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        xs, ys = np.array(cells, dtype=np.int64).T
+        return xs, ys
+
+    def active_bees(self):
+        """
+        Bees that are currently stepped every timestep.
+        """
+        return list(self._active)
+
+    def nectar_in_transit(self):
+        """
+        Number of nectar loads collected from flowers but not yet delivered to the hive.
+        """
+        return self.world_controller.nectar_collected - self.nectar_delivered()
+
+    def nectar_delivered(self):
+        """
+        Number of nectar loads delivered to all hives.
+        """
+        return sum(controller.nectar_delivered for controller in self.hive_controllers)
+
+    def should_stop(self, t):
+        """
+        [2.4 Simulation Controller] Check the stop condition after timestep t.
+
+        Returns:
+            bool: True if the run can end now
+        """
+        if self.stop_condition == self.STOP_NECTAR_DELIVERED:
+            if self.world.nectar_count == 0 and self.nectar_in_transit() == 0:
+                print(f"All nectar delivered at timestep {t}")
+                return True
+        elif self.stop_condition == self.STOP_STEADY_STATE:
+            signature = (self.world.nectar_count, self.nectar_delivered())
+            if signature == self._last_signature:
+                self._steady_steps += 1
+            else:
+                self._last_signature = signature
+                self._steady_steps = 0
+            if self._steady_steps >= self.steady_window:
+                print(f"Steady state reached at timestep {t}")
+                return True
+        return False
@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.rng import BeeRandom
+
+
+def _seed_bees(bees, seed):
+    if seed is None:
+        return
+    for bee in bees:
+        bee.rng = BeeRandom(seed, bee.ID)
+
+
+class SerialEngine:
+    """
+    [2.6 Step Engine] Advances bees one after another; controllers apply every change as
+    soon as a bee notifies them, so results depend on the order of the bee list.
+
+    Attributes:
+        seed: Seed for the per-bee random streams, None to keep the bees' own streams
+    """
+    def __init__(self, seed=None):
+        self.seed = seed
+
+    def prepare(self, bees):
+        """
+        [1.1.6 Random streams] Give each bee its own random stream.
+        """
+        _seed_bees(bees, self.seed)
+
+    def run(self, bees, advance):
+        """
+        [2.6 Step Engine] Call advance(bee) for every bee.
+
+        Returns:
+            list: The result of advance for each bee, in the order of bees
+        """
+        return [advance(bee) for bee in bees]
+
+    def close(self):
+        pass
+
+
+class TwoPhaseEngine:
+    """
+    [2.6 Step Engine] Advances bees in two phases so a step can be sharded across threads
+    and gives the same result for any worker count.
+
+    Phase one (propose): every bee moves with the controllers in deferred mode. Bees only
+    change their own state; nectar claims and hive deliveries are queued instead of applied.
+    Phase two (resolve): claims and deliveries are applied in bee ID order, so when two
+    bees reach the same flower in a step the lower ID gets the nectar.
+
+    Each bee draws from its own stream keyed by (seed, bee ID), so draws do not
+    depend on which worker steps the bee.
+
+    Crowding and field path sharing keep a bee index that bees read and move in during
+    the propose phase, with a blocked bee retrying another move right away, so a world
+    controller with a bee index only runs on one worker.
+
+    Attributes:
+        world_controller (WorldController): Controller whose nectar claims are deferred
+        hive_controllers (list): Controllers whose deliveries are deferred
+        workers (int): Number of threads the propose phase is split across
+        seed: Seed for the per-bee random streams, None to keep the bees' own streams
+        shard_by (callable): Key of each bee's shard, e.g. its hive, None to split the bees into equal slices
+    """
+    def __init__(self, world_controller, hive_controllers, workers=1, seed=None, shard_by=None):
+        if not isinstance(hive_controllers, (list, tuple)):
+            hive_controllers = [hive_controllers]
+        if workers > 1 and world_controller.bee_index is not None:
+            raise ValueError("Crowding and field path sharing need one worker, "
+                             "their bee index cannot be shared between threads")
+        self.world_controller = world_controller
+        self.hive_controllers = list(hive_controllers)
+        self.workers = max(1, workers)
+        self.seed = seed
+        self.shard_by = shard_by
+        self._pool = ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+
+    def prepare(self, bees):
+        """
+        [1.1.6 Random streams] Give each bee its own random stream.
+        """
+        _seed_bees(bees, self.seed)
+
+    def _set_deferred(self, deferred):
+        self.world_controller.deferred = deferred
+        for hive_controller in self.hive_controllers:
+            hive_controller.deferred = deferred
+
+    def run(self, bees, advance):
+        """
+        [2.6 Step Engine] Propose with advance(bee) for every bee, then resolve.
+
+        Returns:
+            list: The result of advance for each bee, in the order of bees
+        """
+        self._set_deferred(True)
+        try:
+            if self._pool is None or len(bees) < 2:
+                results = [advance(bee) for bee in bees]
+            elif self.shard_by is not None:
+                results = self._run_groups(bees, advance)
+            else:
+                size = -(-len(bees) // self.workers)
+                shards = [bees[i:i + size] for i in range(0, len(bees), size)]
+                results = []
+                for shard_results in self._pool.map(lambda shard: [advance(bee) for bee in shard], shards):
+                    results.extend(shard_results)
+        finally:
+            self._set_deferred(False)
+
+        self.world_controller.resolve_claims()
+        for hive_controller in self.hive_controllers:
+            hive_controller.resolve_deliveries()
+        return results
+
+    def _run_groups(self, bees, advance):
+        # One shard per key, e.g. per colony; claims are still resolved in bee ID order
+        groups = {}
+        for index, bee in enumerate(bees):
+            groups.setdefault(self.shard_by(bee), []).append(index)
+        shards = [[bees[index] for index in indices] for indices in groups.values()]
+        results = [None] * len(bees)
+        for indices, shard_results in zip(groups.values(),
+                                          self._pool.map(lambda shard: [advance(bee) for bee in shard], shards)):
+            for index, result in zip(indices, shard_results):
+                results[index] = result
+        return results
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
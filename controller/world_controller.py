@@ -1,10 +1,12 @@
-import logging
+import numpy as np
 
 from base.base_observable import BaseObservable
 from base.observer import Observer
-from model.buzzness import Bee
-from model.world import PropertyType, Property, World
-from utils.constants import VALID_MOVE
+from model.bee_index import BeeIndex
+from model.flower_field import FlowerField
+from model.buzzness import Bee, BeeState
+from model.neighbour_mask import NeighbourMasks
+from model.world import PropertyType
 
 class WorldController(Observer, BaseObservable):
     """
@@ -12,12 +14,35 @@ class WorldController(Observer, BaseObservable):
     
     Attributes:
         world (World): The world instance being controlled
-        world_size (Tuple(int,int)): Size of the world
+        world_size (Tuple(int,int)): Size of the world, the World's own size by default
+        nectar_collected (int): Number of times a bee took nectar from a flower
+        deferred (bool): Whether nectar claims are queued for resolve_claims instead of applied
+        neighbour_masks (NeighbourMasks): Passable moves of each cell, kept in step with world edits
+        cell_capacity (int): Most bees allowed on one cell, None for no crowding limit
+        share_radius (int): Distance in cells within which bees in the field share paths, None to disable
+        bee_index (BeeIndex): Positions of the bees outside the hive, None without crowding or sharing
+        flower_field (FlowerField): Nearest nectar flowers within sensing_radius, None to disable sensing
     """
-    def __init__(self, world, world_size=(50, 50)):
+    def __init__(self, world, world_size=None, cell_capacity=None, bee_cell_size=8, share_radius=None,
+                 sensing_radius=None):
         super().__init__()
         self.world = world
-        self.width, self.height = world_size
+        self.width, self.height = world_size if world_size is not None else world.world_size
+        self.nectar_collected = 0
+        self.deferred = False
+        self._claims = {}
+        self.neighbour_masks = NeighbourMasks(world.grid)
+        world.attach(self.neighbour_masks)
+        self.cell_capacity = cell_capacity
+        self.share_radius = share_radius
+        # Pairs of bee IDs (sharer, receiver) that were within share_radius at the last share_paths
+        self._met = set()
+        self.flower_field = None
+        if sensing_radius is not None:
+            self.flower_field = FlowerField(world, sensing_radius)
+            world.attach(self.flower_field)
+        tracked = cell_capacity is not None or share_radius is not None
+        self.bee_index = BeeIndex(bee_cell_size) if tracked else None
 
     def _check_property_collision(self, bee_pos, property):
         """
@@ -36,12 +61,29 @@ class WorldController(Observer, BaseObservable):
         [2.1.2 Nectar collection] Handle bee interaction with a flower.
         """
         if flower.has_nectar:
+            if self.deferred:
+                # Several bees may reach the flower in the same step, resolve_claims picks one
+                self._claims.setdefault(bee, flower)
+                return
             print(f"Bee {bee.ID} match property {flower.type}, {flower.pos}, now coming back hive")
-            flower.has_nectar = False
-            bee.set_nectar_found()
+            self.world.deplete_flower(flower)
+            self.nectar_collected += 1
+            bee.set_nectar_found(flower)
         else:
             print(f"Bee {bee.ID} found empty flower at {flower.pos}")
 
+    def resolve_claims(self):
+        """
+        [2.1.2 Nectar collection] Apply the nectar claims queued in deferred mode.
+        Claims are settled in bee ID order, so the lowest ID reaching a flower gets its nectar
+        whatever order the bees were stepped in.
+        """
+        claims, self._claims = self._claims, {}
+        deferred, self.deferred = self.deferred, False
+        for bee in sorted(claims, key=lambda bee: bee.ID):
+            self._handle_flower_interaction(bee, claims[bee])
+        self.deferred = deferred
+
     def _handle_obstacle_interaction(self, bee, obstacle):
         """
         [2.1.1 Collision detection] Handle bee interaction with an obstacle.
@@ -54,13 +96,82 @@ class WorldController(Observer, BaseObservable):
         else:
             bee.step_back()
 
+    def _is_crowded(self, bee):
+        """
+        [2.1.3 Crowding] Check if the cell the bee moved to already holds cell_capacity other bees.
+        """
+        if self.cell_capacity is None:
+            return False
+        others = self.bee_index.count(bee.pos)
+        if self.bee_index.positions.get(bee) == bee.pos:
+            others -= 1
+        return others >= self.cell_capacity
+
+    def track(self, bee):
+        """
+        [2.1.3 Crowding] Record where a bee ended its step, called once per bee and step.
+        """
+        if self.bee_index is None:
+            return
+        if bee.inhive:
+            self.bee_index.remove(bee)
+        else:
+            self.bee_index.move(bee, bee.get_pos())
+
+    def share_paths(self):
+        """
+        [2.1.4 Field path sharing] Let bees that meet outside the hive pass on their path to a flower.
+        A bee shares a path it learned in full (not one it is part way along) with every bee
+        within share_radius from the same hive, found through the bee index. Sharers and
+        receivers are taken in bee ID order. A pair of bees meets once: bees that stay within
+        range of each other are not offered the path again on every step, only after they
+        part or the sharer stops sharing.
+
+        Returns:
+            int: Number of bees that saved a shared path
+        """
+        if self.share_radius is None:
+            return 0
+        sharers = [bee for bee in self.bee_index.positions
+                   if bee.path_to_flower and bee.state != BeeState.FOLLOWING]
+        met = set()
+        saved = 0
+        for sharer in sorted(sharers, key=lambda bee: bee.ID):
+            for bee in self.bee_index.query_radius(self.bee_index.positions[sharer], self.share_radius):
+                # Bees already on their way to a flower keep their route, and a path
+                # only leads to the flower from the hive it starts at
+                if bee is sharer or bee.state == BeeState.FOLLOWING or bee.hive_pos != sharer.hive_pos:
+                    continue
+                pair = (sharer.ID, bee.ID)
+                met.add(pair)
+                if pair in self._met:
+                    continue
+                if bee.receive_path(sharer.path_to_flower, sharer.known_flower):
+                    saved += 1
+        self._met = met
+        return saved
+
     def __update_bee_moved(self, bee):
+        """
+        Returns:
+            bool: True if the bee has to wait because its cell is full
+        """
+        # Bees cannot enter a cell that is already full, whatever it holds
+        if self.bee_index is not None and self._is_crowded(bee):
+            print(f"Bee {bee.ID} found cell {bee.pos} crowded, waiting")
+            bee.wait()
+            return True
+
         # Skip collision check if bee already has nectar
         if bee.hasNectar:
-            return
+            return False
+
+        # Most cells hold no property; the occupancy grid answers that without a scan
+        if self.world.is_empty(bee.pos):
+            return False
 
         # Find the first property that the bee collides with
-        for property in self.world.properties:
+        for property in self.world.properties_at(bee.pos):
             if self._check_property_collision(bee.pos, property):
                 print(f"Bee {bee.ID} match property {property.type}, {property.pos}")
                 
@@ -70,6 +181,27 @@ class WorldController(Observer, BaseObservable):
                 else:
                     self._handle_obstacle_interaction(bee, property)
                 break
+        return False
+
+    def on_moves(self, bees):
+        """
+        [2.1.1 Collision detection] Check a batch of bees that moved this step, in batch order.
+        Without a bee index, bees carrying nectar and bees on empty cells are filtered out
+        with one grid lookup for the whole batch, so only bees on a property are handled one
+        by one. With crowding, each checked bee is indexed at its new cell right away so the
+        bees after it in the batch see it there.
+        """
+        movers = [bee for bee in bees if not bee.inhive]
+        if self.bee_index is None:
+            movers = [bee for bee in movers if not bee.hasNectar]
+            if not movers:
+                return
+            xs, ys = np.array([bee.pos for bee in movers]).T
+            occupied = self.world.grid.lookup(xs, ys) != self.world.grid.EMPTY
+            movers = [bee for bee, hit in zip(movers, occupied) if hit]
+        for bee in movers:
+            if not self.__update_bee_moved(bee) and self.bee_index is not None:
+                self.track(bee)
 
     def update(self, observable: BaseObservable) -> None:
         """
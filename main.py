@@ -4,6 +4,8 @@ import sys
 from json import JSONDecodeError
 
 import utils.constants
+from controller.colony_controller import ColonyController
+from controller.simulation_controller import SimulationController
 from view.MainView import MainView
 
 # Read args
@@ -18,6 +20,11 @@ args = parser.parse_args()
 # Setup view
 mainView = MainView()
 
+# Batch options of the single-process simulation that multi-process runs do not support
+SINGLE_PROCESS_OPTIONS = ('stop_condition', 'steady_window', 'cell_capacity', 'share_radius', 'sensing_radius',
+                          'scent', 'scent_interval', 'heatmap', 'heatmap_file', 'exploration_memory',
+                          'batch_dispatch', 'lifecycle', 'hives')
+
 def _value_in_range(value, minimum, maximum):
     if value < minimum or value > maximum:
         return False
@@ -38,8 +45,8 @@ param_file = args.param_file if args.param_file else utils.constants.PARAMETER_F
 map_file = args.map_file if args.map_file else utils.constants.PROPERTY_FILE
 
 if args.interactive:
-    ts = get_positive_int('Timesteps: ', 1, 10000)
-    nb = get_positive_int('Bees: ',1,100)
+    ts = get_positive_int('Timesteps: ', 1, utils.constants.MAX_TIME_STEPS)
+    nb = get_positive_int('Bees: ',1,utils.constants.MAX_BEES)
     mainView.simulate(ts, nb, map_file)
 else:
     try:
@@ -54,13 +61,104 @@ else:
     try:
         ts = int(params.get('time_steps'))
         nb = int(params.get('num_bees'))
-    except (KeyError, ValueError, TypeError):
+        steady_window = int(params.get('steady_window', 100))
+        processes = int(params.get('processes', 1))
+        seed = params.get('seed')
+        seed = None if seed is None else int(seed)
+        cell_capacity = params.get('cell_capacity')
+        cell_capacity = None if cell_capacity is None else int(cell_capacity)
+        share_radius = params.get('share_radius')
+        share_radius = None if share_radius is None else int(share_radius)
+        sensing_radius = params.get('sensing_radius')
+        sensing_radius = None if sensing_radius is None else int(sensing_radius)
+        scent = bool(params.get('scent', False))
+        scent_interval = int(params.get('scent_interval', 1))
+        heatmap = bool(params.get('heatmap', False))
+        heatmap_file = params.get('heatmap_file')
+        exploration_memory = bool(params.get('exploration_memory', False))
+        batch_dispatch = bool(params.get('batch_dispatch', False))
+        lifecycle = params.get('lifecycle')
+        if lifecycle is not None:
+            lifecycle = {key: (None if value is None else float(value) if key == 'mortality' else int(value))
+                         for key, value in dict(lifecycle).items()}
+        hives = params.get('hives')
+        if hives is not None:
+            hives = [tuple(int(value) for value in hive) for hive in hives]
+        # Limits and geometry override the defaults and the map file, e.g. for runs at scale
+        limits = params.get('limits', {})
+        max_time_steps = int(limits.get('time_steps', utils.constants.MAX_TIME_STEPS))
+        max_bees = int(limits.get('num_bees', utils.constants.MAX_BEES))
+        world_size, hive_pos, hive_size = mainView.read_geometry(map_file)
+        world_size = tuple(int(value) for value in params.get('world_size', world_size))
+        hive_size = tuple(int(value) for value in params.get('hive_size', hive_size))
+        tile_size = params.get('tile_size')
+        tile_size = None if tile_size is None else int(tile_size)
+    except (KeyError, ValueError, TypeError, AttributeError):
         print(f'Error: Invalid parameters in {param_file}')
         sys.exit(1)
-    if not _value_in_range(ts, 1, 10000):
-        print(f"Invalid input. Please enter number of time steps between 1 and 10000.")
+    except FileNotFoundError:
+        print(f'Error: Map file {map_file} not found.')
         sys.exit(1)
-    if not _value_in_range(nb, 1, 100):
-        print(f"Invalid input. Please enter number of bees between 1 and 100.")
+    stop_condition = params.get('stop_condition')
+    if stop_condition is not None and stop_condition not in SimulationController.STOP_CONDITIONS:
+        print(f"Invalid stop condition. Please use one of {', '.join(SimulationController.STOP_CONDITIONS)}.")
         sys.exit(1)
-    mainView.simulate(ts, nb, map_file)
+    if max_time_steps < 1 or max_bees < 1:
+        print(f"Invalid input. Please enter positive limits.")
+        sys.exit(1)
+    if not _value_in_range(ts, 1, max_time_steps):
+        print(f"Invalid input. Please enter number of time steps between 1 and {max_time_steps}.")
+        sys.exit(1)
+    if not _value_in_range(nb, 1, max_bees):
+        print(f"Invalid input. Please enter number of bees between 1 and {max_bees}.")
+        sys.exit(1)
+    if len(world_size) != 2 or min(world_size) < 1 or len(hive_size) != 2 or min(hive_size) < 1:
+        print(f"Invalid input. Please enter positive world and hive sizes as [width, height].")
+        sys.exit(1)
+    if tile_size is not None and tile_size < 1:
+        print(f"Invalid input. Please enter a positive tile size.")
+        sys.exit(1)
+    if cell_capacity is not None and cell_capacity < 1:
+        print(f"Invalid input. Please enter a positive cell capacity.")
+        sys.exit(1)
+    if share_radius is not None and share_radius < 0:
+        print(f"Invalid input. Please enter a share radius of 0 or more.")
+        sys.exit(1)
+    if sensing_radius is not None and sensing_radius < 0:
+        print(f"Invalid input. Please enter a sensing radius of 0 or more.")
+        sys.exit(1)
+    if scent_interval < 1:
+        print(f"Invalid input. Please enter a positive scent interval.")
+        sys.exit(1)
+    if lifecycle is not None and not set(lifecycle) <= set(ColonyController.OPTIONS):
+        print(f"Invalid input. Please use lifecycle keys among {', '.join(ColonyController.OPTIONS)}.")
+        sys.exit(1)
+    if lifecycle is not None and not 0 <= lifecycle.get('mortality', 0) <= 1:
+        print(f"Invalid input. Please enter a mortality between 0 and 1.")
+        sys.exit(1)
+    placed = hives if hives is not None else [hive_pos]
+    if not (placed and all(len(hive) == 4 and _value_in_range(hive[0], 0, world_size[0] - 1)
+                           and _value_in_range(hive[1], 0, world_size[1] - 1)
+                           and hive[2] > 0 and hive[3] > 0 for hive in placed)):
+        print(f"Invalid input. Please enter each hive as [x, y, width, height] inside the "
+              f"{world_size[0]}x{world_size[1]} world.")
+        sys.exit(1)
+    if processes < 1:
+        print(f"Invalid input. Please enter a positive number of processes.")
+        sys.exit(1)
+    unsupported = [option for option in SINGLE_PROCESS_OPTIONS if option in params]
+    if processes > 1 and unsupported:
+        print(f"Invalid input. Multi-process runs do not support {', '.join(unsupported)}; "
+              f"remove them or set processes to 1.")
+        sys.exit(1)
+    if processes > 1:
+        # Multi-process runs are headless and split the world into one strip per process
+        mainView.simulate_domains(ts, nb, map_file, processes=processes, world_size=world_size,
+                                  tile_size=tile_size, seed=seed, hive_size=hive_size)
+    else:
+        mainView.simulate(ts, nb, map_file, world_size=world_size, tile_size=tile_size, hive_size=hive_size,
+                          stop_condition=stop_condition, steady_window=steady_window,
+                          seed=seed, cell_capacity=cell_capacity, share_radius=share_radius,
+                          sensing_radius=sensing_radius, scent=scent, scent_interval=scent_interval,
+                          heatmap=heatmap, heatmap_file=heatmap_file, exploration_memory=exploration_memory,
+                          lifecycle=lifecycle, batch_dispatch=batch_dispatch, hives=hives)
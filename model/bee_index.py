@@ -0,0 +1,94 @@
+class BeeIndex:
+    """
+    [1.7 Bee Index] Cell-linked spatial hash of bee positions outside the hive.
+    Each bucket links the bees inside one square of cells, so moving a bee, counting the
+    bees on a cell and finding the bees near a point only touch a few buckets and a step
+    costs time linear in the number of bees.
+
+    Attributes:
+        cell_size (int): Width and height of a bucket in world cells
+        buckets (dict): Maps (bucket_x, bucket_y) to an insertion-ordered set of bees
+        positions (dict): Maps each indexed bee to its (x, y) cell
+        occupancy (dict): Maps each occupied (x, y) cell to its number of bees
+    """
+    def __init__(self, cell_size=8):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.positions = {}
+        self.occupancy = {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, bee):
+        return bee in self.positions
+
+    def _bucket(self, pos):
+        return (pos[0] // self.cell_size, pos[1] // self.cell_size)
+
+    def move(self, bee, pos):
+        """
+        [1.7 Bee Index] Index bee at the cell pos, moving it if it was already indexed.
+        """
+        old = self.positions.get(bee)
+        if old == pos:
+            return
+        if old is not None:
+            self.remove(bee)
+        self.positions[bee] = pos
+        self.occupancy[pos] = self.occupancy.get(pos, 0) + 1
+        self.buckets.setdefault(self._bucket(pos), {})[bee] = None
+
+    def remove(self, bee):
+        """
+        [1.7 Bee Index] Drop bee from the index, ignoring bees that are not indexed.
+        """
+        pos = self.positions.pop(bee, None)
+        if pos is None:
+            return
+        if self.occupancy[pos] == 1:
+            del self.occupancy[pos]
+        else:
+            self.occupancy[pos] -= 1
+        key = self._bucket(pos)
+        bucket = self.buckets[key]
+        del bucket[bee]
+        if not bucket:
+            del self.buckets[key]
+
+    def count(self, pos):
+        """
+        [1.7 Bee Index] Number of indexed bees on the cell pos.
+        """
+        return self.occupancy.get(pos, 0)
+
+    def query_radius(self, pos, radius):
+        """
+        [1.7 Bee Index] Bees within radius cells of pos along both axes, in ID order.
+        """
+        x, y = pos
+        bx0, by0 = self._bucket((x - radius, y - radius))
+        bx1, by1 = self._bucket((x + radius, y + radius))
+        found = []
+        for by in range(by0, by1 + 1):
+            for bx in range(bx0, bx1 + 1):
+                bucket = self.buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for bee in bucket:
+                    bee_x, bee_y = self.positions[bee]
+                    if abs(bee_x - x) <= radius and abs(bee_y - y) <= radius:
+                        found.append(bee)
+        found.sort(key=lambda bee: bee.ID)
+        return found
+
+    def rebuild(self, bees):
+        """
+        [1.7 Bee Index] Re-index every bee outside the hive from scratch.
+        """
+        self.buckets = {}
+        self.positions = {}
+        self.occupancy = {}
+        for bee in bees:
+            if not bee.inhive:
+                self.move(bee, bee.get_pos())
@@ -0,0 +1,85 @@
+class BeeRoster:
+    """
+    [1.5 Bee Roster] Index sets of the bees by BeeState and by whether they are in the hive,
+    with a lookup by ID. Bees report their own state and hive transitions, so the sets are
+    always current and a consumer only iterates the bees it needs instead of filtering
+    the whole colony.
+
+    Attributes:
+        by_id (dict): Maps each bee ID to its bee
+        by_state (dict): Maps each BeeState to an insertion-ordered set of bees
+        by_inhive (dict): Maps True (in the hive) and False (in the world) to an insertion-ordered set of bees
+    """
+    def __init__(self, bees=()):
+        self.by_id = {}
+        self.by_state = {}
+        self.by_inhive = {True: {}, False: {}}
+        for bee in bees:
+            self.add(bee)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, bee):
+        return self.by_id.get(bee.ID) is bee
+
+    def add(self, bee):
+        """
+        [1.5 Bee Roster] Index bee and have it report its transitions.
+        """
+        self.by_id[bee.ID] = bee
+        self.by_state.setdefault(bee.state, {})[bee] = None
+        self.by_inhive[bool(bee.inhive)][bee] = None
+        bee.roster = self
+
+    def remove(self, bee):
+        """
+        [1.5 Bee Roster] Drop bee from every set, ignoring bees that are not indexed.
+        """
+        if self.by_id.get(bee.ID) is not bee:
+            return
+        del self.by_id[bee.ID]
+        self.by_state[bee.state].pop(bee, None)
+        self.by_inhive[bool(bee.inhive)].pop(bee, None)
+        bee.roster = None
+
+    def state_changed(self, bee, old):
+        """
+        [1.5 Bee Roster] Move bee from the set of state old to the set of its current state.
+        """
+        self.by_state[old].pop(bee, None)
+        self.by_state.setdefault(bee.state, {})[bee] = None
+
+    def inhive_changed(self, bee):
+        """
+        [1.5 Bee Roster] Move bee between the hive and world sets.
+        """
+        self.by_inhive[not bee.inhive].pop(bee, None)
+        self.by_inhive[bool(bee.inhive)][bee] = None
+
+    def get(self, ID):
+        """
+        [1.5 Bee Roster] Bee with the given ID, None if there is none.
+        """
+        return self.by_id.get(ID)
+
+    def in_state(self, state):
+        """
+        [1.5 Bee Roster] Bees currently in state.
+        """
+        return list(self.by_state.get(state, ()))
+
+    def count(self, state):
+        return len(self.by_state.get(state, ()))
+
+    def in_hive(self):
+        """
+        [1.5 Bee Roster] Bees currently inside the hive.
+        """
+        return list(self.by_inhive[True])
+
+    def outside(self):
+        """
+        [1.5 Bee Roster] Bees currently out in the world.
+        """
+        return list(self.by_inhive[False])
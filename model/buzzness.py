@@ -1,281 +1,636 @@
-import random
-from enum import Enum
-from utils.constants import VALID_MOVE, MOVE_FORWARD
-from base.base_observable import BaseObservable
-from base.observer import Observer
-from utils.utils import Move, find_path_to_flower, find_path_to_hive
-
-
-class BeeState(Enum):
-    """
-    [1.1.1 State Management] Enumeration of possible states for a bee in the simulation.
-    
-    States:
-        WANDERING: Bee is exploring the world randomly
-        FOLLOWING: Bee is following a known path to a flower
-        RETURNING: Bee is returning to the hive
-    """
-    WANDERING = 1
-    FOLLOWING = 2
-    RETURNING = 3
-
-
-class Bee(BaseObservable, Observer):
-
-    # [1.1.3 Energy Management] Constants for energy management
-    MIN_ENERGY_TO_LEAVE = 50
-    ENERGY_CHARGE_AMOUNT = 25
-    ENERGY_CONSUMPTION = 1
-    COMMUNICATION_THRESHOLD = 0.8
-
-    """
-    [1.1 Bee] Represents a worker bee in the simulation with its behavior and state management.
-    
-    Attributes:
-        ID (int): Unique ID for the bee
-        pos (tuple): Current (x,y) position
-        inhive (bool): Whether the bee is inside the hive
-        hasNectar (bool): Whether the bee is carrying nectar
-        hive_pos (tuple): Position of the hive
-        hive_size (tuple): Size of the hive
-        world_size (tuple): Size of the world
-        path_to_flower (list): Path to the nearest flower
-        path_to_hive (list): Path back to the hive
-        state (BeeState): Current state of the bee
-        energy (int): Current energy level
-    """
-    def __init__(self, ID, pos, hive_pos, hive_size, world_size):
-        """
-        Initialize a new bee with default values and position.
-        
-        Args:
-            ID (int): Unique identifier for the bee
-            pos (tuple): Initial (x,y) position
-            hive_pos (tuple): Position of the hive
-            hive_size (tuple): Size of the hive
-            world_size (tuple): Size of the world
-        """
-        super().__init__()
-        self.ID = ID
-        self.pos = pos
-        self.age = 0
-        self.inhive = True
-        self.hasNectar = False
-        self.hive_pos = hive_pos
-        self.hive_size = hive_size
-        self.world_size = world_size
-        self.path_to_flower = []
-        self.path_to_hive = []
-        self.state = BeeState.WANDERING
-        self.energy = 0
-        self._move_invalid = False
-
-    def _adjust_boundaries(self, x, y):
-        """
-        [1.1.2 Movement] Adjust coordinates to stay within world boundaries.
-        """
-        x = max(1, min(x, self.world_size[0] - 2))
-        y = max(1, min(y, self.world_size[1] - 2))
-        return (x, y)
-
-    def _try_alternative_move(self, old_pos):
-        """
-        [1.1.2 Movement] Attempt to find an alternative move when the current move is invalid.
-            
-        Returns:
-            bool: True if a valid alternative move was found, False otherwise
-        """
-        if self.energy <= 0:
-            return False
-
-        move = random.choice(VALID_MOVE)
-        new_x, new_y = self._adjust_boundaries(
-            old_pos[0] + move[0],
-            old_pos[1] + move[1]
-        )
-            
-        self.pos = (new_x, new_y)
-        self.energy -= self.ENERGY_CONSUMPTION
-        self.notify()
-        
-        if self._move_invalid:
-            self.pos = old_pos
-            self._move_invalid = False
-            return self._try_alternative_move(old_pos)
-            
-        return True
-
-    def _execute_move(self, move: Move) -> bool:
-        """
-        [1.1.2 Movement] Execute a move for the bee.
-            
-        Returns:
-            bool: True if the move was successful, False otherwise
-        """
-        new_x, new_y = self._adjust_boundaries(
-            self.pos[0] + move[0],
-            self.pos[1] + move[1]
-        )
-        
-        old_pos = self.pos
-        self.pos = (new_x, new_y)
-        
-        # Handle hive exit
-        if self.inhive and (new_x >= self.hive_size[0] or new_y >= self.hive_size[1]):
-            self.inhive = False
-        
-        self.notify()
-        
-        if self._move_invalid:
-            if self.state == BeeState.WANDERING:
-                self.pos = old_pos
-                self._move_invalid = False
-                return self._try_alternative_move(old_pos)
-            else:
-                self._move_invalid = False
-                self.energy -= self.ENERGY_CONSUMPTION
-                return True
-        
-        self.energy -= self.ENERGY_CONSUMPTION
-        return True
-
-    def _handle_hive_charging(self) -> bool:
-        """
-        [1.1.3 Energy Management] Handle energy charging when bee is in hive.
-        
-        Returns:
-            bool: True if bee should continue moving, False if charging
-        """
-        if self.inhive and self.energy < self.MIN_ENERGY_TO_LEAVE:
-            print(f"Bee {self.ID} is charging")
-            self.energy += self.ENERGY_CHARGE_AMOUNT
-            return False
-        return True
-
-    def _handle_hive_exit(self) -> bool:
-        """
-        [1.1.1 State Management] Handle bee exiting the hive.
-        
-        Returns:
-            bool: True if bee exited hive, False otherwise
-        """
-        if (self.inhive and 
-            (self.state == BeeState.WANDERING or self.state == BeeState.FOLLOWING) and 
-            self.energy >= self.MIN_ENERGY_TO_LEAVE):
-            
-            print(f"Bee {self.ID} goes out the world")
-            self.pos = (self.hive_pos[0], self.hive_pos[1])
-            self.inhive = False
-            
-            if self.state == BeeState.WANDERING and self.path_to_flower:
-                print(f"Bee {self.ID} stopped wandering because it has path to a flower with {len(self.path_to_flower)} steps")
-                self.state = BeeState.FOLLOWING
-            return True
-        return False
-
-    def _get_next_move(self) -> Move:
-        """
-        [1.1.1 State Management] Determine the next move based on current state.
-        
-        Returns:
-            Move: The next move to execute
-        """
-        if self.state == BeeState.WANDERING:
-            if not self.inhive and not self.hasNectar and self.energy <= 0:
-                print(f"Bee {self.ID} out of energy, back to home")
-                self.state = BeeState.RETURNING
-                self.path_to_hive = find_path_to_hive((self.hive_pos[0], self.hive_pos[1]), self.pos)
-                return None
-            return random.choice(MOVE_FORWARD if self.ID == 1 else VALID_MOVE)
-            
-        elif self.state == BeeState.FOLLOWING:
-            if not self.inhive and not self.hasNectar and not self.path_to_flower:
-                print("Can't find a flower with pre-define path")
-                self.state = BeeState.WANDERING
-                return None
-            print(f"Bee {self.ID} following the path, pop 1 step")
-            return self.path_to_flower.pop(0)
-            
-        elif self.state == BeeState.RETURNING:
-            if not self.path_to_hive:
-                return None
-            move = self.path_to_hive.pop(0)
-            if not self.path_to_hive:
-                print(f"Bee {self.ID} comes to hive")
-                self.inhive = True
-                self.pos = (0, 0)
-                self.path_to_hive = []
-                self.energy = 0
-                self.state = BeeState.WANDERING
-                self.notify()
-            return move
-            
-        return None
-
-    def step_change(self):
-        """
-        [1.1 Bee] Update the bee's state and position for each timestep.
-        
-        Returns:
-            bool: True if the bee moved, False otherwise
-        """
-        if not self._handle_hive_charging():
-            return False
-            
-        if self._handle_hive_exit():
-            return True
-
-        move = self._get_next_move()
-        if move is not None:
-            return self._execute_move(move)
-        return False
-
-    def get_pos(self):
-        return self.pos
-
-    def get_inhive(self):
-        return self.inhive
-
-    def set_inhive(self, value):
-        self.inhive = value
-
-    def get_nectar(self):
-        return self.hasNectar
-
-    def set_nectar(self, value):
-        self.hasNectar = value
-
-    def set_nectar_found(self):
-        """
-        [1.1.4 Path finding] Update bee state when nectar is found.
-        Sets paths to flower and hive, and changes state to RETURNING.
-        """
-        self.path_to_flower = find_path_to_flower((self.hive_pos[0], self.hive_pos[1]), self.pos)
-        self.path_to_hive = find_path_to_hive((self.hive_pos[0], self.hive_pos[1]), self.pos)
-        self.state = BeeState.RETURNING
-        self.hasNectar = True
-        self.inhive = False
-
-    def step_back(self):
-        """
-        [1.1.2 Movement] Mark the last move as invalid when bee hits an obstacle.
-        """
-        self._move_invalid = True
-
-    def update(self, observable: BaseObservable) -> None:
-        """
-        update () when hive notifies about the shared information
-        """
-        from controller.hive_controller import HiveController
-        from controller.world_controller import WorldController
-        
-        if isinstance(observable, HiveController):
-            chance = random.uniform(0, 1)
-            print(f"Bee {self.ID} receive path info with chance {chance} ")
-            if chance > self.COMMUNICATION_THRESHOLD:
-                if not self.path_to_flower or len(self.path_to_flower) >= len(observable.path_to_flower):
-                    self.path_to_flower = observable.path_to_flower.copy()
-                    print(f"Bee {self.ID} saved flower information with {len(self.path_to_flower)} steps")
-            else:
-                print(f"Bee {self.ID} did not receive flower information")
-
+import random
+from enum import Enum
+from utils.constants import VALID_MOVE, MOVE_FORWARD
+from base.base_observable import BaseObservable
+from base.observer import Observer
+from model.state_machine import ANY, StateMachine
+from utils.utils import Move, find_path_to_flower, find_path_to_hive
+
+
+class BeeState(Enum):
+    """
+    [1.1.1 State Management] Enumeration of possible states for a bee in the simulation.
+    
+    States:
+        WANDERING: Bee is exploring the world randomly
+        FOLLOWING: Bee is following a known path to a flower
+        RETURNING: Bee is returning to the hive
+    """
+    WANDERING = 1
+    FOLLOWING = 2
+    RETURNING = 3
+
+
+class Bee(BaseObservable, Observer):
+
+    # [1.1.3 Energy Management] Constants for energy management
+    MIN_ENERGY_TO_LEAVE = 50
+    ENERGY_CHARGE_AMOUNT = 25
+    ENERGY_CONSUMPTION = 1
+    COMMUNICATION_THRESHOLD = 0.8
+
+    """
+    [1.1 Bee] Represents a worker bee in the simulation with its behavior and state management.
+    
+    Attributes:
+        ID (int): Unique ID for the bee
+        pos (tuple): Current (x,y) position
+        inhive (bool): Whether the bee is inside the hive
+        hasNectar (bool): Whether the bee is carrying nectar
+        hive_pos (tuple): Position of the hive
+        hive_size (tuple): Size of the hive
+        world_size (tuple): Size of the world
+        path_to_flower (list): Path to the nearest flower
+        known_flower (Property): Flower path_to_flower leads to, None if not known
+        path_to_hive (list): Path back to the hive
+        state (BeeState): Current state of the bee
+        energy (int): Current energy level
+        rng: Source of random draws, the random module unless a seeded stream is assigned
+        neighbour_masks (NeighbourMasks): Passable moves of each world cell, None if unknown
+        flower_field (FlowerField): Nearest nectar flowers within sensing range, None if bees cannot sense
+        scent_field (ScentField): Scent that biases wandering moves, None to wander uniformly
+        crowding (bool): True when the world turns bees away from full cells, so leaving the hive is checked
+        memory (ExplorationMemory): Recently visited cells, None for a memoryless walk
+        events (EventBatch): Queue for batched notifications, None to notify observers at once
+        roster (BeeRoster): Index sets told about state and hive transitions, None if not indexed
+        machine (StateMachine): Transition table the bee steps with, built from TRANSITIONS
+        age (int): Timesteps since the bee emerged, updated by the ColonyController
+        born (int): Timestep the bee emerged at
+    """
+    def __init__(self, ID, pos, hive_pos, hive_size, world_size):
+        """
+        Initialize a new bee with default values and position.
+        
+        Args:
+            ID (int): Unique identifier for the bee
+            pos (tuple): Initial (x,y) position
+            hive_pos (tuple): Position of the hive
+            hive_size (tuple): Size of the hive
+            world_size (tuple): Size of the world
+        """
+        super().__init__()
+        self.roster = None
+        self.ID = ID
+        self.pos = pos
+        self.age = 0
+        self.born = 0
+        self.inhive = True
+        self.hasNectar = False
+        self.hive_pos = hive_pos
+        self.hive_size = hive_size
+        self.world_size = world_size
+        self.path_to_flower = []
+        self.known_flower = None
+        self.path_to_hive = []
+        self.state = BeeState.WANDERING
+        self.energy = 0
+        self._move_invalid = False
+        self._move_blocked = False
+        self.rng = random
+        self.neighbour_masks = None
+        self.flower_field = None
+        self.scent_field = None
+        self.crowding = False
+        self.memory = None
+        self.events = None
+        self._pending_move = None
+        # Fast-forward state: moves applied in bulk and the step they started at
+        self._ff_moves = None
+        self._ff_origin = None
+        self._ff_start = 0
+        self._ff_clock = None
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        old = getattr(self, "_state", None)
+        self._state = value
+        if self.roster is not None and value is not old:
+            self.roster.state_changed(self, old)
+
+    @property
+    def inhive(self):
+        return self._inhive
+
+    @inhive.setter
+    def inhive(self, value):
+        old = getattr(self, "_inhive", None)
+        self._inhive = value
+        if self.roster is not None and value != old:
+            self.roster.inhive_changed(self)
+
+    def reset(self, ID, born=0):
+        """
+        [1.1.8 Lifecycle] Reuse a retired bee object as a newly emerged bee in the hive.
+        Its exploration memory is cleared in place instead of reallocated, and its
+        observers are dropped so the caller can attach the current controllers.
+
+        Args:
+            ID (int): Unique identifier for the new bee
+            born (int): Timestep the bee emerges at
+        """
+        self.ID = ID
+        self.pos = (0, 0)
+        self.age = 0
+        self.born = born
+        self.inhive = True
+        self.hasNectar = False
+        # Paths may be shared with the hive's flower sites, so they are replaced, not cleared
+        self.path_to_flower = []
+        self.known_flower = None
+        self.path_to_hive = []
+        self.state = BeeState.WANDERING
+        self.energy = 0
+        self._move_invalid = False
+        self._move_blocked = False
+        self._pending_move = None
+        self.detach_all()
+        if self.memory is not None:
+            self.memory.clear()
+        self._ff_moves = None
+        self._ff_origin = None
+        self._ff_start = 0
+        self._ff_clock = None
+
+    def _adjust_boundaries(self, x, y):
+        """
+        [1.1.2 Movement] Adjust coordinates to stay within world boundaries.
+        """
+        x = max(1, min(x, self.world_size[0] - 2))
+        y = max(1, min(y, self.world_size[1] - 2))
+        return (x, y)
+
+    def _try_alternative_move(self, old_pos):
+        """
+        [1.1.2 Movement] Attempt to find an alternative move when the current move is invalid.
+        With neighbour masks the move is drawn from the passable ones, so one attempt is
+        enough; otherwise each move is tried at most once. A bee with no way out stays put.
+            
+        Returns:
+            bool: True if a valid alternative move was found, False otherwise
+        """
+        if self.energy <= 0:
+            return False
+
+        if self.neighbour_masks is not None:
+            candidates = self.neighbour_masks.moves(old_pos[0], old_pos[1])
+            attempts = 1
+            boxed_in = not candidates
+        else:
+            boxed_in = False
+            candidates = list(VALID_MOVE)
+            attempts = len(candidates)
+
+        for _ in range(attempts):
+            if not candidates or self.energy <= 0:
+                break
+            move = self.rng.choice(candidates)
+            candidates.remove(move)
+            self.pos = self._adjust_boundaries(old_pos[0] + move[0], old_pos[1] + move[1])
+            self.energy -= self.ENERGY_CONSUMPTION
+            self.notify()
+
+            if not (self._move_invalid or self._move_blocked):
+                return True
+            self.pos = old_pos
+            self._move_invalid = False
+            self._move_blocked = False
+
+        if boxed_in:
+            # No passable neighbour: spend the move standing still instead of trying blocked cells
+            self.energy -= self.ENERGY_CONSUMPTION
+        return False
+
+    def _execute_move(self, move: Move) -> bool:
+        """
+        [1.1.2 Movement] Execute a move for the bee.
+            
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        pending = self._begin_move(move)
+        self.notify()
+        return self._finish_move(*pending)
+
+    def _begin_move(self, move: Move):
+        """
+        [1.1.2 Movement] Put the bee on the cell a move leads to, before the world checks it.
+
+        Returns:
+            tuple: (move, old_pos, old_inhive) to pass to _finish_move
+        """
+        new_x, new_y = self._adjust_boundaries(
+            self.pos[0] + move[0],
+            self.pos[1] + move[1]
+        )
+        
+        old_pos = self.pos
+        old_inhive = self.inhive
+        self.pos = (new_x, new_y)
+        
+        # Handle hive exit
+        if self.inhive and (new_x >= self.hive_size[0] or new_y >= self.hive_size[1]):
+            self.inhive = False
+        return move, old_pos, old_inhive
+
+    def _finish_move(self, move: Move, old_pos, old_inhive) -> bool:
+        """
+        [1.1.2 Movement] Apply the world's verdict on a move once it has been checked.
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        if self._move_blocked:
+            # [1.7 Bee Index] The cell is full of other bees
+            self._move_blocked = False
+            self.pos = old_pos
+            self.inhive = old_inhive
+            if self.state == BeeState.WANDERING:
+                return self._try_alternative_move(old_pos)
+            # Hover in place and take the same path move next step
+            if self.state == BeeState.FOLLOWING:
+                self.path_to_flower.insert(0, move)
+            elif self.state == BeeState.RETURNING:
+                self.path_to_hive.insert(0, move)
+            self.energy -= self.ENERGY_CONSUMPTION
+            return False
+        
+        if self._move_invalid:
+            if self.state == BeeState.WANDERING:
+                self.pos = old_pos
+                self._move_invalid = False
+                return self._try_alternative_move(old_pos)
+            else:
+                self._move_invalid = False
+                self.energy -= self.ENERGY_CONSUMPTION
+                return True
+        
+        self.energy -= self.ENERGY_CONSUMPTION
+        return True
+
+    def _is_charging(self) -> bool:
+        return self.inhive and self.energy < self.MIN_ENERGY_TO_LEAVE
+
+    def _charge(self) -> bool:
+        """
+        [1.1.3 Energy Management] Charge energy for one timestep while in the hive.
+
+        Returns:
+            bool: False, the bee does not move while charging
+        """
+        print(f"Bee {self.ID} is charging")
+        self.energy += self.ENERGY_CHARGE_AMOUNT
+        return False
+
+    def charging_steps(self) -> int:
+        """
+        [1.1.3 Energy Management] Number of timesteps the bee will spend charging before it can leave.
+
+        Returns:
+            int: 0 if the bee is not charging
+        """
+        if self.inhive and self.energy < self.MIN_ENERGY_TO_LEAVE:
+            return -(-(self.MIN_ENERGY_TO_LEAVE - self.energy) // self.ENERGY_CHARGE_AMOUNT)
+        return 0
+
+    def charge_in_bulk(self, steps):
+        """
+        [1.1.3 Energy Management] Apply several timesteps of hive charging at once.
+        """
+        print(f"Bee {self.ID} is charging for {steps} steps")
+        self.energy += steps * self.ENERGY_CHARGE_AMOUNT
+
+    def fast_forward_steps(self, world) -> int:
+        """
+        [1.1.5 Fast-forward] Number of upcoming path moves that cannot interact with the world.
+        Those moves give the same result whether they are stepped or applied in bulk.
+
+        Returns:
+            int: 0 if the bee is not following or returning along a known path, or follows
+            a path to a known flower that may run dry on the way
+        """
+        if self.inhive:
+            return 0
+        if self.state == BeeState.FOLLOWING and not self.hasNectar:
+            if self.known_flower is not None:
+                # Another bee can empty the flower on any step, which turns this one back to wandering
+                return 0
+            # Stop before the first cell holding a property, usually the flower itself
+            moves = self.path_to_flower
+        elif self.state == BeeState.RETURNING:
+            # The last move lands in the hive and is always stepped
+            moves = self.path_to_hive[:-1]
+        else:
+            return 0
+
+        # A bee carrying nectar is not checked for collisions
+        check_cells = not self.hasNectar
+        x, y = self.pos
+        steps = 0
+        for move in moves:
+            x, y = self._adjust_boundaries(x + move[0], y + move[1])
+            if check_cells and not world.is_empty((x, y)):
+                break
+            steps += 1
+        return steps
+
+    def begin_fast_forward(self, clock, steps):
+        """
+        [1.1.5 Fast-forward] Take the next steps path moves off the path without stepping them.
+        Positions along the way are only worked out when get_pos() is called.
+        """
+        path = self.path_to_flower if self.state == BeeState.FOLLOWING else self.path_to_hive
+        self._ff_moves = path[:steps]
+        del path[:steps]
+        self._ff_origin = self.pos
+        self._ff_start = clock.now
+        self._ff_clock = clock
+        self.energy -= steps * self.ENERGY_CONSUMPTION
+
+    def _ff_position(self, moves_done):
+        x, y = self._ff_origin
+        for move in self._ff_moves[:moves_done]:
+            x, y = self._adjust_boundaries(x + move[0], y + move[1])
+        return (x, y)
+
+    def finish_fast_forward(self):
+        """
+        [1.1.5 Fast-forward] Land the bee at the end of its fast-forwarded moves.
+        """
+        if self._ff_moves is None:
+            return
+        self.pos = self._ff_position(len(self._ff_moves))
+        self._ff_moves = None
+        self._ff_origin = None
+        self._ff_clock = None
+
+    def _can_leave(self) -> bool:
+        # Wandering and following bees only, the table has no leave row for returning bees
+        return self.inhive and self.energy >= self.MIN_ENERGY_TO_LEAVE
+
+    def _leave_hive(self) -> bool:
+        """
+        [1.1.1 State Management] Handle bee exiting the hive.
+        
+        Returns:
+            bool: True if bee exited hive, False if the full entrance kept it inside
+        """
+        old_pos = self.pos
+        self.pos = (self.hive_pos[0], self.hive_pos[1])
+        self.inhive = False
+        if self.crowding:
+            # [1.7 Bee Index] Only a crowded world can keep the bee inside
+            self.notify()
+            blocked = self._move_blocked
+            self._move_blocked = False
+            self._move_invalid = False
+            if blocked:
+                # The hive entrance is full, wait inside
+                self.pos = old_pos
+                self.inhive = True
+                return False
+        print(f"Bee {self.ID} goes out the world")
+        self._drop_empty_flower()
+        
+        if self.state == BeeState.WANDERING and self.path_to_flower:
+            print(f"Bee {self.ID} stopped wandering because it has path to a flower with {len(self.path_to_flower)} steps")
+            self.state = BeeState.FOLLOWING
+        return True
+
+    def _senses_flower(self) -> bool:
+        if self.flower_field is None or self.inhive or self.hasNectar:
+            return False
+        flower, target = self.flower_field.nearest(self.pos)
+        return flower is not None and target != self.pos
+
+    def _approach_flower(self) -> Move:
+        """
+        [1.1.4 Path finding] Head for the nearest nectar flower within sensing range.
+        The bee follows a path from where it is; reaching the flower replaces it with the
+        usual path from the hive.
+
+        Returns:
+            Move: First move towards the flower
+        """
+        flower, target = self.flower_field.nearest(self.pos)
+        print(f"Bee {self.ID} senses a flower at {target}")
+        self.path_to_flower = find_path_to_flower(self.pos, target)
+        self.known_flower = flower
+        return self.path_to_flower.pop(0)
+
+    def _drop_empty_flower(self) -> bool:
+        """
+        [2.2.3 Flower sites] Forget the path to a flower known to be empty.
+
+        Returns:
+            bool: True if the path was dropped
+        """
+        if self.known_flower is None or self.known_flower.has_nectar:
+            return False
+        print(f"Bee {self.ID} forgets the path to the empty flower at {self.known_flower.pos}")
+        self.path_to_flower = []
+        self.known_flower = None
+        return True
+
+    def _unvisited_moves(self, moves):
+        """
+        [1.1.7 Exploration Memory] The moves leading to cells not visited recently, or all
+        moves if every neighbour was.
+        """
+        unvisited = [move for move in moves
+                     if not self.memory.seen(self._adjust_boundaries(self.pos[0] + move[0], self.pos[1] + move[1]))]
+        return unvisited or moves
+
+    def _is_exhausted(self) -> bool:
+        return not self.inhive and not self.hasNectar and self.energy <= 0
+
+    def _head_home(self):
+        print(f"Bee {self.ID} out of energy, back to home")
+        self.path_to_hive = find_path_to_hive((self.hive_pos[0], self.hive_pos[1]), self.pos)
+
+    def _wander(self) -> Move:
+        moves = MOVE_FORWARD if self.ID == 1 else VALID_MOVE
+        if self.memory is not None and not self.inhive:
+            moves = self._unvisited_moves(moves)
+        if self.scent_field is not None and not self.inhive:
+            return self.scent_field.choose(self.pos, moves, self.rng)
+        return self.rng.choice(moves)
+
+    def _flower_emptied(self) -> bool:
+        return not self.hasNectar and self.known_flower is not None and not self.known_flower.has_nectar
+
+    def _forget_flower(self):
+        self._drop_empty_flower()
+
+    def _path_lost(self) -> bool:
+        return not self.inhive and not self.hasNectar and not self.path_to_flower
+
+    def _lose_path(self):
+        print("Can't find a flower with pre-define path")
+
+    def _follow_path(self) -> Move:
+        print(f"Bee {self.ID} following the path, pop 1 step")
+        return self.path_to_flower.pop(0)
+
+    def _no_path_home(self) -> bool:
+        return not self.path_to_hive
+
+    def _last_move_home(self) -> bool:
+        return len(self.path_to_hive) == 1
+
+    def _arrive(self) -> Move:
+        move = self.path_to_hive.pop(0)
+        print(f"Bee {self.ID} comes to hive")
+        self.inhive = True
+        self.pos = (0, 0)
+        self.path_to_hive = []
+        self.energy = 0
+        if self.events is not None:
+            self.events.queue("arrivals", self)
+        else:
+            self.notify()
+        return move
+
+    def _fly_home(self) -> Move:
+        return self.path_to_hive.pop(0)
+
+    def step_change(self):
+        """
+        [1.1 Bee] Update the bee's state and position for each timestep.
+        
+        Returns:
+            bool: True if the bee moved, False otherwise
+        """
+        result = self.machine.step(self)
+        if isinstance(result, tuple):
+            moved = self._execute_move(result)
+            self._remember_cell()
+            return moved
+        return bool(result)
+
+    def begin_step(self) -> bool:
+        """
+        [1.1 Bee] First half of step_change for batched dispatch: the bee picks and takes
+        its move, then queues itself on events for the "moves" batch instead of notifying.
+
+        Returns:
+            bool: True if the move waits for end_step, False if the step is already over
+        """
+        result = self.machine.step(self)
+        if not isinstance(result, tuple):
+            return False
+        self._pending_move = self._begin_move(result)
+        self.events.queue("moves", self)
+        return True
+
+    def end_step(self) -> bool:
+        """
+        [1.1 Bee] Second half of step_change, once the "moves" batch has been checked.
+
+        Returns:
+            bool: True if the bee moved, False otherwise
+        """
+        pending, self._pending_move = self._pending_move, None
+        moved = self._finish_move(*pending)
+        self._remember_cell()
+        return moved
+
+    def _remember_cell(self):
+        if self.memory is not None and not self.inhive:
+            self.memory.add(self.pos)
+
+    def get_pos(self):
+        if self._ff_moves is not None:
+            # Moves done by the end of the current step
+            return self._ff_position(self._ff_clock.now - self._ff_start + 1)
+        return self.pos
+
+    def get_inhive(self):
+        return self.inhive
+
+    def set_inhive(self, value):
+        self.inhive = value
+
+    def get_nectar(self):
+        return self.hasNectar
+
+    def set_nectar(self, value):
+        self.hasNectar = value
+
+    def set_nectar_found(self, flower=None):
+        """
+        [1.1.4 Path finding] Update bee state when nectar is found.
+        Sets paths to flower and hive, and changes state to RETURNING.
+        """
+        self.path_to_flower = find_path_to_flower((self.hive_pos[0], self.hive_pos[1]), self.pos)
+        self.known_flower = flower
+        self.path_to_hive = find_path_to_hive((self.hive_pos[0], self.hive_pos[1]), self.pos)
+        self.state = BeeState.RETURNING
+        self.hasNectar = True
+        self.inhive = False
+
+    def wait(self):
+        """
+        [1.7 Bee Index] Mark the last move as blocked when the cell is full of other bees.
+        """
+        self._move_blocked = True
+
+    def step_back(self):
+        """
+        [1.1.2 Movement] Mark the last move as invalid when bee hits an obstacle.
+        """
+        self._move_invalid = True
+
+    def update(self, observable: BaseObservable) -> None:
+        """
+        update () when hive notifies about the shared information
+        """
+        from controller.hive_controller import HiveController
+        from controller.world_controller import WorldController
+        
+        if isinstance(observable, HiveController):
+            path, flower = observable.recruit(self.rng)
+            self.receive_path(path, flower)
+
+    def receive_path(self, path, flower=None) -> bool:
+        """
+        [2.2.2 Path information sharing] Take a path to a flower shared by the hive or by
+        another bee, with the communication chance, unless the known path is shorter and
+        its flower is not known to be empty.
+
+        Returns:
+            bool: True if the path was saved
+        """
+        chance = self.rng.uniform(0, 1)
+        print(f"Bee {self.ID} receive path info with chance {chance} ")
+        if chance > self.COMMUNICATION_THRESHOLD:
+            known_empty = self.known_flower is not None and not self.known_flower.has_nectar
+            if not self.path_to_flower or known_empty or len(self.path_to_flower) >= len(path):
+                self.path_to_flower = path.copy()
+                self.known_flower = flower
+                print(f"Bee {self.ID} saved flower information with {len(self.path_to_flower)} steps")
+                return True
+        else:
+            print(f"Bee {self.ID} did not receive flower information")
+        return False
+
+    # [1.1.1 State Management] (state, condition, action, next state); the first row whose
+    # condition holds fires, with ANY rows applying to every state
+    TRANSITIONS = (
+        (ANY, _is_charging, _charge, None),
+        (BeeState.WANDERING, _can_leave, _leave_hive, None),
+        (BeeState.FOLLOWING, _can_leave, _leave_hive, None),
+        (BeeState.WANDERING, _is_exhausted, _head_home, BeeState.RETURNING),
+        (BeeState.WANDERING, _senses_flower, _approach_flower, BeeState.FOLLOWING),
+        (BeeState.WANDERING, None, _wander, None),
+        (BeeState.FOLLOWING, _flower_emptied, _forget_flower, BeeState.WANDERING),
+        (BeeState.FOLLOWING, _path_lost, _lose_path, BeeState.WANDERING),
+        (BeeState.FOLLOWING, None, _follow_path, None),
+        (BeeState.RETURNING, _no_path_home, None, None),
+        (BeeState.RETURNING, _last_move_home, _arrive, BeeState.WANDERING),
+        (BeeState.RETURNING, None, _fly_home, None),
+    )
+    machine = StateMachine(TRANSITIONS)
@@ -0,0 +1,28 @@
+class Colony:
+    """
+    [1.6 Colony] One hive with its comb store, controller and bees. Several colonies can
+    share a world and compete for its flowers; each bee only reports to the controller of
+    its own colony and only shares paths with bees of the same hive.
+
+    Attributes:
+        number (int): Number of the colony, from 1, keying its random stream
+        name (str): Label used in reports
+        hive_pos (tuple): Position and size of the hive entrance in the world (x, y, width, height)
+        hive (Hive): Comb store of the colony
+        hive_controller (HiveController): Controller storing the colony's nectar
+        bees (list): Bees of the colony
+    """
+    def __init__(self, number, hive_pos, hive, hive_controller):
+        self.number = number
+        self.name = f"Colony {number}"
+        self.hive_pos = hive_pos
+        self.hive = hive
+        self.hive_controller = hive_controller
+        self.bees = []
+
+    def __contains__(self, bee):
+        return self.hive_controller.is_attached(bee)
+
+    @property
+    def nectar_delivered(self):
+        return self.hive_controller.nectar_delivered
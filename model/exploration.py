@@ -0,0 +1,68 @@
+class ExplorationMemory:
+    """
+    [1.1.7 Exploration Memory] Compact memory of the cells a bee visited recently.
+
+    Small worlds use an exact packed bitset with one bit per cell. Worlds with more cells
+    than max_bits use a Bloom-style set instead: each cell sets a few hashed bits in a
+    fixed-size bitset, so memory stays bounded at the cost of rare false "visited" answers.
+    Two generations are kept and the older one is cleared after capacity visits, so the
+    bee forgets old cells and the per-bee memory is a few hundred bytes.
+
+    Attributes:
+        width (int): Number of cells along x
+        exact (bool): Whether every cell has its own bit
+        nbits (int): Bits per generation
+        capacity (int): Visits recorded before the older generation is forgotten
+    """
+    HASHES = 2
+
+    def __init__(self, world_size, capacity=256, max_bits=1 << 15):
+        self.width, height = world_size
+        cells = self.width * height
+        self.exact = cells <= max_bits
+        # About 16 bits per remembered visit keeps false positives near 1% with two hashes
+        self.nbits = cells if self.exact else max(64, capacity * 16)
+        self.capacity = capacity
+        nbytes = (self.nbits + 7) // 8
+        self._current = bytearray(nbytes)
+        self._previous = bytearray(nbytes)
+        self._count = 0
+
+    @property
+    def nbytes(self):
+        return len(self._current) + len(self._previous)
+
+    def _bits(self, pos):
+        key = pos[1] * self.width + pos[0]
+        if self.exact:
+            return (key,)
+        h = (key * 0x9E3779B1) & 0xFFFFFFFF
+        return (h % self.nbits, ((h >> 16) ^ (key * 0x85EBCA6B)) % self.nbits)
+
+    def add(self, pos):
+        """
+        [1.1.7 Exploration Memory] Remember the cell pos as visited.
+        """
+        for bit in self._bits(pos):
+            self._current[bit >> 3] |= 1 << (bit & 7)
+        self._count += 1
+        if self._count >= self.capacity:
+            # Start a new generation, forgetting the oldest visits
+            self._previous, self._current = self._current, self._previous
+            self._current[:] = bytes(len(self._current))
+            self._count = 0
+
+    def seen(self, pos):
+        """
+        [1.1.7 Exploration Memory] Whether the cell pos was visited recently.
+        """
+        bits = self._bits(pos)
+        for generation in (self._current, self._previous):
+            if all(generation[bit >> 3] >> (bit & 7) & 1 for bit in bits):
+                return True
+        return False
+
+    def clear(self):
+        self._current[:] = bytes(len(self._current))
+        self._previous[:] = bytes(len(self._previous))
+        self._count = 0
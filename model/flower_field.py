@@ -0,0 +1,100 @@
+import numpy as np
+
+from base.observer import Observer
+from model.world import PropertyType
+
+
+class FlowerField(Observer):
+    """
+    [1.2.6 Flower Field] Distance transform to the nearest flower holding nectar, cut off at
+    a sensing radius. Each cell stores the Chebyshev distance (the number of bee moves) to
+    the closest nectar flower within radius and which flower that is.
+
+    The field is built per block on first use from the flowers found through the World's
+    spatial hash, so a lookup is O(1) once its block exists. Attached to the World, it drops
+    the blocks within radius of a flower that is added, removed, depleted or refilled.
+
+    Attributes:
+        world (World): World whose flowers are sensed
+        radius (int): Largest distance at which a flower is sensed
+        block_size (int): Width and height of a cached block in cells
+        blocks (dict): Maps (block_x, block_y) to (distance, flower index, flowers)
+    """
+    FAR = np.iinfo(np.int32).max
+
+    def __init__(self, world, radius, block_size=32):
+        self.world = world
+        self.radius = radius
+        self.width, self.height = world.world_size
+        self.block_size = block_size
+        self.blocks = {}
+
+    def _build(self, bx, by):
+        bs, r = self.block_size, self.radius
+        x0, y0 = bx * bs, by * bs
+        x1, y1 = min(self.width, x0 + bs), min(self.height, y0 + bs)
+        xs = np.arange(x0, x1)[np.newaxis, :]
+        ys = np.arange(y0, y1)[:, np.newaxis]
+        distance = np.full((y1 - y0, x1 - x0), self.FAR, dtype=np.int32)
+        nearest = np.full(distance.shape, -1, dtype=np.int32)
+        flowers = [p for p in self.world.query_rect(x0 - r, y0 - r, x1 - x0 + 2 * r, y1 - y0 + 2 * r)
+                   if p.type == PropertyType.FLOWER and p.has_nectar]
+        for i, flower in enumerate(flowers):
+            fx, fy = flower.pos
+            dx = np.maximum(np.maximum(fx - xs, xs - (fx + flower.width - 1)), 0)
+            dy = np.maximum(np.maximum(fy - ys, ys - (fy + flower.height - 1)), 0)
+            d = np.maximum(dx, dy)
+            # Strictly closer only, so ties go to the flower added to the world first
+            closer = (d <= r) & (d < distance)
+            distance[closer] = d[closer]
+            nearest[closer] = i
+        block = (distance, nearest, flowers)
+        self.blocks[(bx, by)] = block
+        return block
+
+    def _lookup(self, x, y):
+        bs = self.block_size
+        block = self.blocks.get((x // bs, y // bs))
+        if block is None:
+            block = self._build(x // bs, y // bs)
+        distance, nearest, flowers = block
+        i = nearest[y % bs, x % bs]
+        if i < 0:
+            return None, None
+        return flowers[i], int(distance[y % bs, x % bs])
+
+    def nearest(self, pos):
+        """
+        [1.2.6 Flower Field] Nearest nectar flower within radius of pos and the cell of it
+        closest to pos.
+
+        Returns:
+            tuple: (flower, (x, y)), or (None, None) if no flower is in range
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None, None
+        flower, _ = self._lookup(x, y)
+        if flower is None:
+            return None, None
+        fx, fy = flower.pos
+        return flower, (min(max(x, fx), fx + flower.width - 1), min(max(y, fy), fy + flower.height - 1))
+
+    def distance(self, pos):
+        """
+        [1.2.6 Flower Field] Moves from pos to the nearest nectar flower, None beyond radius.
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return self._lookup(x, y)[1]
+
+    def update(self, observable) -> None:
+        """
+        update() when the world changes: drop the blocks within radius of the change.
+        """
+        x, y, width, height = observable.last_change
+        bs, r = self.block_size, self.radius
+        for by in range(max(0, y - r) // bs, (y + height + r - 1) // bs + 1):
+            for bx in range(max(0, x - r) // bs, (x + width + r - 1) // bs + 1):
+                self.blocks.pop((bx, by), None)
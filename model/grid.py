@@ -0,0 +1,302 @@
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+
+class DenseGrid:
+    """
+    [1.2.2 Occupancy Grid] In-memory occupancy grid for small worlds.
+    Each cell stores the numeric value of the property covering it, or EMPTY.
+
+    Attributes:
+        width (int): Number of cells along x
+        height (int): Number of cells along y
+        cells (numpy.ndarray): 2D array indexed [y, x]
+    """
+    EMPTY = 0
+
+    def __init__(self, world_size, dtype=np.uint8):
+        self.width, self.height = world_size
+        self.cells = np.zeros((self.height, self.width), dtype=dtype)
+
+    @classmethod
+    def from_array(cls, cells):
+        """
+        [1.2.2 Occupancy Grid] Wrap an existing [y, x] array, e.g. one in shared memory.
+        """
+        grid = cls.__new__(cls)
+        grid.height, grid.width = cells.shape
+        grid.cells = cells
+        return grid
+
+    def _clip(self, x, y, width, height):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        return x0, y0, x1, y1
+
+    def get(self, x, y):
+        """
+        [1.2.2 Occupancy Grid] Value of a single cell, EMPTY outside the grid.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y, x]
+        return self.EMPTY
+
+    def lookup(self, xs, ys):
+        """
+        [1.2.2 Occupancy Grid] Values of many cells at once, EMPTY outside the grid.
+        """
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        out = np.full(xs.shape, self.EMPTY, dtype=self.cells.dtype)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        out[inside] = self.cells[ys[inside], xs[inside]]
+        return out
+
+    def fill_rect(self, x, y, width, height, value):
+        """
+        [1.2.2 Occupancy Grid] Set every cell of a rectangle to value (clipped to the grid).
+        """
+        x0, y0, x1, y1 = self._clip(x, y, width, height)
+        if x0 < x1 and y0 < y1:
+            self.cells[y0:y1, x0:x1] = value
+
+    def read_rect(self, x, y, width, height):
+        """
+        [1.2.2 Occupancy Grid] Copy of a rectangle indexed [y, x]; cells outside the grid read as EMPTY.
+        """
+        out = np.full((height, width), self.EMPTY, dtype=self.cells.dtype)
+        x0, y0, x1, y1 = self._clip(x, y, width, height)
+        if x0 < x1 and y0 < y1:
+            out[y0 - y:y1 - y, x0 - x:x1 - x] = self.cells[y0:y1, x0:x1]
+        return out
+
+    def overview(self):
+        return self.cells
+
+    def close(self):
+        pass
+
+
+class TiledGrid:
+    """
+    [1.2.2 Occupancy Grid] Occupancy grid for huge worlds, stored as fixed-size tiles
+    in a memory-mapped file and paged in on demand.
+
+    Tiles that were never written all share one canonical read-only empty tile, so disk
+    and resident memory follow the area that actually holds properties.
+
+    Attributes:
+        width (int): Number of cells along x
+        height (int): Number of cells along y
+        tile_size (int): Width and height of a tile in cells
+        path (str): Location of the backing file
+        tiles (dict): Maps (tile_x, tile_y) to a slot in the backing file
+    """
+    EMPTY = 0
+
+    def __init__(self, world_size, tile_size=256, path=None, dtype=np.uint8):
+        self.width, self.height = world_size
+        self.tile_size = tile_size
+        self.dtype = np.dtype(dtype)
+        self.tiles = {}
+        self._capacity = 0
+        self._store = None
+
+        self._empty_tile = np.full((tile_size, tile_size), self.EMPTY, dtype=self.dtype)
+        self._empty_tile.setflags(write=False)
+
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="beeworld_", suffix=".tiles")
+            os.close(fd)
+            self._finalizer = weakref.finalize(self, _remove_file, path)
+        else:
+            open(path, "wb").close()
+            self._finalizer = None
+        self.path = path
+
+    def snapshot(self):
+        """
+        [1.2.2 Occupancy Grid] Picklable description of the grid that another process can
+        open read-only with open_snapshot, sharing the same backing file.
+        """
+        if self._store is not None:
+            self._store.flush()
+        return {"world_size": (self.width, self.height), "tile_size": self.tile_size,
+                "path": self.path, "tiles": dict(self.tiles), "capacity": self._capacity,
+                "dtype": self.dtype.str}
+
+    @classmethod
+    def open_snapshot(cls, snapshot):
+        """
+        [1.2.2 Occupancy Grid] Open a read-only view of a grid described by snapshot().
+        """
+        grid = cls.__new__(cls)
+        grid.width, grid.height = snapshot["world_size"]
+        grid.tile_size = snapshot["tile_size"]
+        grid.dtype = np.dtype(snapshot["dtype"])
+        grid.tiles = snapshot["tiles"]
+        grid.path = snapshot["path"]
+        grid._capacity = snapshot["capacity"]
+        grid._finalizer = None
+        grid._empty_tile = np.full((grid.tile_size, grid.tile_size), cls.EMPTY, dtype=grid.dtype)
+        grid._empty_tile.setflags(write=False)
+        grid._store = None
+        if grid._capacity:
+            grid._store = np.memmap(grid.path, dtype=grid.dtype, mode="r",
+                                    shape=(grid._capacity, grid.tile_size, grid.tile_size))
+        return grid
+
+    @property
+    def tiles_x(self):
+        return -(-self.width // self.tile_size)
+
+    @property
+    def tiles_y(self):
+        return -(-self.height // self.tile_size)
+
+    def _grow(self):
+        """
+        Double the number of tile slots in the backing file and re-map it.
+        """
+        capacity = max(16, self._capacity * 2)
+        if self._store is not None:
+            self._store.flush()
+        self._store = np.memmap(self.path, dtype=self.dtype, mode="r+",
+                                shape=(capacity, self.tile_size, self.tile_size))
+        self._capacity = capacity
+
+    def tile(self, tx, ty):
+        """
+        [1.2.2 Occupancy Grid] Tile at (tx, ty) indexed [y, x]; the shared empty tile if never written.
+        """
+        slot = self.tiles.get((tx, ty))
+        if slot is None:
+            return self._empty_tile
+        return self._store[slot]
+
+    def _writable_tile(self, tx, ty):
+        slot = self.tiles.get((tx, ty))
+        if slot is None:
+            slot = len(self.tiles)
+            if slot >= self._capacity:
+                self._grow()
+            self._store[slot] = self.EMPTY
+            self.tiles[(tx, ty)] = slot
+        return self._store[slot]
+
+    def _tile_spans(self, x0, y0, x1, y1):
+        """
+        Yield (tx, ty, x0, y0, x1, y1) for each tile overlapping the clipped rectangle.
+        """
+        ts = self.tile_size
+        for ty in range(y0 // ts, (y1 - 1) // ts + 1):
+            for tx in range(x0 // ts, (x1 - 1) // ts + 1):
+                yield (tx, ty,
+                       max(x0, tx * ts), max(y0, ty * ts),
+                       min(x1, (tx + 1) * ts), min(y1, (ty + 1) * ts))
+
+    def _clip(self, x, y, width, height):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        return x0, y0, x1, y1
+
+    def get(self, x, y):
+        """
+        [1.2.2 Occupancy Grid] Value of a single cell, EMPTY outside the grid.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return self.EMPTY
+        ts = self.tile_size
+        slot = self.tiles.get((x // ts, y // ts))
+        if slot is None:
+            return self.EMPTY
+        return self._store[slot, y % ts, x % ts]
+
+    def lookup(self, xs, ys):
+        """
+        [1.2.2 Occupancy Grid] Values of many cells at once, EMPTY outside the grid.
+        Cells are sorted by tile once, so each allocated tile indexes one contiguous slice
+        of them; cells in unallocated tiles keep the EMPTY the output starts with.
+        """
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        out = np.full(xs.shape, self.EMPTY, dtype=self.dtype)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if not inside.any() or not self.tiles:
+            return out
+        ts = self.tile_size
+        positions = np.nonzero(inside)[0]
+        keys = (ys[positions] // ts) * self.tiles_x + xs[positions] // ts
+        order = np.argsort(keys, kind="stable")
+        positions, keys = positions[order], keys[order]
+        starts = np.flatnonzero(np.diff(keys)) + 1
+        for key, chosen in zip(keys[np.r_[0, starts]].tolist(), np.split(positions, starts)):
+            slot = self.tiles.get((key % self.tiles_x, key // self.tiles_x))
+            if slot is None:
+                continue
+            out[chosen] = self._store[slot, ys[chosen] % ts, xs[chosen] % ts]
+        return out
+
+    def fill_rect(self, x, y, width, height, value):
+        """
+        [1.2.2 Occupancy Grid] Set every cell of a rectangle to value (clipped to the grid).
+        Writing EMPTY into a tile that was never allocated does not allocate it.
+        """
+        x0, y0, x1, y1 = self._clip(x, y, width, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        ts = self.tile_size
+        for tx, ty, sx0, sy0, sx1, sy1 in self._tile_spans(x0, y0, x1, y1):
+            if value == self.EMPTY and (tx, ty) not in self.tiles:
+                continue
+            tile = self._writable_tile(tx, ty)
+            tile[sy0 - ty * ts:sy1 - ty * ts, sx0 - tx * ts:sx1 - tx * ts] = value
+
+    def read_rect(self, x, y, width, height):
+        """
+        [1.2.2 Occupancy Grid] Copy of a rectangle indexed [y, x]; cells outside the grid read as EMPTY.
+        """
+        out = np.full((height, width), self.EMPTY, dtype=self.dtype)
+        x0, y0, x1, y1 = self._clip(x, y, width, height)
+        if x0 >= x1 or y0 >= y1:
+            return out
+        ts = self.tile_size
+        for tx, ty, sx0, sy0, sx1, sy1 in self._tile_spans(x0, y0, x1, y1):
+            slot = self.tiles.get((tx, ty))
+            if slot is None:
+                continue
+            out[sy0 - y:sy1 - y, sx0 - x:sx1 - x] = \
+                self._store[slot, sy0 - ty * ts:sy1 - ty * ts, sx0 - tx * ts:sx1 - tx * ts]
+        return out
+
+    def overview(self):
+        """
+        [1.2.2 Occupancy Grid] One cell per tile holding the highest value in that tile,
+        small enough to render for any world size.
+        """
+        out = np.full((self.tiles_y, self.tiles_x), self.EMPTY, dtype=self.dtype)
+        for (tx, ty), slot in self.tiles.items():
+            out[ty, tx] = self._store[slot].max()
+        return out
+
+    def resident_bytes(self):
+        """
+        Bytes of tile data backing allocated tiles.
+        """
+        return len(self.tiles) * self.tile_size * self.tile_size * self.dtype.itemsize
+
+    def close(self):
+        """
+        Release the memory map and delete a temporary backing file.
+        """
+        self._store = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,40 @@
+import numpy as np
+
+
+class VisitHeatmap:
+    """
+    [1.2.8 Visit Heatmap] Number of bee visits to each cell over a run.
+    Only the running totals are stored, never per-bee histories, so memory is one int32
+    per cell whatever the number of bees and steps.
+
+    Attributes:
+        width (int): Number of cells along x
+        height (int): Number of cells along y
+        counts (numpy.ndarray): Visits of each cell indexed [y, x]
+        steps (int): Number of steps recorded
+    """
+    def __init__(self, world_size):
+        self.width, self.height = world_size
+        self.counts = np.zeros((self.height, self.width), dtype=np.int32)
+        self.steps = 0
+
+    def add(self, xs, ys):
+        """
+        [1.2.8 Visit Heatmap] Count one visit for each bee at (xs[i], ys[i]).
+        """
+        self.steps += 1
+        cells = np.asarray(ys, dtype=np.int64) * self.width + np.asarray(xs, dtype=np.int64)
+        if len(cells) == 0:
+            return
+        flat = self.counts.reshape(-1)
+        if len(cells) * 8 >= flat.size:
+            # Crowded grids: one pass over every cell beats scattered updates
+            flat += np.bincount(cells, minlength=flat.size).astype(np.int32)
+        else:
+            np.add.at(flat, cells, 1)
+
+    def save(self, path):
+        """
+        [1.2.8 Visit Heatmap] Write the counts as a NumPy .npy array.
+        """
+        np.save(path, self.counts)
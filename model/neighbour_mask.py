@@ -0,0 +1,116 @@
+import numpy as np
+
+from base.observer import Observer
+from model.world import PropertyType
+from utils.constants import VALID_MOVE
+
+# Bit k of a mask is set when VALID_MOVE[k] is passable; MOVE_BITS[mask] lists the set bits
+MOVE_BITS = [[k for k in range(len(VALID_MOVE)) if mask >> k & 1] for mask in range(1 << len(VALID_MOVE))]
+POPCOUNT = np.array([len(bits) for bits in MOVE_BITS], dtype=np.int32)
+# MOVE_TABLE[mask, rank] is the move index of the rank-th set bit, -1 past the last one
+MOVE_TABLE = np.full((len(MOVE_BITS), len(VALID_MOVE)), -1, dtype=np.int32)
+for _mask, _bits in enumerate(MOVE_BITS):
+    MOVE_TABLE[_mask, :len(_bits)] = _bits
+
+
+class NeighbourMasks(Observer):
+    """
+    [1.2.5 Neighbour Masks] One byte per cell whose bit k says whether VALID_MOVE[k] from
+    that cell lands on a passable cell (empty or a flower), after the same boundary
+    clamping a bee applies. Masks are built per block on first use and, once attached to
+    the World, a block is dropped when a property edit touches it, so only areas bees
+    visit are ever computed.
+
+    Attributes:
+        grid (DenseGrid | TiledGrid): Occupancy grid the masks describe
+        block_size (int): Width and height of a cached block in cells
+        blocks (dict): Maps (block_x, block_y) to a [y, x] uint8 mask array
+    """
+    PASSABLE = (0, PropertyType.FLOWER.value)
+
+    def __init__(self, grid, block_size=64):
+        self.grid = grid
+        self.width, self.height = grid.width, grid.height
+        self.block_size = block_size
+        self.blocks = {}
+
+    def _build(self, bx, by):
+        bs = self.block_size
+        x0, y0 = bx * bs, by * bs
+        x1, y1 = min(self.width, x0 + bs), min(self.height, y0 + bs)
+        # One cell of margin covers every neighbour a move can reach
+        codes = self.grid.read_rect(x0 - 1, y0 - 1, x1 - x0 + 2, y1 - y0 + 2)
+        passable = np.isin(codes, self.PASSABLE)
+        xs, ys = np.arange(x0, x1), np.arange(y0, y1)
+        mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        for bit, (dx, dy) in enumerate(VALID_MOVE):
+            nx = np.clip(xs + dx, 1, self.width - 2) - (x0 - 1)
+            ny = np.clip(ys + dy, 1, self.height - 2) - (y0 - 1)
+            mask |= passable[np.ix_(ny, nx)].astype(np.uint8) << bit
+        self.blocks[(bx, by)] = mask
+        return mask
+
+    def block(self, bx, by):
+        mask = self.blocks.get((bx, by))
+        if mask is None:
+            mask = self._build(bx, by)
+        return mask
+
+    def get(self, x, y):
+        """
+        [1.2.5 Neighbour Masks] Mask of passable moves from the cell (x, y).
+        """
+        bs = self.block_size
+        return int(self.block(x // bs, y // bs)[y % bs, x % bs])
+
+    def lookup(self, xs, ys):
+        """
+        [1.2.5 Neighbour Masks] Masks of many cells at once. Cells are sorted by block once,
+        so each block indexes one contiguous slice of them.
+        """
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        out = np.zeros(xs.shape, dtype=np.uint8)
+        if not xs.size:
+            return out
+        bs = self.block_size
+        blocks_x = -(-self.width // bs)
+        keys = ((ys // bs) * blocks_x + xs // bs).ravel()
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.diff(keys)) + 1
+        flat_xs, flat_ys, flat_out = xs.ravel(), ys.ravel(), out.reshape(-1)
+        for key, chosen in zip(keys[np.r_[0, starts]].tolist(), np.split(order, starts)):
+            mask = self.block(key % blocks_x, key // blocks_x)
+            flat_out[chosen] = mask[flat_ys[chosen] % bs, flat_xs[chosen] % bs]
+        return out
+
+    def moves(self, x, y):
+        """
+        [1.2.5 Neighbour Masks] Passable moves from the cell (x, y), in VALID_MOVE order.
+        """
+        return [VALID_MOVE[k] for k in MOVE_BITS[self.get(x, y)]]
+
+    def update(self, observable) -> None:
+        """
+        update() when the world changes: drop the blocks whose masks a property edit can
+        affect. Nectar changes do not change passability.
+        """
+        if observable.last_change_kind != "property":
+            return
+        x, y, width, height = observable.last_change
+        bs = self.block_size
+        # A cell's mask depends on its neighbours, so widen the box by one cell
+        for by in range(max(0, y - 1) // bs, (y + height) // bs + 1):
+            for bx in range(max(0, x - 1) // bs, (x + width) // bs + 1):
+                self.blocks.pop((bx, by), None)
+
+
+def pick_moves(masks, draws):
+    """
+    [1.2.5 Neighbour Masks] For each mask, the index into VALID_MOVE of the passable move
+    chosen by a uniform draw in [0, 1), or -1 when no move is passable.
+    """
+    masks = np.asarray(masks)
+    counts = POPCOUNT[masks]
+    picks = np.minimum((draws * counts).astype(np.int32), np.maximum(counts - 1, 0))
+    return MOVE_TABLE[masks, picks]
@@ -0,0 +1,70 @@
+import numpy as np
+
+
+class ScentField:
+    """
+    [1.2.7 Scent Field] Per-cell scent laid by bees as they fly, which fades and spreads.
+    Decay and diffusion are applied to the whole grid with array operations every
+    interval steps, so their cost depends on the world size and not on the bee count.
+
+    Attributes:
+        width (int): Number of cells along x
+        height (int): Number of cells along y
+        field (numpy.ndarray): Scent of each cell indexed [y, x]
+        decay (float): Fraction of scent kept per step
+        diffusion (float): Fraction of a cell's scent spread evenly to its 8 neighbours per update
+        deposit_amount (float): Scent a bee leaves on its cell each step
+        interval (int): Steps between decay and diffusion updates, raise it for big maps
+        attraction (float): How strongly wandering bees favour scented cells
+    """
+    def __init__(self, world_size, decay=0.95, diffusion=0.1, deposit_amount=1.0, interval=1, attraction=1.0):
+        self.width, self.height = world_size
+        self.field = np.zeros((self.height, self.width), dtype=np.float32)
+        self.decay = decay
+        self.diffusion = diffusion
+        self.deposit_amount = deposit_amount
+        self.interval = interval
+        self.attraction = attraction
+
+    def deposit(self, xs, ys):
+        """
+        [1.2.7 Scent Field] Add scent on the cells (xs[i], ys[i]), once per bee.
+        """
+        np.add.at(self.field, (np.asarray(ys), np.asarray(xs)), self.deposit_amount)
+
+    def step(self, t):
+        """
+        [1.2.7 Scent Field] Apply decay and diffusion if timestep t is an update step.
+        Decay over the skipped steps is caught up with decay ** interval, while diffusion is
+        applied once per update, so a longer interval spreads scent less far.
+        """
+        if t % self.interval:
+            return
+        field = self.field
+        if self.diffusion:
+            # Sum of the 8 neighbours, with edge cells reflecting their own scent
+            padded = np.pad(field, 1, mode="edge")
+            neighbours = (padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:] +
+                          padded[1:-1, :-2] + padded[1:-1, 2:] +
+                          padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:])
+            field *= 1 - self.diffusion
+            field += neighbours * (self.diffusion / 8)
+        field *= self.decay ** self.interval
+
+    def scent_at(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return float(self.field[y, x])
+        return 0.0
+
+    def choose(self, pos, moves, rng):
+        """
+        [1.2.7 Scent Field] Pick one of moves from pos with weight 1 + attraction * scent of
+        the cell it leads to, using a single draw from rng.
+        """
+        weights = [1 + self.attraction * self.scent_at(pos[0] + dx, pos[1] + dy) for dx, dy in moves]
+        draw = rng.uniform(0, sum(weights))
+        for move, weight in zip(moves, weights):
+            draw -= weight
+            if draw < 0:
+                return move
+        return moves[-1]
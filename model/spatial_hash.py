@@ -0,0 +1,88 @@
+from itertools import count
+
+
+class SpatialHash:
+    """
+    [1.2.3 Spatial Hash] Uniform grid of buckets indexing items by their bounding box.
+    Inserting or removing an item only touches the buckets its box overlaps.
+
+    Attributes:
+        cell_size (int): Width and height of a bucket in world cells
+        buckets (dict): Maps (cell_x, cell_y) to the items overlapping that bucket
+        bounds (dict): Maps each item to its (x, y, width, height) box
+    """
+    def __init__(self, cell_size=16):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.bounds = {}
+        self._order = {}
+        self._counter = count()
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, item):
+        return item in self.bounds
+
+    def _cells(self, x, y, width, height):
+        cs = self.cell_size
+        for cy in range(y // cs, (y + max(height, 1) - 1) // cs + 1):
+            for cx in range(x // cs, (x + max(width, 1) - 1) // cs + 1):
+                yield (cx, cy)
+
+    def insert(self, item, x, y, width, height):
+        """
+        [1.2.3 Spatial Hash] Index item under the box (x, y, width, height).
+        """
+        if item in self.bounds:
+            self.remove(item)
+        self.bounds[item] = (x, y, width, height)
+        self._order[item] = next(self._counter)
+        for cell in self._cells(x, y, width, height):
+            self.buckets.setdefault(cell, {})[item] = None
+
+    def remove(self, item):
+        """
+        [1.2.3 Spatial Hash] Drop item from the index, ignoring unknown items.
+        """
+        box = self.bounds.pop(item, None)
+        if box is None:
+            return
+        del self._order[item]
+        for cell in self._cells(*box):
+            bucket = self.buckets.get(cell)
+            if bucket is not None:
+                bucket.pop(item, None)
+                if not bucket:
+                    del self.buckets[cell]
+
+    def query_rect(self, x, y, width, height):
+        """
+        [1.2.3 Spatial Hash] Items whose box overlaps the rectangle, in insertion order.
+        """
+        found = {}
+        for cell in self._cells(x, y, width, height):
+            bucket = self.buckets.get(cell)
+            if not bucket:
+                continue
+            for item in bucket:
+                bx, by, bw, bh = self.bounds[item]
+                if bx < x + width and x < bx + bw and by < y + height and y < by + bh:
+                    found[item] = None
+        return sorted(found, key=self._order.__getitem__)
+
+    def query_point(self, x, y):
+        """
+        [1.2.3 Spatial Hash] Items whose box contains the cell (x, y), in insertion order.
+        """
+        bucket = self.buckets.get((x // self.cell_size, y // self.cell_size))
+        if not bucket:
+            return []
+        found = []
+        for item in bucket:
+            bx, by, bw, bh = self.bounds[item]
+            if bx <= x < bx + bw and by <= y < by + bh:
+                found.append(item)
+        if len(found) > 1:
+            found.sort(key=self._order.__getitem__)
+        return found
@@ -0,0 +1,81 @@
+import numpy as np
+
+# Wildcard state for rows that apply whatever state a bee is in
+ANY = None
+
+
+class StateMachine:
+    """
+    [1.1.1 State Management] Bee behaviour as a table of (state, condition, action,
+    next_state) rows. For a bee in some state, the rows for that state and the ANY rows
+    are tried in table order and the first whose condition holds fires: the bee moves
+    to next_state (None keeps the state, or lets the action choose) and then the action
+    runs. At most one row fires per step, and a condition of None always holds.
+
+    The same table shape runs per bee with step(), where conditions and actions take the
+    bee, or over arrays with step_arrays(), where they take index arrays. A new state only
+    needs new rows; the loops below never change.
+
+    Attributes:
+        rows (tuple): The transition table, in priority order
+    """
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+        self._by_state = {}
+
+    def rows_for(self, state):
+        """
+        [1.1.1 State Management] Rows that can fire in state, in table order.
+        """
+        rows = self._by_state.get(state)
+        if rows is None:
+            rows = tuple((condition, action, next_state) for row_state, condition, action, next_state in self.rows
+                         if row_state is ANY or row_state == state)
+            self._by_state[state] = rows
+        return rows
+
+    def step(self, bee):
+        """
+        [1.1.1 State Management] Fire the first matching row for one bee.
+
+        Returns:
+            The action's result, None if no row fired or the row has no action
+        """
+        for condition, action, next_state in self.rows_for(bee.state):
+            if condition is None or condition(bee):
+                if next_state is not None:
+                    bee.state = next_state
+                return action(bee) if action is not None else None
+        return None
+
+    def step_arrays(self, states, bees, context):
+        """
+        [1.1.1 State Management] Fire the table over many bees at once. Bees are grouped by
+        their state at the start of the step and each row takes the bees of its group that
+        no earlier row took and whose condition holds. Conditions are called as
+        condition(bees, context) and return a boolean mask, actions as action(bees, context).
+
+        Args:
+            states (numpy.ndarray): State value of every bee, updated for bees that change state
+            bees (numpy.ndarray): Indices of the bees to step
+            context: Passed through to conditions and actions
+        """
+        current = states[bees]
+        pending = {value: bees[current == value] for value in np.unique(current).tolist()}
+        for row_state, condition, action, next_state in self.rows:
+            groups = list(pending) if row_state is ANY else [row_state.value]
+            for value in groups:
+                candidates = pending.get(value)
+                if candidates is None or not len(candidates):
+                    continue
+                if condition is None:
+                    chosen, pending[value] = candidates, candidates[:0]
+                else:
+                    hit = condition(candidates, context)
+                    chosen, pending[value] = candidates[hit], candidates[~hit]
+                if not len(chosen):
+                    continue
+                if next_state is not None:
+                    states[chosen] = next_state.value
+                if action is not None:
+                    action(chosen, context)
@@ -0,0 +1,255 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from model.buzzness import Bee, BeeState
+from model.neighbour_mask import pick_moves
+from model.state_machine import ANY, StateMachine
+from model.world import PropertyType
+from utils.constants import VALID_MOVE
+
+MOVES = np.array(VALID_MOVE, dtype=np.int32)
+
+
+class SwarmArrays:
+    """
+    [1.4 Swarm] State of many bees held as one array per attribute, optionally placed in
+    shared memory so worker processes can step their bees in place.
+
+    Paths from utils.utils always step straight towards their end cell, so a path is stored
+    as its target cell instead of a list of moves.
+
+    Attributes:
+        size (int): Number of bees
+        x, y (numpy.ndarray): Current position, hive coordinates while in the hive
+        energy (numpy.ndarray): Current energy level
+        target_x, target_y (numpy.ndarray): End cell of the path being followed or returned on
+        known_x, known_y (numpy.ndarray): Flower the bee has heard about, -1 if none
+        owner (numpy.ndarray): Worker that steps the bee in a domain-decomposed run
+        state (numpy.ndarray): BeeState value
+        inhive (numpy.ndarray): Whether the bee is inside the hive
+        has_nectar (numpy.ndarray): Whether the bee is carrying nectar
+    """
+    # Widest types first so every array stays aligned inside a shared block
+    FIELDS = (("x", np.int32), ("y", np.int32), ("energy", np.int32),
+              ("target_x", np.int32), ("target_y", np.int32),
+              ("known_x", np.int32), ("known_y", np.int32), ("owner", np.int32),
+              ("state", np.int8), ("inhive", np.bool_), ("has_nectar", np.bool_))
+
+    def __init__(self, size, shared=False, name=None):
+        self.size = size
+        nbytes = max(1, sum(np.dtype(dtype).itemsize for _, dtype in self.FIELDS) * size)
+        self._shm = None
+        if shared or name is not None:
+            self._shm = shared_memory.SharedMemory(name=name, create=name is None, size=nbytes)
+            buffer = self._shm.buf
+        else:
+            buffer = bytearray(nbytes)
+
+        offset = 0
+        for field, dtype in self.FIELDS:
+            setattr(self, field, np.ndarray(size, dtype=dtype, buffer=buffer, offset=offset))
+            offset += np.dtype(dtype).itemsize * size
+
+        # A new swarm starts like Bee(): wandering in the hive with no energy
+        if name is None:
+            self.x[:] = 0
+            self.y[:] = 0
+            self.energy[:] = 0
+            self.target_x[:] = -1
+            self.target_y[:] = -1
+            self.known_x[:] = -1
+            self.known_y[:] = -1
+            self.owner[:] = 0
+            self.state[:] = BeeState.WANDERING.value
+            self.inhive[:] = True
+            self.has_nectar[:] = False
+
+    @property
+    def name(self):
+        return self._shm.name if self._shm is not None else None
+
+    def close(self):
+        if self._shm is not None:
+            for field, _ in self.FIELDS:
+                setattr(self, field, None)
+            self._shm.close()
+
+    def unlink(self):
+        if self._shm is not None:
+            self._shm.unlink()
+
+
+def _step_towards(swarm, bees):
+    """
+    Move bees one cell towards their target, the same move find_path_to_* would give.
+    """
+    swarm.x[bees] += np.sign(swarm.target_x[bees] - swarm.x[bees]).astype(np.int32)
+    swarm.y[bees] += np.sign(swarm.target_y[bees] - swarm.y[bees]).astype(np.int32)
+    swarm.energy[bees] -= Bee.ENERGY_CONSUMPTION
+
+
+class _StepContext:
+    """
+    Everything the swarm transition table reads or fills in during one step.
+    """
+    def __init__(self, swarm, draws, grid, hive_pos, world_size, masks):
+        self.swarm = swarm
+        self.draws = draws
+        self.grid = grid
+        self.hive_pos = hive_pos
+        self.world_size = world_size
+        self.masks = masks
+        self.moved = []
+        self.deliveries = []
+
+
+def _is_charging(bees, ctx):
+    return ctx.swarm.inhive[bees] & (ctx.swarm.energy[bees] < Bee.MIN_ENERGY_TO_LEAVE)
+
+
+def _charge(bees, ctx):
+    ctx.swarm.energy[bees] += Bee.ENERGY_CHARGE_AMOUNT
+
+
+def _can_leave(bees, ctx):
+    return ctx.swarm.inhive[bees] & (ctx.swarm.energy[bees] >= Bee.MIN_ENERGY_TO_LEAVE)
+
+
+def _leave_hive(bees, ctx):
+    # Recruits follow the flower they heard about
+    swarm = ctx.swarm
+    swarm.x[bees] = ctx.hive_pos[0]
+    swarm.y[bees] = ctx.hive_pos[1]
+    swarm.inhive[bees] = False
+    recruits = bees[(swarm.state[bees] == BeeState.WANDERING.value) & (swarm.known_x[bees] >= 0)]
+    swarm.state[recruits] = BeeState.FOLLOWING.value
+    swarm.target_x[recruits] = swarm.known_x[recruits]
+    swarm.target_y[recruits] = swarm.known_y[recruits]
+    # Following a path uses it up, as popping path_to_flower does
+    swarm.known_x[recruits] = -1
+    swarm.known_y[recruits] = -1
+
+
+def _is_outside(bees, ctx):
+    return ~ctx.swarm.inhive[bees]
+
+
+def _is_exhausted(bees, ctx):
+    swarm = ctx.swarm
+    return ~swarm.inhive[bees] & (swarm.energy[bees] <= 0) & ~swarm.has_nectar[bees]
+
+
+def _head_home(bees, ctx):
+    ctx.swarm.target_x[bees] = ctx.hive_pos[0]
+    ctx.swarm.target_y[bees] = ctx.hive_pos[1]
+
+
+def _wander(walkers, ctx):
+    swarm, draws, grid, masks = ctx.swarm, ctx.draws, ctx.grid, ctx.masks
+    width, height = ctx.world_size
+    move = MOVES[(draws[walkers] * len(MOVES)).astype(np.int64)]
+    nx = np.clip(swarm.x[walkers] + move[:, 0], 1, width - 2)
+    ny = np.clip(swarm.y[walkers] + move[:, 1], 1, height - 2)
+    codes = grid.lookup(nx, ny)
+    free = (codes == grid.EMPTY) | (codes == PropertyType.FLOWER.value)
+    if masks is not None and not free.all():
+        # [1.2.5 Neighbour Masks] One alternative drawn from the passable moves
+        blocked = np.nonzero(~free)[0]
+        spare = (draws[walkers[blocked]] * len(MOVES)) % 1
+        choice = pick_moves(masks.lookup(swarm.x[walkers[blocked]], swarm.y[walkers[blocked]]), spare)
+        found = choice >= 0
+        blocked, choice = blocked[found], choice[found]
+        nx[blocked] = np.clip(swarm.x[walkers[blocked]] + MOVES[choice, 0], 1, width - 2)
+        ny[blocked] = np.clip(swarm.y[walkers[blocked]] + MOVES[choice, 1], 1, height - 2)
+        free[blocked] = True
+    swarm.x[walkers[free]] = nx[free]
+    swarm.y[walkers[free]] = ny[free]
+    swarm.energy[walkers] -= Bee.ENERGY_CONSUMPTION
+    ctx.moved.append(walkers[free])
+
+
+def _at_target(bees, ctx):
+    swarm = ctx.swarm
+    return (~swarm.inhive[bees] & (swarm.x[bees] == swarm.target_x[bees]) &
+            (swarm.y[bees] == swarm.target_y[bees]))
+
+
+def _follow_path(bees, ctx):
+    _step_towards(ctx.swarm, bees)
+    ctx.moved.append(bees)
+
+
+def _fly_home(returning, ctx):
+    # The bee enters the hive on the step it reaches the entrance
+    swarm = ctx.swarm
+    _step_towards(swarm, returning)
+    home = returning[(swarm.x[returning] == swarm.target_x[returning]) &
+                     (swarm.y[returning] == swarm.target_y[returning])]
+    ctx.deliveries.extend(home[swarm.has_nectar[home]].tolist())
+    swarm.inhive[home] = True
+    swarm.x[home] = 0
+    swarm.y[home] = 0
+    # Bee.step_change still spends the arrival move after resetting energy
+    swarm.energy[home] = -Bee.ENERGY_CONSUMPTION
+    swarm.state[home] = BeeState.WANDERING.value
+    ctx.moved.append(returning[~swarm.inhive[returning]])
+
+
+# [1.1.1 State Management] The Bee transition table over arrays: paths are target cells and
+# a wandering bee draws its move from draws. Flower sensing and dropping an emptied flower
+# are left out, see step_swarm
+TRANSITIONS = (
+    (ANY, _is_charging, _charge, None),
+    (BeeState.WANDERING, _can_leave, _leave_hive, None),
+    (BeeState.FOLLOWING, _can_leave, _leave_hive, None),
+    (BeeState.WANDERING, _is_exhausted, _head_home, BeeState.RETURNING),
+    (BeeState.WANDERING, _is_outside, _wander, None),
+    (BeeState.FOLLOWING, _at_target, None, BeeState.WANDERING),
+    (BeeState.FOLLOWING, _is_outside, _follow_path, None),
+    (BeeState.RETURNING, _is_outside, _fly_home, None),
+)
+MACHINE = StateMachine(TRANSITIONS)
+
+
+def step_swarm(swarm, bees, draws, grid, flower_cells, flower_nectar, hive_pos, world_size, masks=None):
+    """
+    [1.4 Swarm] Advance the bees at indices bees by one timestep, following the Bee rules
+    with array operations. Only the listed bees are read or written.
+
+    Differences from Bee: every bee wanders with VALID_MOVE, and without masks a wandering
+    bee that picks a move into an obstacle stays where it is for the step. With masks it
+    takes a passable move chosen by the unused fraction of its draw, as Bee does. The table
+    has no rows for Bee's _senses_flower and _flower_emptied: swarm bees cannot sense
+    flowers, and a following bee flies on to its flower even after another bee empties it,
+    finding out only when its claim fails on arrival.
+
+    Args:
+        swarm (SwarmArrays): State of every bee
+        bees (numpy.ndarray): Indices of the bees to advance
+        draws (numpy.ndarray): One uniform draw in [0, 1) per bee in the swarm
+        grid (DenseGrid | TiledGrid): Occupancy grid of the world
+        flower_cells (dict): Maps (x, y) of each flower cell to a flower id
+        flower_nectar (numpy.ndarray): Whether each flower id holds nectar
+        hive_pos (tuple): (x, y) of the hive entrance in the world
+        world_size (tuple): Size of the world
+        masks (NeighbourMasks): Passable moves of each cell, None to stay put on obstacles
+
+    Returns:
+        tuple: (claims, deliveries) where claims lists (bee index, flower id) for bees that
+        reached a flower holding nectar and deliveries lists bees that brought nectar home
+    """
+    ctx = _StepContext(swarm, draws, grid, hive_pos, world_size, masks)
+    MACHINE.step_arrays(swarm.state, np.asarray(bees), ctx)
+
+    # [2.1.2 Nectar collection] Bees without nectar landing on a flower that holds some
+    claims = []
+    if ctx.moved:
+        moved = np.concatenate(ctx.moved)
+        moved = moved[~swarm.has_nectar[moved]]
+        codes = grid.lookup(swarm.x[moved], swarm.y[moved])
+        for bee in moved[codes == PropertyType.FLOWER.value]:
+            flower = flower_cells.get((int(swarm.x[bee]), int(swarm.y[bee])))
+            if flower is not None and flower_nectar[flower]:
+                claims.append((int(bee), flower))
+    return claims, ctx.deliveries
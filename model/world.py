@@ -1,7 +1,13 @@
+import heapq
 from enum import Enum
+from itertools import count
 import numpy as np
 from  matplotlib.patches import Rectangle
 
+from base.base_observable import BaseObservable
+from model.grid import DenseGrid, TiledGrid
+from model.spatial_hash import SpatialHash
+
 class PropertyType(Enum):
     """
     [1.2.1 Property] Enumeration of possible property types in the world.
@@ -22,31 +28,153 @@ class Property:
         width (int): Width of the property
         height (int): Height of the property
         has_nectar (bool): Whether the property contains nectar (FLOWER = True, Others = False)
+        regen_time (int): Steps a depleted flower needs to refill, None if it never refills
     """
-    def __init__(self, type, pos, width, height, has_nectar):
+    def __init__(self, type, pos, width, height, has_nectar, regen_time=None):
         self.type = type
         self.pos = pos
         self.width = width
         self.height = height
         self.has_nectar = has_nectar
+        self.regen_time = regen_time
 
-class World:
+class World(BaseObservable):
     """
     [1.2 World] Represents the simulation world containing properties and the hive.
+    Observers are notified after every property edit and nectar change, with the box in
+    last_change, so derived caches can refresh only that area.
     
     Attributes:
         properties (list): List of Property in the world
         hive_pos (tuple): Position and size of the hive (x, y, width, height)
-        world (numpy.ndarray): 2D array representing the world grid
+        hives (list): Position and size of every hive in the world, hive_pos first
+        world (numpy.ndarray): 2D array representing the world grid, None for tiled worlds
+        grid (DenseGrid | TiledGrid): Occupancy grid holding the property type value of each cell
+        index (SpatialHash): Spatial hash of property bounding boxes
+        last_change (tuple): (x, y, width, height) of the most recent change
+        last_change_kind (str): "property" for edits, "nectar" for depletion or refill
+        time (int): Latest timestep passed to regenerate_nectar
+        nectar_flowers (dict): Insertion-ordered set of flowers currently holding nectar
+        scent (ScentField): Optional scent laid by bees, None when bees leave no scent
     """
-    def __init__(self, hive_pos, world_size):
+    def __init__(self, hive_pos, world_size, tile_size=None, grid_file=None, index_cell_size=16):
+        super().__init__()
         self.properties = []
+        self.index = SpatialHash(index_cell_size)
+        self.last_change = None
+        self.last_change_kind = None
+        self.time = 0
+        # Min-heap of (due step, sequence, flower) for depleted flowers that refill
+        self._refills = []
+        self._refill_seq = count()
+        self.nectar_flowers = {}
+        self.scent = None
         self.hive_pos = hive_pos
-        self.world = np.full(world_size, 5)  # Simple background value
+        self.hives = [hive_pos]
+        self.world_size = world_size
+        if tile_size:
+            # Huge maps: occupancy is paged in per tile and there is no dense render buffer
+            self.grid = TiledGrid(world_size, tile_size, grid_file)
+            self.world = None
+        else:
+            self.grid = DenseGrid(world_size)
+            # Simple background value, indexed [y, x] like the grid
+            self.world = np.full((world_size[1], world_size[0]), 5)
+
+    def add_hive(self, hive_pos):
+        """
+        [1.2 World] Add the hive of another colony sharing this world's flowers.
+        """
+        self.hives.append(hive_pos)
 
     def add_property(self, property):
         """
         [1.2.1 Property] Add a property to the world.
         """
         self.properties.append(property)
-        
\ No newline at end of file
+        if property.type == PropertyType.FLOWER and property.has_nectar:
+            self.nectar_flowers[property] = None
+        self.index.insert(property, property.pos[0], property.pos[1], property.width, property.height)
+        self.grid.fill_rect(property.pos[0], property.pos[1], property.width, property.height,
+                            property.type.value)
+        self._changed(property.pos[0], property.pos[1], property.width, property.height)
+
+    def remove_property(self, property):
+        """
+        [1.2.1 Property] Remove a property (e.g. a felled tree) and repaint only its area.
+        """
+        if property not in self.index:
+            return
+        self.properties.remove(property)
+        self.nectar_flowers.pop(property, None)
+        self.index.remove(property)
+        x, y = property.pos
+        width, height = property.width, property.height
+        self.grid.fill_rect(x, y, width, height, self.grid.EMPTY)
+        # Repaint the overlap with the remaining properties, keeping insertion order
+        for other in self.index.query_rect(x, y, width, height):
+            x0, y0 = max(x, other.pos[0]), max(y, other.pos[1])
+            x1 = min(x + width, other.pos[0] + other.width)
+            y1 = min(y + height, other.pos[1] + other.height)
+            self.grid.fill_rect(x0, y0, x1 - x0, y1 - y0, other.type.value)
+        self._changed(x, y, width, height)
+
+    def query_rect(self, x, y, width, height):
+        """
+        [1.2.3 Spatial Hash] Properties overlapping the rectangle, in insertion order.
+        """
+        return self.index.query_rect(x, y, width, height)
+
+    def properties_at(self, pos):
+        """
+        [1.2.3 Spatial Hash] Properties covering the cell at pos, in insertion order.
+        """
+        return self.index.query_point(pos[0], pos[1])
+
+    def deplete_flower(self, flower):
+        """
+        [1.2.4 Nectar regeneration] Empty a flower and schedule its refill if it regenerates.
+        """
+        flower.has_nectar = False
+        self.nectar_flowers.pop(flower, None)
+        if flower.regen_time is not None:
+            heapq.heappush(self._refills, (self.time + flower.regen_time, next(self._refill_seq), flower))
+        self._changed(flower.pos[0], flower.pos[1], flower.width, flower.height, "nectar")
+
+    def regenerate_nectar(self, t):
+        """
+        [1.2.4 Nectar regeneration] Refill the flowers due at timestep t.
+        Only due flowers are popped, so still-empty flowers cost nothing per step.
+
+        Returns:
+            list: Flowers refilled at this step
+        """
+        self.time = t
+        refilled = []
+        while self._refills and self._refills[0][0] <= t:
+            _, _, flower = heapq.heappop(self._refills)
+            # Flowers removed from the world while empty stay removed
+            if flower in self.index and not flower.has_nectar:
+                flower.has_nectar = True
+                self.nectar_flowers[flower] = None
+                refilled.append(flower)
+                self._changed(flower.pos[0], flower.pos[1], flower.width, flower.height, "nectar")
+        return refilled
+
+    @property
+    def nectar_count(self):
+        """
+        [1.2.4 Nectar regeneration] Number of flowers currently holding nectar.
+        """
+        return len(self.nectar_flowers)
+
+    def _changed(self, x, y, width, height, kind="property"):
+        self.last_change = (x, y, width, height)
+        self.last_change_kind = kind
+        self.notify()
+
+    def is_empty(self, pos):
+        """
+        [1.2.2 Occupancy Grid] Whether no property covers the cell at pos.
+        """
+        return self.grid.get(pos[0], pos[1]) == self.grid.EMPTY
@@ -0,0 +1,43 @@
+import argparse
+import json
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from utils.benchmark import compare, run_suite
+
+# Measure throughput and memory over a matrix of generated maps
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the bee simulation.')
+    parser.add_argument('-c', '--config', type=str, default='benchmark.json',
+                        help='Benchmark matrix and regression thresholds JSON')
+    parser.add_argument('-o', '--output', type=str, default='benchmark_results.json', help='Results JSON')
+    parser.add_argument('-b', '--baseline', type=str, help='Results JSON of an earlier run to compare against')
+    args = parser.parse_args()
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config) as f:
+            config = json.load(f)
+
+    try:
+        report = run_suite(config)
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Benchmark results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, report["config"]["thresholds"])
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
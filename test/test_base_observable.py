@@ -0,0 +1,84 @@
+import gc
+import unittest
+import weakref
+
+from base.base_observable import BaseObservable
+from base.observer import Observer
+
+
+class Recorder(Observer):
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def update(self, observable) -> None:
+        self.log.append(self.name)
+
+
+class TestBaseObservable(unittest.TestCase):
+    """
+    Test suite for the weak-reference observer registry.
+
+    This test suite verifies:
+    - Attach and detach, including duplicates and unknown observers
+    - Notification in attach order
+    - Observers dropped once nothing else references them
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.subject = BaseObservable()
+        self.log = []
+        self.first = Recorder(self.log, "first")
+        self.second = Recorder(self.log, "second")
+
+    def test_notify_in_attach_order(self):
+        """Test observers are notified once each, in the order they were attached"""
+        self.subject.attach(self.second)
+        self.subject.attach(self.first)
+        self.subject.attach(self.second)
+        self.subject.notify()
+        self.assertEqual(self.log, ["second", "first"])
+        self.assertEqual(self.subject.observers, [self.second, self.first])
+
+    def test_detach(self):
+        """Test detached observers are not notified and unknown ones are ignored"""
+        self.subject.attach(self.first)
+        self.subject.attach(self.second)
+        self.subject.detach(self.first)
+        self.subject.detach(Recorder(self.log, "unknown"))
+        self.subject.notify()
+        self.assertEqual(self.log, ["second"])
+
+    def test_detach_all(self):
+        """Test detach_all drops every observer"""
+        self.subject.attach(self.first)
+        self.subject.detach_all()
+        self.subject.notify()
+        self.assertEqual(self.log, [])
+
+    def test_observer_collected(self):
+        """Test an observer only referenced by its subject is dropped"""
+        self.subject.attach(self.first)
+        self.subject.attach(self.second)
+        self.second = None
+        gc.collect()
+        self.assertEqual(self.subject.observers, [self.first])
+        self.subject.notify()
+        self.assertEqual(self.log, ["first"])
+
+    def test_subject_not_kept_alive(self):
+        """Test observing each other does not keep two objects alive"""
+        class Node(BaseObservable, Observer):
+            def update(self, observable) -> None:
+                pass
+        a, b = Node(), Node()
+        a.attach(b)
+        b.attach(a)
+        refs = weakref.ref(a), weakref.ref(b)
+        del a, b
+        self.assertEqual([ref() for ref in refs], [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
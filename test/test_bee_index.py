@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock
+from model.bee_index import BeeIndex
+
+
+class TestBeeIndex(unittest.TestCase):
+    """
+    [1.7 Bee Index] Test suite for the cell-linked spatial hash of bees.
+
+    This test suite verifies:
+    - Cell occupancy counts as bees move
+    - Radius queries
+    - Rebuilding from a list of bees
+    """
+
+    def _bee(self, ID, pos=(0, 0), inhive=False):
+        bee = Mock(ID=ID, inhive=inhive)
+        bee.get_pos.return_value = pos
+        return bee
+
+    def test_move_and_count(self):
+        """[1.7 Bee Index] Test cell counts follow bees as they move and leave"""
+        index = BeeIndex(cell_size=4)
+        a, b = self._bee(1), self._bee(2)
+        index.move(a, (5, 5))
+        index.move(b, (5, 5))
+        self.assertEqual(index.count((5, 5)), 2)
+        index.move(a, (9, 5))
+        self.assertEqual(index.count((5, 5)), 1)
+        self.assertEqual(index.count((9, 5)), 1)
+        index.remove(b)
+        index.remove(b)
+        self.assertEqual(index.count((5, 5)), 0)
+        self.assertEqual(len(index), 1)
+        self.assertNotIn((1, 1), index.buckets)
+
+    def test_query_radius(self):
+        """[1.7 Bee Index] Test radius queries return the bees in range in ID order"""
+        index = BeeIndex(cell_size=4)
+        bees = [self._bee(ID) for ID in (3, 1, 2, 4)]
+        for bee, pos in zip(bees, [(10, 10), (12, 8), (7, 13), (14, 10)]):
+            index.move(bee, pos)
+        found = index.query_radius((10, 10), 3)
+        self.assertEqual([bee.ID for bee in found], [1, 2, 3])
+        self.assertEqual(index.query_radius((30, 30), 2), [])
+
+    def test_rebuild_skips_bees_in_hive(self):
+        """[1.7 Bee Index] Test rebuilding indexes only the bees outside the hive"""
+        index = BeeIndex()
+        bees = [self._bee(1, (3, 3)), self._bee(2, (3, 3), inhive=True), self._bee(3, (3, 3))]
+        index.rebuild(bees)
+        self.assertEqual(index.count((3, 3)), 2)
+        self.assertNotIn(bees[1], index)
+
+
+if __name__ == '__main__':
+    unittest.main()
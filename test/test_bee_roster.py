@@ -0,0 +1,57 @@
+import unittest
+from model.bee_roster import BeeRoster
+from model.buzzness import Bee, BeeState
+
+
+class TestBeeRoster(unittest.TestCase):
+    """
+    [1.5 Bee Roster] Test suite for the BeeRoster class.
+
+    This test suite verifies:
+    - Bees indexed by state, by hive and by ID
+    - Sets following state and hive transitions
+    - Removing bees
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.bees = [Bee(i + 1, (0, 0), (15, 15), (40, 40), (50, 50)) for i in range(3)]
+        self.roster = BeeRoster(self.bees)
+
+    def test_initial_sets(self):
+        """[1.5 Bee Roster] Test new bees are wandering in the hive and found by ID"""
+        self.assertEqual(len(self.roster), 3)
+        self.assertEqual(self.roster.in_state(BeeState.WANDERING), self.bees)
+        self.assertEqual(self.roster.in_hive(), self.bees)
+        self.assertEqual(self.roster.outside(), [])
+        self.assertIs(self.roster.get(2), self.bees[1])
+        self.assertIsNone(self.roster.get(9))
+
+    def test_transitions(self):
+        """[1.5 Bee Roster] Test changing a bee's state or hive flag moves it between sets"""
+        bee = self.bees[1]
+        bee.state = BeeState.FOLLOWING
+        bee.inhive = False
+        self.assertEqual(self.roster.in_state(BeeState.FOLLOWING), [bee])
+        self.assertEqual(self.roster.count(BeeState.WANDERING), 2)
+        self.assertEqual(self.roster.outside(), [bee])
+        self.assertNotIn(bee, self.roster.in_hive())
+
+        bee.set_nectar_found()
+        self.assertEqual(self.roster.in_state(BeeState.RETURNING), [bee])
+        self.assertEqual(self.roster.count(BeeState.FOLLOWING), 0)
+
+    def test_remove(self):
+        """[1.5 Bee Roster] Test a removed bee leaves every set and stops reporting"""
+        bee = self.bees[0]
+        self.roster.remove(bee)
+        self.assertNotIn(bee, self.roster)
+        self.assertIsNone(bee.roster)
+        bee.inhive = False
+        self.assertEqual(self.roster.outside(), [])
+        self.assertEqual(self.roster.in_state(BeeState.WANDERING), self.bees[1:])
+        self.roster.remove(bee)
+
+
+if __name__ == '__main__':
+    unittest.main()
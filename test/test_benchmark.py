@@ -0,0 +1,73 @@
+import unittest
+from utils.benchmark import DEFAULTS, METRICS, compare, generate_map, run_suite
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    [2.10 Benchmark] Test suite for the throughput benchmark suite.
+
+    This test suite verifies:
+    - Generated maps reaching their property density and keeping the hive clear
+    - Every metric being measured for each case of the matrix
+    - Regressions beyond a threshold being reported in the right direction
+    - Partial threshold overrides keeping the other defaults, and unknown metrics being rejected
+    """
+
+    def test_generate_map(self):
+        """[2.10 Benchmark] Test a generated map covers the density and leaves the hive clear"""
+        layout = generate_map(40, 0.1, seed=1)
+        self.assertEqual(layout["world"], {"width": 40, "height": 40})
+        items = [item for items in layout["properties"].values() for item in items]
+        covered = sum(item["width"] * item["height"] for item in items)
+        self.assertGreaterEqual(covered, 160)
+        for item in items:
+            self.assertFalse(item["x"] <= 15 < item["x"] + item["width"] and
+                             item["y"] <= 15 < item["y"] + item["height"])
+        self.assertEqual(generate_map(40, 0.1, seed=1), layout)
+
+    def test_run_suite(self):
+        """[2.10 Benchmark] Test each case of the matrix gets every metric"""
+        lines = []
+        report = run_suite({"bee_counts": [2, 3], "map_sizes": [30], "densities": [0.05], "steps": 3,
+                            "collision_checks": 50, "pathfinding_calls": 4, "render_frames": 1},
+                           log=lines.append)
+        self.assertEqual([(case["bees"], case["map_size"]) for case in report["results"]], [(2, 30), (3, 30)])
+        for case in report["results"]:
+            for metric in METRICS:
+                self.assertGreater(case[metric], 0)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(report["config"]["thresholds"], DEFAULTS["thresholds"])
+
+    def test_partial_thresholds(self):
+        """[2.10 Benchmark] Test overriding one threshold keeps the defaults of the others"""
+        report = run_suite({"bee_counts": [1], "map_sizes": [20], "densities": [0.05], "steps": 1,
+                            "collision_checks": 5, "pathfinding_calls": 1, "render_frames": 1,
+                            "thresholds": {"steps_per_sec": 0.5}}, log=lambda line: None)
+        self.assertEqual(report["config"]["thresholds"], dict(DEFAULTS["thresholds"], steps_per_sec=0.5))
+
+    def test_unknown_threshold(self):
+        """[2.10 Benchmark] Test a threshold for an unknown metric is rejected before measuring"""
+        with self.assertRaises(ValueError):
+            run_suite({"thresholds": {"steps_per_second": 0.1}}, log=lambda line: None)
+        with self.assertRaises(ValueError):
+            compare({"results": []}, {"results": []}, {"fps": 0.1})
+
+    def test_compare(self):
+        """[2.10 Benchmark] Test slower throughput and higher memory beyond the threshold regress"""
+        case = {"bees": 2, "map_size": 30, "density": 0.05}
+        baseline = {"results": [dict(case, steps_per_sec=100.0, peak_memory_bytes=1000)]}
+        thresholds = {"steps_per_sec": 0.2, "peak_memory_bytes": 0.2}
+        faster = {"results": [dict(case, steps_per_sec=150.0, peak_memory_bytes=900)]}
+        self.assertEqual(compare(faster, baseline, thresholds), [])
+        within = {"results": [dict(case, steps_per_sec=85.0, peak_memory_bytes=1100)]}
+        self.assertEqual(compare(within, baseline, thresholds), [])
+        worse = {"results": [dict(case, steps_per_sec=70.0, peak_memory_bytes=1300)]}
+        regressions = compare(worse, baseline, thresholds)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("steps_per_sec", regressions[0])
+        self.assertIn("peak_memory_bytes", regressions[1])
+        self.assertEqual(compare(worse, {"results": []}, thresholds), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from model.buzzness import Bee, BeeState
 from utils.constants import VALID_MOVE, MOVE_FORWARD
 
@@ -68,6 +68,46 @@ class TestBee(unittest.TestCase):
         self.bee.step_change()
         self.assertEqual(self.bee.energy, 25)
 
+    def test_charging_steps(self):
+        """[1.1.3 Energy Management] Test bulk charging matches charging one step at a time"""
+        self.bee.energy = 10
+        self.assertEqual(self.bee.charging_steps(), 2)
+        self.bee.charge_in_bulk(2)
+        self.assertEqual(self.bee.energy, 60)
+        self.assertEqual(self.bee.charging_steps(), 0)
+
+        self.bee.inhive = False
+        self.bee.energy = 0
+        self.assertEqual(self.bee.charging_steps(), 0)
+
+    def test_fast_forward_returning(self):
+        """[1.1.5 Fast-forward] Test a bee carrying nectar skips all but the last move home"""
+        world = Mock()
+        world.is_empty.return_value = False
+        clock = Mock(now=5)
+        self.bee.inhive = False
+        self.bee.pos = (20, 20)
+        self.bee.energy = 30
+        self.bee.hasNectar = True
+        self.bee.state = BeeState.RETURNING
+        self.bee.path_to_hive = [(-1, -1)] * 5
+
+        self.assertEqual(self.bee.fast_forward_steps(world), 4)
+        self.bee.begin_fast_forward(clock, 4)
+        self.assertEqual(self.bee.energy, 26)
+        self.assertEqual(self.bee.get_pos(), (19, 19))
+        clock.now = 7
+        self.assertEqual(self.bee.get_pos(), (17, 17))
+        self.bee.finish_fast_forward()
+        self.assertEqual(self.bee.pos, (16, 16))
+        self.assertEqual(self.bee.path_to_hive, [(-1, -1)])
+
+        # Without nectar, cells holding a property end the stretch
+        self.bee.hasNectar = False
+        self.bee.state = BeeState.FOLLOWING
+        self.bee.path_to_flower = [(1, 1)] * 3
+        self.assertEqual(self.bee.fast_forward_steps(world), 0)
+
     def test_getters_setters(self):
         """[1.1 Bee] Test getter and setter methods"""
         self.assertEqual(self.bee.get_pos(), (0, 0))
@@ -218,6 +258,95 @@ class TestBee(unittest.TestCase):
         self.assertTrue(self.bee.inhive)
         self.assertEqual(self.bee.pos, (0, 0))
 
+    def test_leave_hive_checks_entrance_when_crowding(self):
+        """[1.7 Bee Index] Test only a crowded world is asked about the hive entrance"""
+        notify = Mock()
+        self.bee.notify = notify
+        self.assertTrue(self.bee._leave_hive())
+        notify.assert_not_called()
+
+        # A full entrance keeps the bee inside and leaves no flag for its next move
+        self.bee.crowding = True
+        self.bee.inhive = True
+        self.bee.pos = (0, 0)
+        notify.side_effect = lambda: (self.bee.wait(), self.bee.step_back())
+        self.assertFalse(self.bee._leave_hive())
+        self.assertTrue(self.bee.inhive)
+        self.assertEqual(self.bee.pos, (0, 0))
+        self.assertFalse(self.bee._move_blocked)
+        self.assertFalse(self.bee._move_invalid)
+
+        # A property at the entrance does not block leaving, and its flag is cleared too
+        notify.side_effect = self.bee.step_back
+        self.assertTrue(self.bee._leave_hive())
+        self.assertFalse(self.bee.inhive)
+        self.assertFalse(self.bee._move_invalid)
+
+
+    def _walled_world(self, gaps=()):
+        from controller.world_controller import WorldController
+        from model.world import World, PropertyType, Property
+        world = World(self.hive_pos, self.world_size)
+        for x in range(9, 12):
+            for y in range(9, 12):
+                if (x, y) != (10, 10) and (x, y) not in gaps:
+                    world.add_property(Property(PropertyType.TREE, (x, y), 1, 1, False))
+        # Observers are held weakly, so the test keeps the controller alive
+        self.world_controller = WorldController(world, self.world_size)
+        self.bee.attach(self.world_controller)
+        self.bee.neighbour_masks = self.world_controller.neighbour_masks
+        self.bee.inhive = False
+        self.bee.pos = (10, 10)
+        self.bee.energy = 20
+
+    def test_alternative_move_uses_masks(self):
+        """[1.2.5 Neighbour Masks] Test a blocked bee takes the only passable move in one attempt"""
+        self._walled_world(gaps=[(9, 11)])
+        notify = Mock(wraps=self.bee.notify)
+        self.bee.notify = notify
+        self.assertTrue(self.bee._execute_move((1, 0)))
+        self.assertEqual(self.bee.pos, (9, 11))
+        self.assertEqual(notify.call_count, 2)
+        self.assertEqual(self.bee.energy, 19)
+
+    def test_boxed_in_bee_stays_put(self):
+        """[1.2.5 Neighbour Masks] Test a bee with no passable neighbour stays without retrying"""
+        self._walled_world()
+        notify = Mock(wraps=self.bee.notify)
+        self.bee.notify = notify
+        self.assertFalse(self.bee._execute_move((1, 0)))
+        self.assertEqual(self.bee.pos, (10, 10))
+        self.assertEqual(notify.call_count, 1)
+        self.assertEqual(self.bee.energy, 19)
+
+    def test_alternative_move_without_masks_is_bounded(self):
+        """[1.1.2 Movement] Test each alternative move is tried at most once without masks"""
+        self._walled_world()
+        self.bee.neighbour_masks = None
+        self.assertFalse(self.bee._execute_move((1, 0)))
+        self.assertEqual(self.bee.pos, (10, 10))
+        self.assertEqual(self.bee.energy, 20 - len(VALID_MOVE))
+
+    def test_wandering_bee_senses_flower(self):
+        """[1.1.4 Path finding] Test a wandering bee heads for a flower within sensing range"""
+        from model.flower_field import FlowerField
+        from model.world import World, PropertyType, Property
+        world = World(self.hive_pos, self.world_size)
+        world.add_property(Property(PropertyType.FLOWER, (14, 12), 1, 1, True))
+        self.bee.flower_field = FlowerField(world, radius=5)
+        self.bee.inhive = False
+        self.bee.pos = (10, 10)
+        self.bee.energy = 20
+
+        self.assertEqual(self.bee.machine.step(self.bee), (1, 1))
+        self.assertEqual(self.bee.state, BeeState.FOLLOWING)
+        self.assertEqual(self.bee.path_to_flower, [(1, 1), (1, 0), (1, 0)])
+
+        # Out of range: keep wandering
+        self.bee.state = BeeState.WANDERING
+        self.bee.pos = (30, 30)
+        self.bee.machine.step(self.bee)
+        self.assertEqual(self.bee.state, BeeState.WANDERING)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import Mock
+from controller.colony_controller import ColonyController
+from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.world_controller import WorldController
+from model.buzzness import Bee, BeeState
+from model.colony import Colony
+from model.hive import Hive
+from model.world import World
+
+
+class TestColony(unittest.TestCase):
+    """
+    [1.6 Colony] Test suite for several colonies sharing one world.
+
+    This test suite verifies:
+    - Membership of bees in their colony
+    - Nectar being stored in the hive of the delivering bee's colony
+    - Paths only being shared within a colony
+    - Colony controllers managing only their own colony
+    """
+
+    def setUp(self):
+        """Initialize two colonies on one world"""
+        self.world = World((15, 15, 2, 2), (50, 50))
+        self.world.add_hive((35, 35, 2, 2))
+        self.world_controller = WorldController(self.world, share_radius=50)
+        self.colonies = []
+        for number, pos in enumerate(self.world.hives, start=1):
+            hive = Hive((5, 5))
+            self.colonies.append(Colony(number, pos, hive, HiveController(hive, self.world)))
+        self.bees = []
+        for colony in self.colonies:
+            for i in range(2):
+                bee = Bee(len(self.bees) + 1, (0, 0), colony.hive_pos[:2], (5, 5), (50, 50))
+                self._setup(bee, colony)
+                colony.bees.append(bee)
+                self.bees.append(bee)
+        self.simulation = SimulationController(self.world, self.world_controller,
+                                               [colony.hive_controller for colony in self.colonies], self.bees)
+
+    def _setup(self, bee, colony):
+        bee.attach(self.world_controller)
+        bee.attach(colony.hive_controller)
+        colony.hive_controller.attach(bee)
+        self.world_controller.attach(bee)
+
+    def test_membership(self):
+        """[1.6 Colony] Test a bee belongs only to its own colony"""
+        first, second = self.colonies
+        self.assertEqual(first.name, "Colony 1")
+        self.assertIn(self.bees[0], first)
+        self.assertNotIn(self.bees[0], second)
+        self.assertIn(self.bees[3], second)
+
+    def test_world_hives(self):
+        """[1.6 Colony] Test every hive is listed by the world"""
+        self.assertEqual(self.world.hives, [(15, 15, 2, 2), (35, 35, 2, 2)])
+
+    def test_nectar_per_colony(self):
+        """[1.6 Colony] Test nectar is counted per colony and summed by the simulation"""
+        self.colonies[1].hive_controller.store_nectar()
+        self.assertEqual(self.colonies[0].nectar_delivered, 0)
+        self.assertEqual(self.colonies[1].nectar_delivered, 1)
+        self.assertEqual(self.simulation.nectar_delivered(), 1)
+
+    def test_paths_shared_within_colony(self):
+        """[1.6 Colony] Test a path to a flower only reaches bees of the same hive"""
+        sender = self.bees[0]
+        sender.state = BeeState.RETURNING
+        sender.path_to_flower = [(20, 20), (21, 21)]
+        for bee in self.bees:
+            bee.pos = (25, 25)
+            bee.inhive = False
+            bee.rng = Mock(uniform=Mock(return_value=0.9))
+            self.world_controller.track(bee)
+        self.assertEqual(self.world_controller.share_paths(), 1)
+        self.assertEqual(self.bees[1].path_to_flower, [(20, 20), (21, 21)])
+        self.assertEqual(self.bees[2].path_to_flower, [])
+        self.assertEqual(self.bees[3].path_to_flower, [])
+
+    def test_colony_controller_scope(self):
+        """[2.8 Colony Controller] Test each colony controller only retires and raises its own bees"""
+        first, second = self.colonies
+        controller = ColonyController(self.simulation, lambda bee: self._setup(bee, second),
+                                      lifespan=1, brood_cost=1, brood_time=0, seed=1, colony=second)
+        second.hive_controller.store_nectar()
+        controller.step(1)
+        self.assertEqual(controller.deaths, 2)
+        self.assertEqual([bee.ID for bee in first.bees], [1, 2])
+        self.assertEqual(len(second.bees), 1)
+        new_bee = second.bees[0]
+        self.assertEqual(new_bee.ID, 5)
+        self.assertEqual(new_bee.hive_pos, (35, 35))
+        self.assertIn(new_bee, second)
+        self.assertEqual(len(self.simulation.bees), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
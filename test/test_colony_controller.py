@@ -0,0 +1,166 @@
+import unittest
+from controller.colony_controller import BeePool, ColonyController
+from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.world_controller import WorldController
+from model.buzzness import Bee, BeeState
+from model.exploration import ExplorationMemory
+from model.hive import Hive
+from model.world import World
+
+
+class TestColonyController(unittest.TestCase):
+    """
+    [2.8 Colony Controller] Test suite for the ColonyController and BeePool classes.
+
+    This test suite verifies:
+    - Bees dying of age or mortality and being detached from the controllers
+    - Brood laid from delivered nectar and emerging as new bees
+    - Retired bees being reused from the pool
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.world = World((15, 15, 2, 2), (50, 50))
+        self.world_controller = WorldController(self.world)
+        self.hive_controller = HiveController(Hive((5, 5)))
+        self.bees = []
+        for i in range(3):
+            bee = Bee(i + 1, (0, 0), (15, 15), (5, 5), (50, 50))
+            self._setup(bee)
+            self.bees.append(bee)
+        self.simulation = SimulationController(self.world, self.world_controller, self.hive_controller, self.bees)
+
+    def _setup(self, bee):
+        bee.attach(self.world_controller)
+        bee.attach(self.hive_controller)
+        self.hive_controller.attach(bee)
+        self.world_controller.attach(bee)
+
+    def _colony(self, **kwargs):
+        return ColonyController(self.simulation, self._setup, seed=1, **kwargs)
+
+    def test_lifespan(self):
+        """[2.8 Colony Controller] Test bees in the hive die at their lifespan and are detached"""
+        colony = self._colony(lifespan=5)
+        colony.step(4)
+        self.assertEqual(len(self.simulation.bees), 3)
+        colony.step(5)
+        self.assertEqual(self.simulation.bees, [])
+        self.assertEqual(self.simulation.active_bees(), [])
+        self.assertEqual(colony.deaths, 3)
+        self.assertEqual(self.hive_controller.observers, [])
+        self.assertEqual(self.world_controller.observers, [])
+        self.assertEqual(len(colony.pool), 3)
+        for bee in colony.pool.free:
+            self.assertEqual(bee.observers, [])
+
+    def test_parked_bees_age_and_die(self):
+        """[2.8 Colony Controller] Test bees parked while they charge age and die in a default run"""
+        colony = self._colony(lifespan=2)
+        self.simulation.step(1)
+        colony.step(1)
+        self.assertEqual(self.simulation.active_bees(), [])
+        self.assertEqual(len(self.simulation.scheduler), 3)
+        self.simulation.step(2)
+        colony.step(2)
+        self.assertEqual(colony.deaths, 3)
+        self.assertEqual(self.simulation.bees, [])
+        self.assertEqual(len(self.simulation.scheduler), 0)
+        # Dead bees are never woken up again
+        for t in range(3, 8):
+            self.simulation.step(t)
+            colony.step(t)
+        self.assertEqual(self.simulation.active_bees(), [])
+
+    def test_bees_outside_survive(self):
+        """[2.8 Colony Controller] Test bees out in the world or carrying nectar do not die"""
+        self.bees[0].inhive = False
+        self.bees[1].hasNectar = True
+        colony = self._colony(lifespan=1)
+        colony.step(10)
+        self.assertEqual([bee.ID for bee in self.simulation.bees], [1, 2])
+
+    def test_mortality(self):
+        """[2.8 Colony Controller] Test a mortality of 1 kills every bee in the hive"""
+        colony = self._colony(mortality=1.0)
+        colony.step(1)
+        self.assertEqual(colony.deaths, 3)
+
+    def test_brood(self):
+        """[2.8 Colony Controller] Test delivered nectar lays eggs that emerge after brood_time"""
+        colony = self._colony(brood_cost=2, brood_time=3)
+        for _ in range(5):
+            self.hive_controller.store_nectar()
+        colony.step(1)
+        self.assertEqual(colony.brood, [4, 4])
+        colony.step(3)
+        self.assertEqual(len(self.simulation.bees), 3)
+        colony.step(4)
+        self.assertEqual([bee.ID for bee in self.simulation.bees], [1, 2, 3, 4, 5])
+        self.assertEqual(colony.births, 2)
+        new_bee = self.simulation.bees[-1]
+        self.assertTrue(new_bee.inhive)
+        self.assertEqual(new_bee.born, 4)
+        self.assertIn(new_bee, self.simulation.active_bees())
+        self.assertIn(new_bee, self.hive_controller.observers)
+        self.assertIn(self.world_controller, new_bee.observers)
+
+    def test_max_bees(self):
+        """[2.8 Colony Controller] Test eggs wait in the brood while the colony is full"""
+        colony = self._colony(brood_cost=1, brood_time=0, max_bees=4)
+        self.hive_controller.store_nectar()
+        self.hive_controller.store_nectar()
+        colony.step(1)
+        self.assertEqual(len(self.simulation.bees), 4)
+        self.assertEqual(len(colony.brood), 1)
+
+    def test_dead_bee_reused(self):
+        """[1.1.8 Lifecycle] Test a new bee reuses a dead bee object with fresh state"""
+        colony = self._colony(lifespan=2, brood_cost=1, brood_time=0)
+        dead = self.bees[0]
+        dead.energy = 30
+        dead.path_to_flower = [(1, 1)]
+        dead.state = BeeState.FOLLOWING
+        dead.memory = ExplorationMemory((50, 50))
+        dead.memory.add((3, 3))
+        self.simulation.remove_bee(self.bees[2])
+        self.simulation.remove_bee(self.bees[1])
+        colony.step(2)
+        self.assertEqual(self.simulation.bees, [])
+
+        self.hive_controller.store_nectar()
+        colony.step(3)
+        self.assertEqual(self.simulation.bees, [dead])
+        self.assertEqual(dead.ID, 4)
+        self.assertEqual(dead.energy, 0)
+        self.assertEqual(dead.path_to_flower, [])
+        self.assertEqual(dead.state, BeeState.WANDERING)
+        self.assertFalse(dead.memory.seen((3, 3)))
+        self.assertEqual(len(colony.pool), 0)
+
+
+class TestBeePool(unittest.TestCase):
+    """
+    [1.1.8 Lifecycle] Test suite for the BeePool class.
+    """
+
+    def test_acquire_new(self):
+        """[1.1.8 Lifecycle] Test an empty pool creates a bee"""
+        bee = BeePool().acquire(7, 3, (15, 15), (5, 5), (50, 50))
+        self.assertEqual(bee.ID, 7)
+        self.assertEqual(bee.born, 3)
+
+    def test_release_acquire(self):
+        """[1.1.8 Lifecycle] Test a released bee is handed out again"""
+        pool = BeePool()
+        bee = Bee(1, (4, 4), (15, 15), (5, 5), (50, 50))
+        bee.inhive = False
+        pool.release(bee)
+        self.assertIs(pool.acquire(2, 0, (15, 15), (5, 5), (50, 50)), bee)
+        self.assertTrue(bee.inhive)
+        self.assertEqual(bee.pos, (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from controller.domain_controller import DomainController, strip_of
+from controller.hive_controller import HiveController
+from model.hive import Hive
+from model.world import World, PropertyType, Property
+
+
+class TestDomainController(unittest.TestCase):
+    """
+    [2.7 Domain Decomposition] Test suite for the multi-process strip decomposition.
+
+    This test suite verifies:
+    - Strip ownership of bees
+    - Identical results for any number of worker processes
+    - Every bee owned by exactly one strip
+    """
+
+    def _run(self, workers, steps=120, tile_size=None):
+        world = World((15, 15, 2, 2), (50, 50), tile_size=tile_size)
+        for x in range(16, 40, 3):
+            for y in range(5, 45, 4):
+                world.add_property(Property(PropertyType.FLOWER, (x, y), 1, 1, True))
+        world.add_property(Property(PropertyType.TREE, (20, 10), 3, 3, False))
+        hive_controller = HiveController(Hive((5, 5)))
+        domain = DomainController(world, hive_controller, 40, workers=workers, seed=7)
+        try:
+            for t in range(steps):
+                domain.step(t)
+            owners = domain.swarm.owner.copy()
+            np.testing.assert_array_equal(owners, strip_of(domain.swarm.x, domain.swarm.inhive,
+                                                           15, 50, workers))
+            result = (domain.swarm.x.copy(), domain.swarm.y.copy(), domain.swarm.energy.copy(),
+                      domain.nectar_collected, hive_controller.nectar_delivered)
+        finally:
+            domain.close()
+            world.grid.close()
+        return result, owners
+
+    def test_strip_of(self):
+        """[2.7 Domain Decomposition] Test bees belong to the strip holding their x, and bees in the hive to the strip of the hive"""
+        xs = np.array([0, 24, 25, 49, 30])
+        inhive = np.array([False, False, False, False, True])
+        self.assertEqual(strip_of(xs, inhive, 10, 50, 2).tolist(), [0, 0, 1, 1, 0])
+
+    def test_results_independent_of_workers(self):
+        """[2.7 Domain Decomposition] Test one and two worker processes give the same bees, nectar and deliveries"""
+        single, _ = self._run(1)
+        double, owners = self._run(2)
+        for a, b in zip(single[:3], double[:3]):
+            np.testing.assert_array_equal(a, b)
+        self.assertEqual(single[3:], double[3:])
+        self.assertGreater(single[3], 0)
+        self.assertEqual(set(owners.tolist()), {0, 1})
+
+    def test_tiled_world(self):
+        """[2.7 Domain Decomposition] Test a tiled world gives the same results as a dense one"""
+        dense, _ = self._run(2, steps=60)
+        tiled, _ = self._run(2, steps=60, tile_size=16)
+        for a, b in zip(dense[:3], tiled[:3]):
+            np.testing.assert_array_equal(a, b)
+
+    def test_scale_world(self):
+        """[2.7 Domain Decomposition] Test 10^5 bees step on a tiled 10000x10000 world"""
+        world = World((5000, 5000, 2, 2), (10000, 10000), tile_size=256)
+        world.add_property(Property(PropertyType.FLOWER, (5003, 5003), 2, 2, True))
+        hive_controller = HiveController(Hive((40, 40)))
+        domain = DomainController(world, hive_controller, 10 ** 5, workers=2, seed=7)
+        try:
+            for t in range(3):
+                domain.step(t)
+            outside = ~domain.swarm.inhive
+            self.assertGreater(outside.sum(), 0)
+            self.assertTrue(((domain.swarm.x[outside] >= 0) & (domain.swarm.x[outside] < 10000)).all())
+        finally:
+            domain.close()
+            world.grid.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from base.event_batch import EventBatch
+
+
+class TestEventBatch(unittest.TestCase):
+    """
+    Test suite for the EventBatch class.
+
+    This test suite verifies:
+    - One call per subscriber and batch
+    - Ordering of subjects, subscribers and topics
+    - Subjects queued during delivery going to the next batch
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.events = EventBatch()
+        self.log = []
+
+    def test_batch_order(self):
+        """Test subjects are delivered once each, in the order they were queued"""
+        self.events.subscribe("moves", lambda batch: self.log.append(("a", batch)))
+        self.events.subscribe("moves", lambda batch: self.log.append(("b", batch)))
+        for subject in (3, 1, 3, 2):
+            self.events.queue("moves", subject)
+        self.assertEqual(self.events.pending("moves"), 3)
+        self.assertEqual(self.events.flush("moves"), 3)
+        self.assertEqual(self.log, [("a", [3, 1, 2]), ("b", [3, 1, 2])])
+        self.assertEqual(self.events.pending("moves"), 0)
+
+    def test_topic_order(self):
+        """Test flush delivers topics in the order they were first subscribed"""
+        self.events.subscribe("moves", lambda batch: self.log.append("moves"))
+        self.events.subscribe("arrivals", lambda batch: self.log.append("arrivals"))
+        self.events.queue("arrivals", 1)
+        self.events.queue("moves", 1)
+        self.events.flush()
+        self.assertEqual(self.log, ["moves", "arrivals"])
+
+    def test_empty_batch_not_delivered(self):
+        """Test subscribers are not called without events"""
+        self.events.subscribe("moves", self.log.append)
+        self.assertEqual(self.events.flush(), 0)
+        self.assertEqual(self.log, [])
+
+    def test_queue_during_delivery(self):
+        """Test subjects queued by a handler wait for the next flush"""
+        def handler(batch):
+            self.log.append(batch)
+            self.events.queue("moves", "again")
+        self.events.subscribe("moves", handler)
+        self.events.queue("moves", "first")
+        self.events.flush("moves")
+        self.events.flush("moves")
+        self.assertEqual(self.log, [["first"], ["again"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
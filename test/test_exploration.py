@@ -0,0 +1,62 @@
+import unittest
+from model.buzzness import Bee
+from model.exploration import ExplorationMemory
+from utils.constants import VALID_MOVE
+
+
+class TestExplorationMemory(unittest.TestCase):
+    """
+    [1.1.7 Exploration Memory] Test suite for the per-bee visited-cell memory.
+
+    This test suite verifies:
+    - Exact bitsets for small worlds and bounded hashed sets for huge ones
+    - Old visits are forgotten after two generations
+    - Wandering bees prefer unvisited neighbours
+    """
+
+    def test_exact_bitset(self):
+        """[1.1.7 Exploration Memory] Test small worlds keep an exact bitset of visited cells"""
+        memory = ExplorationMemory((50, 50))
+        self.assertTrue(memory.exact)
+        self.assertEqual(memory.nbytes, 2 * 313)
+        memory.add((3, 4))
+        self.assertTrue(memory.seen((3, 4)))
+        self.assertFalse(memory.seen((4, 3)))
+
+    def test_hashed_set_for_huge_worlds(self):
+        """[1.1.7 Exploration Memory] Test huge worlds keep a bounded hashed set with few false positives"""
+        memory = ExplorationMemory((10000, 10000), capacity=200)
+        self.assertFalse(memory.exact)
+        self.assertLessEqual(memory.nbytes, 1000)
+        cells = [(x * 37 % 10000, x * 91 % 10000) for x in range(150)]
+        for cell in cells:
+            memory.add(cell)
+        self.assertTrue(all(memory.seen(cell) for cell in cells))
+        false_positives = sum(memory.seen((x, 5000)) for x in range(1000))
+        self.assertLess(false_positives, 50)
+
+    def test_old_visits_forgotten(self):
+        """[1.1.7 Exploration Memory] Test visits older than two generations are forgotten"""
+        memory = ExplorationMemory((20, 20), capacity=3)
+        memory.add((1, 1))
+        for x in range(2, 8):
+            memory.add((x, 1))
+        self.assertFalse(memory.seen((1, 1)))
+        self.assertTrue(memory.seen((7, 1)))
+
+    def test_bee_prefers_unvisited(self):
+        """[1.1.7 Exploration Memory] Test a wandering bee picks the only unvisited neighbour and remembers its cell"""
+        bee = Bee(2, (10, 10), (15, 15, 4, 4), (40, 40), (50, 50))
+        bee.inhive = False
+        bee.energy = 20
+        bee.memory = ExplorationMemory((50, 50))
+        for dx, dy in VALID_MOVE[1:]:
+            bee.memory.add((10 + dx, 10 + dy))
+        self.assertEqual(bee.machine.step(bee), VALID_MOVE[0])
+
+        bee.step_change()
+        self.assertTrue(bee.memory.seen(bee.pos))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from model.flower_field import FlowerField
+from model.world import World, PropertyType, Property
+
+
+class TestFlowerField(unittest.TestCase):
+    """
+    [1.2.6 Flower Field] Test suite for the nearest nectar flower field.
+
+    This test suite verifies:
+    - Distances and nearest flowers match a scan of every flower
+    - Depleted and refilled flowers update the field
+    - Flowers beyond the radius are not sensed
+    """
+
+    def setUp(self):
+        self.world = World((15, 15, 2, 2), (60, 40))
+        self.flowers = [Property(PropertyType.FLOWER, (10, 10), 2, 2, True, regen_time=5),
+                        Property(PropertyType.FLOWER, (30, 12), 1, 1, True),
+                        Property(PropertyType.FLOWER, (50, 30), 3, 1, False)]
+        for flower in self.flowers:
+            self.world.add_property(flower)
+        self.world.add_property(Property(PropertyType.TREE, (20, 20), 2, 2, False))
+        self.field = FlowerField(self.world, radius=6, block_size=8)
+        self.world.attach(self.field)
+
+    def _scan(self, pos):
+        best = None
+        for flower in self.world.properties:
+            if flower.type != PropertyType.FLOWER or not flower.has_nectar:
+                continue
+            dx = max(flower.pos[0] - pos[0], pos[0] - (flower.pos[0] + flower.width - 1), 0)
+            dy = max(flower.pos[1] - pos[1], pos[1] - (flower.pos[1] + flower.height - 1), 0)
+            d = max(dx, dy)
+            if d <= 6 and (best is None or d < best[1]):
+                best = (flower, d)
+        return best
+
+    def _assert_matches_scan(self):
+        for x in range(60):
+            for y in range(40):
+                expected = self._scan((x, y))
+                flower, _ = self.field.nearest((x, y))
+                if expected is None:
+                    self.assertIsNone(flower, (x, y))
+                else:
+                    self.assertIs(flower, expected[0], (x, y))
+                    self.assertEqual(self.field.distance((x, y)), expected[1], (x, y))
+
+    def test_matches_scan(self):
+        """[1.2.6 Flower Field] Test nearest flowers and distances match a scan of every flower"""
+        self._assert_matches_scan()
+
+    def test_target_cell(self):
+        """[1.2.6 Flower Field] Test the target is the closest cell of the nearest flower and far cells sense nothing"""
+        flower, target = self.field.nearest((7, 14))
+        self.assertIs(flower, self.flowers[0])
+        self.assertEqual(target, (10, 11))
+        self.assertEqual(self.field.nearest((45, 5)), (None, None))
+
+    def test_depletion_and_refill(self):
+        """[1.2.6 Flower Field] Test depleted, refilled and removed flowers update the field"""
+        self.field.nearest((12, 12))
+        self.world.deplete_flower(self.flowers[0])
+        self._assert_matches_scan()
+        self.world.regenerate_nectar(5)
+        self.assertIs(self.field.nearest((12, 12))[0], self.flowers[0])
+        self.world.remove_property(self.flowers[1])
+        self._assert_matches_scan()
+
+
+if __name__ == '__main__':
+    unittest.main()
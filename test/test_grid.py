@@ -0,0 +1,90 @@
+import os
+import unittest
+import numpy as np
+from model.grid import DenseGrid, TiledGrid
+
+
+class TestGrid(unittest.TestCase):
+    """
+    [1.2.2 Occupancy Grid] Test suite for the dense and tiled occupancy grids.
+
+    This test suite verifies:
+    - Reading and writing cells and rectangles
+    - Sharing of the canonical empty tile
+    - Rectangles spanning several tiles
+    - Batched lookups across allocated and unallocated tiles
+    - Cleanup of the backing file
+    """
+
+    def setUp(self):
+        self.tiled = TiledGrid((100, 80), tile_size=16)
+        self.dense = DenseGrid((100, 80))
+
+    def tearDown(self):
+        self.tiled.close()
+
+    def test_empty_grid(self):
+        """[1.2.2 Occupancy Grid] Test that an untouched grid reads as empty and allocates nothing"""
+        self.assertEqual(self.tiled.get(5, 5), TiledGrid.EMPTY)
+        self.assertEqual(len(self.tiled.tiles), 0)
+        # Every unallocated tile is the same shared array
+        self.assertIs(self.tiled.tile(0, 0), self.tiled.tile(3, 2))
+        self.assertFalse(self.tiled.tile(0, 0).flags.writeable)
+
+    def test_fill_rect_across_tiles(self):
+        """[1.2.2 Occupancy Grid] Test a rectangle spanning tile borders matches the dense grid"""
+        for grid in (self.tiled, self.dense):
+            grid.fill_rect(10, 12, 10, 8, 22)
+            grid.fill_rect(95, 75, 20, 20, 26)  # clipped at the world edge
+        np.testing.assert_array_equal(self.tiled.read_rect(0, 0, 100, 80),
+                                      self.dense.read_rect(0, 0, 100, 80))
+        self.assertEqual(self.tiled.get(19, 19), 22)
+        self.assertEqual(self.tiled.get(20, 19), TiledGrid.EMPTY)
+        # Only the touched tiles are allocated
+        self.assertEqual(len(self.tiled.tiles), 6)
+
+    def test_out_of_bounds(self):
+        """[1.2.2 Occupancy Grid] Test reads outside the grid are empty"""
+        self.tiled.fill_rect(0, 0, 2, 2, 20)
+        self.assertEqual(self.tiled.get(-1, 0), TiledGrid.EMPTY)
+        self.assertEqual(self.tiled.get(100, 0), TiledGrid.EMPTY)
+        rect = self.tiled.read_rect(-1, -1, 3, 3)
+        self.assertEqual(rect[0, 0], TiledGrid.EMPTY)
+        self.assertEqual(rect[1, 1], 20)
+
+    def test_clearing_unallocated_tile(self):
+        """[1.2.2 Occupancy Grid] Test writing EMPTY does not allocate tiles"""
+        self.tiled.fill_rect(0, 0, 100, 80, TiledGrid.EMPTY)
+        self.assertEqual(len(self.tiled.tiles), 0)
+
+    def test_growth(self):
+        """[1.2.2 Occupancy Grid] Test the backing file grows when more tiles are written"""
+        for ty in range(5):
+            for tx in range(7):
+                self.tiled.fill_rect(tx * 16, ty * 16, 1, 1, tx + 1)
+        self.assertEqual(len(self.tiled.tiles), 35)
+        self.assertEqual(self.tiled.get(6 * 16, 4 * 16), 7)
+        self.assertEqual(self.tiled.overview().shape, (5, 7))
+        self.assertEqual(self.tiled.overview()[4, 6], 7)
+
+    def test_lookup_matches_dense(self):
+        """[1.2.2 Occupancy Grid] Test a batched lookup over many tiles matches the dense grid, in input order"""
+        for grid in (self.tiled, self.dense):
+            grid.fill_rect(10, 12, 30, 20, 22)
+            grid.fill_rect(70, 60, 10, 10, 26)
+        rng = np.random.default_rng(3)
+        xs = rng.integers(-5, 105, 2000)
+        ys = rng.integers(-5, 85, 2000)
+        np.testing.assert_array_equal(self.tiled.lookup(xs, ys), self.dense.lookup(xs, ys))
+        self.assertEqual(self.tiled.lookup(np.array([], dtype=int), np.array([], dtype=int)).shape, (0,))
+
+    def test_close_removes_file(self):
+        """[1.2.2 Occupancy Grid] Test closing removes the temporary backing file"""
+        path = self.tiled.path
+        self.assertTrue(os.path.exists(path))
+        self.tiled.close()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
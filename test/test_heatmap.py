@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from model.heatmap import VisitHeatmap
+
+
+class TestVisitHeatmap(unittest.TestCase):
+    """
+    [1.2.8 Visit Heatmap] Test suite for the per-cell visit accumulator.
+
+    This test suite verifies:
+    - Visits of several bees on one cell add up
+    - Sparse and crowded steps give the same counts
+    - Saving the counts as an array
+    """
+
+    def test_add_counts_visits(self):
+        """[1.2.8 Visit Heatmap] Test visits of several bees on one cell add up over steps"""
+        heatmap = VisitHeatmap((6, 4))
+        heatmap.add([1, 1, 5], [2, 2, 3])
+        heatmap.add([1], [2])
+        self.assertEqual(heatmap.counts.shape, (4, 6))
+        self.assertEqual(heatmap.counts[2, 1], 3)
+        self.assertEqual(heatmap.counts[3, 5], 1)
+        self.assertEqual(heatmap.counts.sum(), 4)
+        self.assertEqual(heatmap.steps, 2)
+
+    def test_crowded_and_sparse_steps_agree(self):
+        """[1.2.8 Visit Heatmap] Test one crowded step counts the same as many single visits"""
+        rng = np.random.default_rng(0)
+        xs, ys = rng.integers(0, 10, 200), rng.integers(0, 10, 200)
+        crowded, sparse = VisitHeatmap((10, 10)), VisitHeatmap((10, 10))
+        crowded.add(xs, ys)
+        for x, y in zip(xs, ys):
+            sparse.add([x], [y])
+        np.testing.assert_array_equal(crowded.counts, sparse.counts)
+
+    def test_empty_step_and_save(self):
+        """[1.2.8 Visit Heatmap] Test an empty step is counted and the saved array matches the counts"""
+        heatmap = VisitHeatmap((3, 3))
+        heatmap.add([], [])
+        heatmap.add([2], [0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "visits.npy")
+            heatmap.save(path)
+            np.testing.assert_array_equal(np.load(path), heatmap.counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 from unittest.mock import Mock, patch
 from controller.hive_controller import HiveController
 from model.hive import Hive, Comb
-from model.buzzness import Bee
+from model.buzzness import Bee, BeeState
+from model.world import World, PropertyType, Property
 
 class TestHiveController(unittest.TestCase):
     """
@@ -100,5 +101,61 @@ class TestHiveController(unittest.TestCase):
         # Verify notify was not called
         self.controller.notify.assert_not_called()
 
+    def _flower(self, pos, has_nectar=True):
+        return Property(PropertyType.FLOWER, pos, 1, 1, has_nectar)
+
+    def test_sites_ranked_and_bounded(self):
+        """[2.2.3 Flower sites] Test sites are ranked by path length and the worst is dropped"""
+        controller = HiveController(self.hive, max_sites=2)
+        controller.remember_site([(1, 0)] * 5, self._flower((20, 15)))
+        controller.remember_site([(1, 1)] * 2, self._flower((17, 17)))
+        controller.remember_site([(0, 1)] * 9, self._flower((15, 24)))
+        self.assertEqual([len(entry[1]) for entry in controller.sites], [2, 5])
+
+        # Reporting a site again replaces its entry
+        controller.remember_site([(1, 0)] * 5, self._flower((20, 15)))
+        self.assertEqual(len(controller.sites), 2)
+
+    def test_empty_flowers_evicted(self):
+        """[2.2.3 Flower sites] Test sites are dropped when their flower depletes"""
+        world = World((15, 15, 2, 2), (50, 50))
+        near, far = self._flower((17, 17)), self._flower((25, 25))
+        world.add_property(near)
+        world.add_property(far)
+        controller = HiveController(self.hive, world)
+        controller.remember_site([(1, 1)] * 2, near)
+        controller.remember_site([(1, 1)] * 10, far)
+        world.deplete_flower(near)
+        self.assertEqual([entry[2] for entry in controller.sites], [far])
+
+        # An empty flower reported by its last visitor is not remembered
+        controller.remember_site([(1, 1)] * 2, near)
+        self.assertEqual(len(controller.sites), 1)
+
+    def test_recruit_draws_from_sites(self):
+        """[2.2.3 Flower sites] Test recruitment favours better ranked sites"""
+        controller = HiveController(self.hive)
+        self.assertEqual(controller.recruit(Mock()), ([], None))
+        best, worst = self._flower((17, 17)), self._flower((25, 25))
+        controller.remember_site([(1, 1)] * 2, best)
+        controller.remember_site([(1, 1)] * 10, worst)
+        rng = Mock()
+        rng.uniform.return_value = 0.5
+        self.assertIs(controller.recruit(rng)[1], best)
+        rng.uniform.return_value = 1.2
+        self.assertIs(controller.recruit(rng)[1], worst)
+
+    def test_bee_drops_path_to_empty_flower(self):
+        """[2.2.3 Flower sites] Test a bee stops following a path to an empty flower"""
+        flower = self._flower((20, 20), has_nectar=False)
+        self.bee.inhive = False
+        self.bee.pos = (16, 16)
+        self.bee.state = BeeState.FOLLOWING
+        self.bee.path_to_flower = [(1, 1)] * 4
+        self.bee.known_flower = flower
+        self.assertIsNone(self.bee.machine.step(self.bee))
+        self.assertEqual(self.bee.state, BeeState.WANDERING)
+        self.assertEqual(self.bee.path_to_flower, [])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestMain(unittest.TestCase):
+    """
+    Test suite for the command-line entry point in main.py.
+
+    This test suite verifies:
+    - A short interactive run completing with the prompted values
+    - Multi-process batch runs rejecting options only the single-process run supports
+    """
+
+    def _run(self, *args, input=None):
+        env = dict(os.environ, MPLBACKEND="Agg")
+        return subprocess.run([sys.executable, "main.py", *args], cwd=PROJECT_ROOT, input=input,
+                              capture_output=True, text=True, env=env, timeout=120)
+
+    def test_interactive(self):
+        """Test the interactive mode runs with the prompted timesteps and bees"""
+        result = self._run("-i", input="3\n2\n")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Timesteps: ", result.stdout)
+
+    def _param_file(self, params):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(params, f)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+
+    def test_processes_reject_single_process_options(self):
+        """[2.7 Domain Decomposition] Test a multi-process run names the options it cannot honour"""
+        params = self._param_file({"time_steps": 3, "num_bees": 2, "processes": 2,
+                                   "cell_capacity": 1, "scent": True})
+        result = self._run("-b", "-p", params)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("do not support cell_capacity, scent", result.stdout)
+
+    def test_processes(self):
+        """[2.7 Domain Decomposition] Test a multi-process batch run with supported options"""
+        params = self._param_file({"time_steps": 3, "num_bees": 2, "processes": 2, "seed": 1})
+        result = self._run("-b", "-p", params)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Nectar collected", result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
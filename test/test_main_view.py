@@ -1,7 +1,9 @@
 import unittest
 import json
+import os
 import tempfile
 from unittest.mock import patch, MagicMock
+import numpy as np
 from view.MainView import MainView
 from model.world import World, PropertyType
 
@@ -24,7 +26,6 @@ class TestMainView(unittest.TestCase):
         self.temp_config.close()
 
     def tearDown(self):
-        import os
         os.unlink(self.temp_config.name)
 
     def test_property_reading(self):
@@ -58,6 +59,111 @@ class TestMainView(unittest.TestCase):
         )
         self.assertIsNotNone(history)
 
+    def test_nectar_regeneration_config(self):
+        """Test reading flower regeneration times from config file"""
+        config = {
+            "nectar_regeneration": {"flower": 30},
+            "properties": {
+                "flower": [{"x": 1, "y": 1, "width": 1, "height": 1},
+                           {"x": 3, "y": 3, "width": 1, "height": 1, "regen_time": 5}],
+                "trees": [{"x": 10, "y": 10, "width": 2, "height": 2}]
+            }
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config, f)
+        self.addCleanup(os.unlink, f.name)
+        world = World(self.hive_pos, self.world_size)
+        self.main_view.read_property(f.name, world)
+
+        self.assertEqual([p.regen_time for p in world.properties], [30, 5, None])
+
+    def test_simulation_stop_condition(self):
+        """Test simulation with an early stop condition"""
+        history = self.main_view.simulate(
+            time_steps=50,
+            num_bees=2,
+            config_file=self.temp_config.name,
+            visualize=False,
+            stop_condition="steady_state",
+            steady_window=5
+        )
+        self.assertIsNotNone(history)
+
+    def test_simulation_two_phase(self):
+        """Test simulation with two-phase stepping across worker threads"""
+        history = self.main_view.simulate(
+            time_steps=5,
+            num_bees=4,
+            config_file=self.temp_config.name,
+            visualize=False,
+            two_phase=True,
+            workers=2,
+            seed=1
+        )
+        self.assertIsNotNone(history)
+
+    def test_simulation_lifecycle(self):
+        """Test simulation with ageing and brood turned on"""
+        history = self.main_view.simulate(
+            time_steps=10,
+            num_bees=3,
+            config_file=self.temp_config.name,
+            visualize=False,
+            seed=1,
+            lifecycle={"lifespan": 5, "brood_cost": 1, "brood_time": 2}
+        )
+        self.assertIsNotNone(history)
+
+    def test_read_geometry(self):
+        """Test the world and hive geometry comes from the map file, with defaults"""
+        self.assertEqual(self.main_view.read_geometry(self.temp_config.name), ((50, 50), (15, 15, 2, 2), (40, 40)))
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as config:
+            json.dump({"world": {"width": 30, "height": 20}, "hive": {"x": 5, "y": 6},
+                       "hive_size": {"width": 8, "height": 8}, "properties": {}}, config)
+        self.addCleanup(os.unlink, config.name)
+        geometry = self.main_view.read_geometry(config.name)
+        self.assertEqual(geometry, ((30, 20), (5, 6, 2, 2), (8, 8)))
+        history = self.main_view.simulate(time_steps=5, num_bees=2, config_file=config.name,
+                                          visualize=False, seed=1)
+        self.assertIsNotNone(history)
+        self.assertEqual(self.main_view.colonies[0].hive_pos, (5, 6, 2, 2))
+        self.assertEqual(self.main_view.colonies[0].hive.hive.shape, (8, 8))
+
+    def test_simulation_hives(self):
+        """Test competing colonies stepped in two phases, one colony per worker"""
+        history = self.main_view.simulate(
+            time_steps=10,
+            num_bees=2,
+            config_file=self.temp_config.name,
+            visualize=False,
+            two_phase=True,
+            workers=2,
+            seed=1,
+            hives=[(15, 15, 2, 2), (35, 35, 2, 2)],
+            lifecycle={"brood_cost": 1, "brood_time": 2}
+        )
+        self.assertIsNotNone(history)
+        self.assertEqual([colony.name for colony in self.main_view.colonies], ["Colony 1", "Colony 2"])
+        self.assertEqual([bee.ID for bee in self.main_view.colonies[1].bees][:2], [3, 4])
+
+    @patch('matplotlib.pyplot.show')
+    def test_simulation_heatmap(self, mock_show):
+        """Test the visit heatmap panel and saved array"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "visits.npy")
+        self.main_view.simulate(
+            time_steps=6,
+            num_bees=3,
+            config_file=self.temp_config.name,
+            visualize=True,
+            heatmap=True,
+            heatmap_file=path
+        )
+        counts = np.load(path)
+        self.assertEqual(counts.shape, (50, 50))
+        np.testing.assert_array_equal(counts, self.main_view.visit_counts)
+
     def test_invalid_config_file(self):
         """Test handling of invalid config file"""
         world = World(self.hive_pos, self.world_size)
@@ -0,0 +1,53 @@
+import unittest
+from model.swarm import SwarmArrays
+from utils.memory import BEE_BYTES, estimate_memory, format_bytes
+
+
+class TestMemory(unittest.TestCase):
+    """
+    [2.9 Memory Estimate] Test suite for the memory estimate printed before a run.
+    """
+
+    def test_dense_world(self):
+        """[2.9 Memory Estimate] Test a dense world counts its grid, render buffer and bees"""
+        parts = estimate_memory((100, 50), 10, hive_size=(4, 5))
+        self.assertEqual(parts["grid"], 5000)
+        self.assertEqual(parts["render buffer"], 5000 * 8)
+        self.assertEqual(parts["bees"], 10 * BEE_BYTES)
+        self.assertNotIn("disk", parts)
+        self.assertEqual(parts["total"], sum(size for name, size in parts.items() if name != "total"))
+
+    def test_tiled_world(self):
+        """[2.9 Memory Estimate] Test a tiled grid is counted as disk, not memory"""
+        parts = estimate_memory((10000, 10000), 10, tile_size=256)
+        self.assertEqual(parts["disk"], 10 ** 8)
+        self.assertNotIn("grid", parts)
+        self.assertNotIn("render buffer", parts)
+        self.assertLess(parts["total"], 10 ** 6)
+
+    def test_colonies_and_options(self):
+        """[2.9 Memory Estimate] Test colonies multiply bees and hives and options add their arrays"""
+        single = estimate_memory((50, 50), 10)
+        double = estimate_memory((50, 50), 10, colonies=2, heatmap=True, scent=True, exploration_memory=True)
+        self.assertEqual(double["bees"], 2 * single["bees"])
+        self.assertEqual(double["hives"], 2 * single["hives"])
+        self.assertEqual(double["heatmap"], 2500 * 4)
+        self.assertEqual(double["scent"], 2500 * 4)
+        self.assertGreater(double["exploration memory"], 0)
+
+    def test_processes(self):
+        """[2.9 Memory Estimate] Test multi-process runs count shared arrays per bee"""
+        parts = estimate_memory((10000, 10000), 10 ** 5, tile_size=256, processes=4)
+        per_bee = parts["bees"] // 10 ** 5
+        self.assertLess(per_bee, BEE_BYTES)
+        self.assertGreater(per_bee, len(SwarmArrays.FIELDS))
+
+    def test_format_bytes(self):
+        """[2.9 Memory Estimate] Test sizes are shown in the largest fitting unit"""
+        self.assertEqual(format_bytes(512), "512 B")
+        self.assertEqual(format_bytes(1536), "1.5 KB")
+        self.assertEqual(format_bytes(3 * 1024 ** 3), "3.0 GB")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from model.neighbour_mask import NeighbourMasks, pick_moves
+from model.world import World, PropertyType, Property
+from utils.constants import VALID_MOVE
+
+
+class TestNeighbourMasks(unittest.TestCase):
+    """
+    [1.2.5 Neighbour Masks] Test suite for the passable-neighbour masks.
+
+    This test suite verifies:
+    - Masks match a direct check of every neighbour
+    - Property edits refresh only the blocks they touch
+    - Vectorized lookups and move picks
+    """
+
+    def setUp(self):
+        self.world = World((15, 15, 2, 2), (40, 30))
+        self.world.add_property(Property(PropertyType.TREE, (10, 10), 3, 2, False))
+        self.world.add_property(Property(PropertyType.FLOWER, (20, 5), 2, 2, True))
+        self.world.add_property(Property(PropertyType.WATER, (30, 20), 5, 5, False))
+        self.masks = NeighbourMasks(self.world.grid, block_size=8)
+        self.world.attach(self.masks)
+
+    def _expected(self, x, y):
+        mask = 0
+        for bit, (dx, dy) in enumerate(VALID_MOVE):
+            nx = max(1, min(x + dx, 38))
+            ny = max(1, min(y + dy, 28))
+            if self.world.grid.get(nx, ny) in (0, PropertyType.FLOWER.value):
+                mask |= 1 << bit
+        return mask
+
+    def test_masks_match_neighbours(self):
+        """[1.2.5 Neighbour Masks] Test every cell mask against a direct check of its neighbours"""
+        for x in range(1, 39):
+            for y in range(1, 29):
+                self.assertEqual(self.masks.get(x, y), self._expected(x, y), (x, y))
+
+    def test_edit_invalidates_blocks(self):
+        """[1.2.5 Neighbour Masks] Test adding and removing a property refreshes the blocks it touches"""
+        self.assertEqual(self.masks.get(9, 9), self._expected(9, 9))
+        self.masks.get(36, 3)
+        tree = Property(PropertyType.HOUSE, (8, 8), 1, 1, False)
+        self.world.add_property(tree)
+        self.assertIn((4, 0), self.masks.blocks)
+        self.assertEqual(self.masks.get(9, 9), self._expected(9, 9))
+        self.world.remove_property(tree)
+        self.assertEqual(self.masks.get(9, 9), self._expected(9, 9))
+
+    def test_nectar_changes_keep_blocks(self):
+        """[1.2.5 Neighbour Masks] Test depleting a flower keeps its cached block"""
+        self.masks.get(20, 5)
+        self.world.deplete_flower(self.world.properties[1])
+        self.assertIn((2, 0), self.masks.blocks)
+
+    def test_lookup_and_pick(self):
+        """[1.2.5 Neighbour Masks] Test vectorized lookups and picking a passable move"""
+        xs = np.array([9, 11, 25, 33])
+        ys = np.array([9, 9, 15, 22])
+        masks = self.masks.lookup(xs, ys)
+        self.assertEqual(masks.tolist(), [self.masks.get(x, y) for x, y in zip(xs, ys)])
+        self.assertEqual(masks[3], 0)
+        moves = pick_moves(masks, np.full(4, 0.5))
+        self.assertEqual(moves[3], -1)
+        for mask, move in zip(masks[:3], moves[:3]):
+            self.assertTrue(mask >> move & 1)
+
+    def test_lookup_spans_blocks(self):
+        """[1.2.5 Neighbour Masks] Test lookups scattered over many blocks keep their shape and order"""
+        rng = np.random.default_rng(3)
+        xs = rng.integers(1, 39, size=(6, 50))
+        ys = rng.integers(1, 29, size=(6, 50))
+        masks = self.masks.lookup(xs, ys)
+        self.assertEqual(masks.shape, xs.shape)
+        expected = [[self.masks.get(x, y) for x, y in zip(row_x, row_y)] for row_x, row_y in zip(xs, ys)]
+        self.assertEqual(masks.tolist(), expected)
+        self.assertEqual(self.masks.lookup(np.array([], dtype=int), np.array([], dtype=int)).size, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
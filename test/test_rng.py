@@ -0,0 +1,40 @@
+import unittest
+from utils.rng import BeeRandom, stream
+
+
+class TestRng(unittest.TestCase):
+    """
+    [1.1.6 Random streams] Test suite for the seeded per-bee random streams.
+
+    This test suite verifies:
+    - Streams repeat for the same seed and key
+    - Streams differ between keys
+    - Block size does not change the draws
+    - choice and uniform draws staying within their bounds
+    """
+
+    def test_same_seed_and_key_repeat(self):
+        """[1.1.6 Random streams] Test two streams with the same seed and key give the same draws across blocks"""
+        a, b = BeeRandom(7, 3), BeeRandom(7, 3)
+        self.assertEqual([a.random() for _ in range(600)], [b.random() for _ in range(600)])
+
+    def test_keys_are_independent(self):
+        """[1.1.6 Random streams] Test streams with different keys give different draws"""
+        self.assertNotEqual(stream(7, 1).random(5).tolist(), stream(7, 2).random(5).tolist())
+
+    def test_block_size_does_not_change_draws(self):
+        """[1.1.6 Random streams] Test the block size only changes how draws are fetched, not their values"""
+        small, large = BeeRandom(7, 1, block=3), BeeRandom(7, 1, block=100)
+        self.assertEqual([small.random() for _ in range(50)], [large.random() for _ in range(50)])
+
+    def test_choice_and_uniform(self):
+        """[1.1.6 Random streams] Test choice picks from the sequence and uniform stays within its range"""
+        rng = BeeRandom(1, 1)
+        moves = [(1, 0), (0, 1), (-1, 0)]
+        for _ in range(100):
+            self.assertIn(rng.choice(moves), moves)
+            self.assertTrue(2 <= rng.uniform(2, 3) < 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
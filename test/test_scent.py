@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import Mock
+from model.scent import ScentField
+from utils.constants import VALID_MOVE
+
+
+class TestScentField(unittest.TestCase):
+    """
+    [1.2.7 Scent Field] Test suite for the scent field.
+
+    This test suite verifies:
+    - Deposits from several bees on one cell add up
+    - Decay and diffusion conserve the expected amount of scent
+    - Update intervals and biased move choice
+    """
+
+    def test_deposit_accumulates(self):
+        """[1.2.7 Scent Field] Test deposits from several bees on one cell add up"""
+        scent = ScentField((10, 8))
+        scent.deposit([2, 2, 5], [3, 3, 1])
+        self.assertEqual(scent.field[3, 2], 2.0)
+        self.assertEqual(scent.field[1, 5], 1.0)
+        self.assertEqual(scent.field.shape, (8, 10))
+
+    def test_decay_and_diffusion(self):
+        """[1.2.7 Scent Field] Test one update decays and spreads scent to the neighbours"""
+        scent = ScentField((9, 9), decay=0.5, diffusion=0.8)
+        scent.deposit([4], [4])
+        scent.step(1)
+        self.assertAlmostEqual(scent.field[4, 4], 0.2 * 0.5)
+        self.assertAlmostEqual(scent.field[3, 5], 0.1 * 0.5)
+        self.assertAlmostEqual(float(scent.field.sum()), 0.5, places=5)
+
+    def test_interval(self):
+        """[1.2.7 Scent Field] Test updates only run every interval steps and catch up the decay"""
+        scent = ScentField((5, 5), decay=0.5, diffusion=0.0, interval=2)
+        scent.deposit([1], [1])
+        scent.step(1)
+        self.assertEqual(scent.field[1, 1], 1.0)
+        scent.step(2)
+        self.assertAlmostEqual(scent.field[1, 1], 0.25)
+
+        # Diffusion is applied once per update, not once per skipped step
+        scent = ScentField((9, 9), decay=1.0, diffusion=0.8, interval=2)
+        scent.deposit([4], [4])
+        scent.step(2)
+        self.assertAlmostEqual(scent.field[4, 4], 0.2)
+
+    def test_choose_favours_scent(self):
+        """[1.2.7 Scent Field] Test the move towards the scented cell takes most of the draw"""
+        scent = ScentField((10, 10), attraction=100.0)
+        scent.deposit([6], [5])
+        rng = Mock()
+        # The first move (1, 0) leads to the scented cell and holds most of the weight
+        rng.uniform.side_effect = lambda a, b: b * 0.9
+        self.assertEqual(scent.choose((5, 5), VALID_MOVE, rng), (1, 0))
+        rng.uniform.side_effect = lambda a, b: b * 0.999
+        self.assertEqual(scent.choose((5, 5), VALID_MOVE, rng), VALID_MOVE[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
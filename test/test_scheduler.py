@@ -0,0 +1,53 @@
+import unittest
+from controller.scheduler import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+    """
+    [2.5 Scheduler] Test suite for the TimingWheel class.
+
+    This test suite verifies:
+    - Items wake up exactly at their scheduled step
+    - Items scheduled further ahead than the wheel size
+    - Ordering and item counting
+    """
+
+    def setUp(self):
+        self.wheel = TimingWheel(size=4)
+
+    def test_wake_at_step(self):
+        """[2.5 Scheduler] Test items are returned only at their step"""
+        self.wheel.schedule("a", 2)
+        self.wheel.schedule("b", 2)
+        self.wheel.schedule("c", 3)
+        self.assertEqual(self.wheel.pop_due(1), [])
+        self.assertEqual(self.wheel.pop_due(2), ["a", "b"])
+        self.assertEqual(self.wheel.pop_due(3), ["c"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_beyond_wheel_size(self):
+        """[2.5 Scheduler] Test items more than one round ahead wait for their round"""
+        self.wheel.schedule("late", 9)
+        self.wheel.schedule("soon", 5)
+        woken = {t: self.wheel.pop_due(t) for t in range(1, 10)}
+        self.assertEqual(woken[5], ["soon"])
+        self.assertEqual(woken[9], ["late"])
+        self.assertEqual(sum(len(items) for items in woken.values()), 2)
+
+
+    def test_remove(self):
+        """[2.5 Scheduler] Test a removed item never wakes up and the others still do"""
+        self.wheel.schedule("a", 6)
+        self.wheel.schedule("b", 6)
+        self.assertIn("a", self.wheel)
+        self.assertTrue(self.wheel.remove("a"))
+        self.assertFalse(self.wheel.remove("a"))
+        self.assertNotIn("a", self.wheel)
+        self.assertEqual(len(self.wheel), 1)
+        woken = [item for t in range(1, 7) for item in self.wheel.pop_due(t)]
+        self.assertEqual(woken, ["b"])
+        self.assertNotIn("b", self.wheel)
+
+
+if __name__ == '__main__':
+    unittest.main()
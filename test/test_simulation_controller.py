@@ -0,0 +1,273 @@
+import unittest
+from unittest.mock import Mock
+from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.step_engine import SerialEngine
+from controller.world_controller import WorldController
+from model.buzzness import Bee, BeeState
+from model.hive import Hive
+from model.world import World, PropertyType, Property
+from utils.utils import find_path_to_flower
+
+
+class TestSimulationController(unittest.TestCase):
+    """
+    [2.4 Simulation Controller] Test suite for the SimulationController class.
+
+    This test suite verifies:
+    - Stepping the world and bees
+    - The nectar delivered stop condition
+    - The steady state stop condition
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.world = World((15, 15, 2, 2), (50, 50))
+        self.flower = Property(PropertyType.FLOWER, (20, 20), 1, 1, True)
+        self.world.add_property(self.flower)
+        self.world_controller = WorldController(self.world)
+        self.hive_controller = HiveController(Hive((5, 5)))
+        self.bees = [Mock(), Mock()]
+        for bee in self.bees:
+            bee.charging_steps.return_value = 0
+            bee.fast_forward_steps.return_value = 0
+
+    def _simulation(self, **kwargs):
+        return SimulationController(self.world, self.world_controller, self.hive_controller, self.bees, **kwargs)
+
+    def test_step(self):
+        """[2.4 Simulation Controller] Test each step advances every bee and the world clock"""
+        simulation = self._simulation()
+        simulation.step(3)
+        self.assertEqual(self.world.time, 3)
+        for bee in self.bees:
+            bee.step_change.assert_called_once()
+
+    def test_charging_bees_parked(self):
+        """[2.5 Scheduler] Test charging bees skip steps and give the same result as stepping"""
+        bee = Bee(1, (0, 0), (15, 15), (40, 40), (50, 50))
+        stepped = Bee(2, (0, 0), (15, 15), (40, 40), (50, 50))
+        self.bees = [bee]
+        simulation = self._simulation()
+
+        simulation.step(1)
+        self.assertEqual(bee.energy, Bee.MIN_ENERGY_TO_LEAVE)
+        self.assertEqual(simulation.active_bees(), [])
+        simulation.step(2)
+        self.assertTrue(bee.inhive)
+
+        # Wakes up and leaves the hive at the same step as a bee stepped every time
+        simulation.step(3)
+        for _ in range(3):
+            stepped.step_change()
+        self.assertFalse(bee.inhive)
+        self.assertFalse(stepped.inhive)
+        self.assertEqual(bee.pos, stepped.pos)
+        self.assertEqual(simulation.active_bees(), [bee])
+
+    def _following_bee(self, ID):
+        bee = Bee(ID, (15, 15), (15, 15), (40, 40), (50, 50))
+        bee.inhive = False
+        bee.energy = 40
+        bee.state = BeeState.FOLLOWING
+        bee.path_to_flower = find_path_to_flower((15, 15), self.flower.pos)
+        bee.attach(self.world_controller)
+        bee.attach(self.hive_controller)
+        return bee
+
+    def test_fast_forward_matches_stepping(self):
+        """[1.1.5 Fast-forward] Test fast-forwarded bees match bees stepped one cell at a time"""
+        fast = self._following_bee(1)
+        self.bees = [fast]
+        simulation = self._simulation(park_charging=False)
+
+        slow_world = World((15, 15, 2, 2), (50, 50))
+        slow_flower = Property(PropertyType.FLOWER, (20, 20), 1, 1, True)
+        slow_world.add_property(slow_flower)
+        slow = Bee(2, (15, 15), (15, 15), (40, 40), (50, 50))
+        slow.inhive, slow.energy, slow.state = False, 40, BeeState.FOLLOWING
+        slow.path_to_flower = find_path_to_flower((15, 15), slow_flower.pos)
+        # Observers are held weakly, so keep the controller alive for the run
+        slow_controller = WorldController(slow_world)
+        slow.attach(slow_controller)
+
+        for t in range(1, 12):
+            simulation.step(t)
+            slow.step_change()
+            self.assertEqual(fast.get_pos(), slow.get_pos(), f"Positions differ at timestep {t}")
+            self.assertEqual(fast.state, slow.state)
+        self.assertEqual(self.world_controller.nectar_collected, 1)
+        self.assertFalse(self.flower.has_nectar)
+        self.assertEqual(fast.energy, slow.energy)
+
+    def test_fast_forward_parks_bee(self):
+        """[1.1.5 Fast-forward] Test a bee on a clear path is parked until the end of it"""
+        bee = self._following_bee(1)
+        self.assertEqual(bee.fast_forward_steps(self.world), 4)
+        self.bees = [bee]
+        simulation = self._simulation()
+        simulation.step(1)
+        self.assertEqual(simulation.active_bees(), [])
+        self.assertEqual(bee.pos, (15, 15))
+        self.assertEqual(bee.get_pos(), (16, 16))
+        self.assertEqual(bee.path_to_flower, [(1, 1)])
+
+    def _drying_run(self, fast_forward):
+        world = World((15, 15, 2, 2), (50, 50))
+        flower = Property(PropertyType.FLOWER, (20, 20), 1, 1, True, regen_time=8)
+        world.add_property(flower)
+        world_controller = WorldController(world)
+        hive_controller = HiveController(Hive((5, 5)), world)
+        first = Bee(1, (19, 19), (15, 15), (5, 5), (50, 50))
+        first.path_to_flower = [(1, 1)]
+        second = Bee(2, (15, 15), (15, 15), (5, 5), (50, 50))
+        second.path_to_flower = find_path_to_flower((15, 15), flower.pos)
+        bees = [first, second]
+        for bee in bees:
+            bee.inhive, bee.energy, bee.state = False, 40, BeeState.FOLLOWING
+            bee.known_flower = flower
+            bee.attach(world_controller)
+            bee.attach(hive_controller)
+            hive_controller.attach(bee)
+        simulation = SimulationController(world, world_controller, hive_controller, bees, park_charging=False,
+                                          fast_forward=fast_forward, engine=SerialEngine(seed=4))
+        history = []
+        for t in range(1, 20):
+            simulation.step(t)
+            history.append([(bee.get_pos(), bee.state) for bee in bees])
+        # Fast-forwarded bees pay for their moves up front, so energies are compared at the end
+        return history, [bee.energy for bee in bees], world_controller.nectar_collected
+
+    def test_fast_forward_notices_emptied_flower(self):
+        """[1.1.5 Fast-forward] Test a bee heading for a flower another bee empties matches stepping"""
+        stepped = self._drying_run(fast_forward=False)
+        # The second bee gives up on the emptied flower and wanders off
+        self.assertEqual(stepped[0][1][1][1], BeeState.WANDERING)
+        self.assertEqual(self._drying_run(fast_forward=True), stepped)
+
+    def test_no_stop_condition(self):
+        """[2.4 Simulation Controller] Test runs never stop early by default"""
+        simulation = self._simulation()
+        self.world.deplete_flower(self.flower)
+        self.assertFalse(simulation.should_stop(1))
+
+    def test_stop_when_nectar_delivered(self):
+        """[2.4 Simulation Controller] Test stopping once flowers are empty and nectar is home"""
+        simulation = self._simulation(stop_condition=SimulationController.STOP_NECTAR_DELIVERED)
+        self.assertFalse(simulation.should_stop(1))
+
+        # Nectar collected but still being carried back
+        self.world.deplete_flower(self.flower)
+        self.world_controller.nectar_collected += 1
+        self.assertEqual(self.world.nectar_count, 0)
+        self.assertFalse(simulation.should_stop(2))
+
+        self.hive_controller.nectar_delivered += 1
+        self.assertTrue(simulation.should_stop(3))
+
+    def test_stop_on_steady_state(self):
+        """[2.4 Simulation Controller] Test stopping after a window without changes"""
+        simulation = self._simulation(stop_condition=SimulationController.STOP_STEADY_STATE, steady_window=3)
+        results = [simulation.should_stop(t) for t in range(1, 4)]
+        self.assertEqual(results, [False, False, False])
+
+        # A delivery resets the window
+        self.hive_controller.nectar_delivered += 1
+        self.assertFalse(simulation.should_stop(4))
+        results = [simulation.should_stop(t) for t in range(5, 8)]
+        self.assertEqual(results, [False, False, True])
+
+    def test_cell_capacity_is_respected(self):
+        """[2.1.3 Crowding] Test no cell outside the hive holds more bees than its capacity"""
+        world_controller = WorldController(self.world, cell_capacity=1)
+        bees = []
+        for i in range(12):
+            bee = Bee(i + 1, (0, 0), (15, 15), (5, 5), (50, 50))
+            bee.crowding = True
+            bee.attach(world_controller)
+            bees.append(bee)
+        simulation = SimulationController(self.world, world_controller, self.hive_controller, bees,
+                                          engine=SerialEngine(seed=5))
+        self.assertFalse(simulation.fast_forward)
+        for t in range(1, 60):
+            simulation.step(t)
+            cells = [bee.get_pos() for bee in bees if not bee.inhive]
+            self.assertEqual(len(cells), len(set(cells)))
+
+    def test_scent_deposited_each_step(self):
+        """[1.2.7 Scent Field] Test bees outside the hive leave scent as they move"""
+        from model.scent import ScentField
+        self.world.scent = ScentField(self.world.world_size, decay=1.0, diffusion=0.0)
+        bee = Bee(1, (0, 0), (15, 15), (5, 5), (50, 50))
+        bee.inhive = False
+        bee.energy = 10
+        bee.pos = (30, 30)
+        bee.scent_field = self.world.scent
+        simulation = SimulationController(self.world, self.world_controller, self.hive_controller, [bee])
+        for t in range(1, 4):
+            simulation.step(t)
+        self.assertAlmostEqual(float(self.world.scent.field.sum()), 3.0)
+        self.assertGreaterEqual(self.world.scent.field[bee.pos[1], bee.pos[0]], 1.0)
+
+    def _seeded_run(self, steps, **kwargs):
+        world = World((15, 15, 2, 2), (50, 50))
+        world.add_property(Property(PropertyType.FLOWER, (20, 20), 3, 3, True, 10))
+        world.add_property(Property(PropertyType.TREE, (17, 12), 2, 6, False))
+        world_controller = WorldController(world)
+        hive_controller = HiveController(Hive((5, 5)), world)
+        bees = []
+        for i in range(6):
+            bee = Bee(i + 1, (0, 0), (15, 15), (5, 5), (50, 50))
+            bee.energy = 200
+            bee.attach(world_controller)
+            bee.attach(hive_controller)
+            hive_controller.attach(bee)
+            bees.append(bee)
+        bees[0].path_to_flower = find_path_to_flower((15, 15), (21, 21))
+        simulation = SimulationController(world, world_controller, hive_controller, bees,
+                                          engine=SerialEngine(seed=3), **kwargs)
+        for t in range(1, steps):
+            simulation.step(t)
+        return [bee.get_pos() for bee in bees], world_controller.nectar_collected, hive_controller.nectar_delivered
+
+    def test_batch_dispatch_matches_serial(self):
+        """[2.4 Simulation Controller] Test batched notifications give the same run as immediate ones"""
+        serial = self._seeded_run(120)
+        batched = self._seeded_run(120, batch_dispatch=True)
+        self.assertGreater(serial[2], 0)
+        self.assertEqual(batched, serial)
+
+    def test_roster_follows_run(self):
+        """[1.5 Bee Roster] Test the roster sets match the bees' own state after a run"""
+        world = World((15, 15, 2, 2), (50, 50))
+        world.add_property(Property(PropertyType.FLOWER, (20, 20), 3, 3, True, 10))
+        world_controller = WorldController(world)
+        bees = []
+        for i in range(6):
+            bee = Bee(i + 1, (0, 0), (15, 15), (5, 5), (50, 50))
+            bee.attach(world_controller)
+            bee.attach(self.hive_controller)
+            bees.append(bee)
+        simulation = SimulationController(world, world_controller, self.hive_controller, bees,
+                                          engine=SerialEngine(seed=2))
+        for t in range(1, 150):
+            simulation.step(t)
+            for state in BeeState:
+                self.assertEqual(set(simulation.roster.in_state(state)), {bee for bee in bees if bee.state == state})
+            self.assertEqual(set(simulation.roster.outside()), {bee for bee in bees if not bee.inhive})
+
+    def test_batch_dispatch_needs_serial_engine(self):
+        """[2.4 Simulation Controller] Test batched notifications refuse the two-phase engine"""
+        from controller.step_engine import TwoPhaseEngine
+        engine = TwoPhaseEngine(self.world_controller, self.hive_controller)
+        with self.assertRaises(ValueError):
+            self._simulation(engine=engine, batch_dispatch=True)
+
+    def test_invalid_stop_condition(self):
+        """[2.4 Simulation Controller] Test unknown stop conditions are rejected"""
+        with self.assertRaises(ValueError):
+            self._simulation(stop_condition="forever")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from model.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    """
+    [1.2.3 Spatial Hash] Test suite for the SpatialHash class.
+
+    This test suite verifies:
+    - Insertion and point/rectangle queries
+    - Items spanning several buckets
+    - Removal and bucket cleanup
+    - Insertion ordering of results
+    """
+
+    def setUp(self):
+        self.index = SpatialHash(cell_size=4)
+
+    def test_point_query(self):
+        """[1.2.3 Spatial Hash] Test point queries only return boxes containing the point"""
+        self.index.insert("tree", 1, 1, 2, 2)
+        self.assertEqual(self.index.query_point(2, 2), ["tree"])
+        self.assertEqual(self.index.query_point(3, 3), [])
+        self.assertEqual(self.index.query_point(40, 40), [])
+
+    def test_rect_query_across_buckets(self):
+        """[1.2.3 Spatial Hash] Test a large box is found from any bucket it overlaps"""
+        self.index.insert("pond", 2, 2, 10, 5)
+        self.assertEqual(self.index.query_rect(11, 6, 3, 3), ["pond"])
+        self.assertEqual(self.index.query_rect(12, 2, 3, 3), [])
+        self.assertEqual(len(self.index.buckets), 6)
+
+    def test_remove(self):
+        """[1.2.3 Spatial Hash] Test removal empties the buckets the item used"""
+        self.index.insert("pond", 2, 2, 10, 5)
+        self.index.remove("pond")
+        self.index.remove("missing")
+        self.assertEqual(self.index.query_rect(0, 0, 20, 20), [])
+        self.assertEqual(self.index.buckets, {})
+        self.assertEqual(len(self.index), 0)
+
+    def test_insertion_order(self):
+        """[1.2.3 Spatial Hash] Test overlapping items are returned in insertion order"""
+        self.index.insert("b", 5, 5, 1, 1)
+        self.index.insert("a", 0, 0, 8, 8)
+        self.assertEqual(self.index.query_point(5, 5), ["b", "a"])
+        self.assertEqual(self.index.query_rect(0, 0, 8, 8), ["b", "a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from enum import Enum
+
+import numpy as np
+
+from model.buzzness import Bee, BeeState
+from model.state_machine import ANY, StateMachine
+
+
+class Mood(Enum):
+    IDLE = 1
+    BUSY = 2
+    RESTING = 3
+
+
+class Worker:
+    def __init__(self, state, tired=False):
+        self.state = state
+        self.tired = tired
+        self.log = []
+
+
+class TestStateMachine(unittest.TestCase):
+    """
+    [1.1.1 State Management] Test suite for the StateMachine class.
+
+    This test suite verifies:
+    - The first matching row firing, with ANY rows in table order
+    - Next states applied before the action runs
+    - The vectorized form giving the same transitions as the per-object form
+    - New states added to the Bee table without changing Bee
+    """
+
+    def setUp(self):
+        """Initialize test environment with common test data"""
+        self.machine = StateMachine((
+            (ANY, lambda w: w.tired, lambda w: w.log.append("rest"), Mood.RESTING),
+            (Mood.IDLE, None, lambda w: w.log.append(w.state), Mood.BUSY),
+            (Mood.BUSY, None, lambda w: "working", None),
+        ))
+
+    def test_first_matching_row(self):
+        """[1.1.1 State Management] Test rows fire in table order and only one per step"""
+        worker = Worker(Mood.IDLE)
+        self.assertIsNone(self.machine.step(worker))
+        self.assertEqual(worker.log, [Mood.BUSY])
+        self.assertEqual(self.machine.step(worker), "working")
+
+        worker.tired = True
+        self.machine.step(worker)
+        self.assertEqual(worker.state, Mood.RESTING)
+        self.assertEqual(worker.log, [Mood.BUSY, "rest"])
+
+    def test_no_row_fires(self):
+        """[1.1.1 State Management] Test a state without matching rows keeps the object as is"""
+        worker = Worker(Mood.RESTING)
+        self.assertIsNone(self.machine.step(worker))
+        self.assertEqual(worker.state, Mood.RESTING)
+
+    def test_step_arrays(self):
+        """[1.1.1 State Management] Test the array form takes each bee in at most one row"""
+        energy = np.array([0, 5, 0, 5, 9])
+        states = np.array([BeeState.WANDERING.value, BeeState.WANDERING.value, BeeState.RETURNING.value,
+                           BeeState.RETURNING.value, BeeState.FOLLOWING.value], dtype=np.int8)
+        fired = []
+        machine = StateMachine((
+            (ANY, lambda bees, ctx: energy[bees] == 0, lambda bees, ctx: fired.append(("empty", bees.tolist())), None),
+            (BeeState.WANDERING, None, lambda bees, ctx: fired.append(("wander", bees.tolist())),
+             BeeState.FOLLOWING),
+            (BeeState.FOLLOWING, None, lambda bees, ctx: fired.append(("follow", bees.tolist())), None),
+        ))
+        machine.step_arrays(states, np.arange(5), None)
+        self.assertEqual(sorted(fired), [("empty", [0]), ("empty", [2]), ("follow", [4]), ("wander", [1])])
+        self.assertEqual(states.tolist(), [1, 2, 3, 3, 2])
+
+    def test_bee_table_extended(self):
+        """[1.1.1 State Management] Test a bee runs a table with an extra state"""
+        resting = StateMachine(Bee.TRANSITIONS + (
+            (Mood.RESTING, None, lambda bee: False, BeeState.WANDERING),
+        ))
+        bee = Bee(2, (10, 10), (15, 15), (40, 40), (50, 50))
+        bee.machine = resting
+        bee.inhive = False
+        bee.energy = 10
+        bee.state = Mood.RESTING
+        self.assertFalse(bee.step_change())
+        self.assertEqual(bee.state, BeeState.WANDERING)
+        self.assertTrue(bee.step_change())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.step_engine import SerialEngine, TwoPhaseEngine
+from controller.world_controller import WorldController
+from model.buzzness import Bee, BeeState
+from model.hive import Hive
+from model.world import World, PropertyType, Property
+
+
+class TestStepEngine(unittest.TestCase):
+    """
+    [2.6 Step Engine] Test suite for the serial and two-phase step engines.
+
+    This test suite verifies:
+    - Deterministic resolution of bees reaching the same flower
+    - Deferred hive deliveries
+    - Identical results for any worker count
+    """
+
+    def _build(self, num_bees, engine_factory, cell_capacity=None):
+        world = World((15, 15, 2, 2), (50, 50))
+        for x in range(16, 30, 2):
+            for y in range(16, 30, 3):
+                world.add_property(Property(PropertyType.FLOWER, (x, y), 1, 1, True))
+        world.add_property(Property(PropertyType.TREE, (20, 10), 3, 3, False))
+        world_controller = WorldController(world, cell_capacity=cell_capacity)
+        hive_controller = HiveController(Hive((5, 5)))
+        bees = []
+        for i in range(num_bees):
+            bee = Bee(i + 1, (0, 0), (15, 15), (5, 5), (50, 50))
+            bee.crowding = cell_capacity is not None
+            bee.attach(world_controller)
+            bee.attach(hive_controller)
+            hive_controller.attach(bee)
+            bees.append(bee)
+        engine = engine_factory(world_controller, hive_controller)
+        simulation = SimulationController(world, world_controller, hive_controller, bees, engine=engine)
+        return simulation
+
+    def _snapshot(self, simulation):
+        bees = [(b.ID, b.get_pos(), b.state, b.energy, b.hasNectar) for b in simulation.bees]
+        flowers = [p.has_nectar for p in simulation.world.properties]
+        return bees, flowers, simulation.hive_controller.nectar_delivered
+
+    def test_same_flower_lowest_id_wins(self):
+        """[2.6 Step Engine] Test the lower bee ID gets the nectar whatever the stepping order"""
+        world = World((15, 15, 2, 2), (50, 50))
+        flower = Property(PropertyType.FLOWER, (20, 20), 1, 1, True)
+        world.add_property(flower)
+        world_controller = WorldController(world)
+        engine = TwoPhaseEngine(world_controller, HiveController(Hive((5, 5))))
+
+        bees = []
+        for ID in (2, 1):
+            bee = Bee(ID, (19, 20), (15, 15), (5, 5), (50, 50))
+            bee.inhive = False
+            bee.energy = 10
+            bee.state = BeeState.FOLLOWING
+            bee.path_to_flower = [(1, 0)]
+            bee.attach(world_controller)
+            bees.append(bee)
+
+        engine.run(bees, lambda bee: bee.step_change())
+        self.assertFalse(flower.has_nectar)
+        self.assertEqual([b.hasNectar for b in bees], [False, True])
+        self.assertEqual(world_controller.nectar_collected, 1)
+
+    def test_deferred_delivery(self):
+        """[2.6 Step Engine] Test hive deliveries are applied once in the resolve phase"""
+        hive_controller = HiveController(Hive((5, 5)))
+        engine = TwoPhaseEngine(WorldController(World((15, 15, 2, 2), (50, 50))), hive_controller)
+        bee = Bee(1, (16, 16), (15, 15), (5, 5), (50, 50))
+        bee.inhive = False
+        bee.hasNectar = True
+        bee.state = BeeState.RETURNING
+        bee.path_to_hive = [(-1, -1)]
+        bee.attach(hive_controller)
+
+        engine.run([bee], lambda bee: bee.step_change())
+        self.assertFalse(bee.hasNectar)
+        self.assertEqual(hive_controller.nectar_delivered, 1)
+        self.assertEqual(sum(comb.has_nectar for comb in hive_controller.hive.clist), 1)
+
+    def test_worker_count_does_not_change_results(self):
+        """[2.6 Step Engine] Test seeded runs match for one and several worker threads"""
+        snapshots = []
+        for workers in (1, 4):
+            simulation = self._build(
+                12, lambda wc, hc: TwoPhaseEngine(wc, hc, workers=workers, seed=7))
+            for t in range(1, 40):
+                simulation.step(t)
+            snapshots.append(self._snapshot(simulation))
+            simulation.engine.close()
+        self.assertEqual(snapshots[0], snapshots[1])
+        self.assertGreater(snapshots[0][2] + snapshots[0][1].count(False), 0)
+
+    def test_shard_by_keeps_results(self):
+        """[2.6 Step Engine] Test sharding by key gives the results of equal slices, in bee order"""
+        snapshots = []
+        for shard_by in (None, lambda bee: bee.ID % 3):
+            simulation = self._build(
+                12, lambda wc, hc: TwoPhaseEngine(wc, hc, workers=3, seed=7, shard_by=shard_by))
+            for t in range(1, 40):
+                simulation.step(t)
+            snapshots.append(self._snapshot(simulation))
+            bees = simulation.bees
+            self.assertEqual(simulation.engine.run(bees, lambda bee: bee.ID), [bee.ID for bee in bees])
+            simulation.engine.close()
+        self.assertEqual(snapshots[0], snapshots[1])
+
+    def test_bee_index_needs_one_worker(self):
+        """[2.1.3 Crowding] Test crowding and path sharing are rejected on several workers"""
+        hive_controller = HiveController(Hive((5, 5)))
+        world = World((15, 15, 2, 2), (50, 50))
+        for options in ({"cell_capacity": 1}, {"share_radius": 2}):
+            with self.assertRaises(ValueError):
+                TwoPhaseEngine(WorldController(world, **options), hive_controller, workers=4)
+
+    def test_crowding_on_one_worker(self):
+        """[2.1.3 Crowding] Test a crowded two-phase run on one worker repeats and respects capacity"""
+        snapshots = []
+        for _ in range(2):
+            simulation = self._build(60, lambda wc, hc: TwoPhaseEngine(wc, hc, workers=1, seed=7),
+                                     cell_capacity=1)
+            for t in range(1, 40):
+                simulation.step(t)
+                occupancy = simulation.world_controller.bee_index.occupancy
+                self.assertLessEqual(max(occupancy.values(), default=0), 1)
+            snapshots.append(self._snapshot(simulation))
+            simulation.engine.close()
+        self.assertEqual(snapshots[0], snapshots[1])
+
+    def test_seeded_serial_runs_repeat(self):
+        """[1.1.6 Random streams] Test two seeded serial runs give the same result"""
+        snapshots = []
+        for _ in range(2):
+            simulation = self._build(8, lambda wc, hc: SerialEngine(seed=3))
+            for t in range(1, 40):
+                simulation.step(t)
+            snapshots.append(self._snapshot(simulation))
+        self.assertEqual(snapshots[0], snapshots[1])
+
+    def test_serial_engine(self):
+        """[2.6 Step Engine] Test the serial engine advances every bee in order"""
+        seen = []
+        results = SerialEngine().run([1, 2, 3], lambda bee: seen.append(bee))
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual(results, [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from model.buzzness import Bee, BeeState
+from model.grid import DenseGrid
+from model.neighbour_mask import NeighbourMasks
+from model.swarm import SwarmArrays, step_swarm
+from model.world import PropertyType
+
+
+class TestSwarm(unittest.TestCase):
+    """
+    [1.4 Swarm] Test suite for the array-based swarm kernel.
+
+    This test suite verifies:
+    - Charging and leaving the hive
+    - Obstacles blocking random moves
+    - Flower claims and deliveries
+    """
+
+    def setUp(self):
+        self.grid = DenseGrid((20, 20))
+        self.hive_pos = (5, 5)
+        self.args = dict(grid=self.grid, flower_cells={}, flower_nectar=np.zeros(0, dtype=bool),
+                         hive_pos=self.hive_pos, world_size=(20, 20))
+
+    def test_new_swarm_starts_in_hive(self):
+        """[1.4 Swarm] Test a new swarm starts like Bee(): wandering in the hive with no known flower"""
+        swarm = SwarmArrays(3)
+        self.assertTrue(swarm.inhive.all())
+        self.assertTrue((swarm.state == BeeState.WANDERING.value).all())
+        self.assertTrue((swarm.known_x == -1).all())
+
+    def test_charge_then_leave(self):
+        """[1.4 Swarm] Test bees charge in the hive and leave through the entrance once charged"""
+        swarm = SwarmArrays(1)
+        bees = np.arange(1)
+        draws = np.zeros(1)
+        for _ in range(2):
+            step_swarm(swarm, bees, draws, **self.args)
+        self.assertEqual(swarm.energy[0], 2 * Bee.ENERGY_CHARGE_AMOUNT)
+        self.assertTrue(swarm.inhive[0])
+        step_swarm(swarm, bees, draws, **self.args)
+        self.assertFalse(swarm.inhive[0])
+        self.assertEqual((swarm.x[0], swarm.y[0]), self.hive_pos)
+
+    def test_obstacle_blocks_move(self):
+        """[1.4 Swarm] Test a random move into an obstacle leaves the bee in place and costs energy"""
+        swarm = SwarmArrays(1)
+        swarm.inhive[0] = False
+        swarm.x[0], swarm.y[0], swarm.energy[0] = 5, 5, 10
+        self.grid.fill_rect(3, 3, 5, 5, PropertyType.TREE.value)
+        step_swarm(swarm, np.arange(1), np.zeros(1), **self.args)
+        self.assertEqual((swarm.x[0], swarm.y[0]), (5, 5))
+        self.assertEqual(swarm.energy[0], 10 - Bee.ENERGY_CONSUMPTION)
+
+    def test_masks_pick_alternative_move(self):
+        """[1.4 Swarm] Test neighbour masks steer a boxed-in bee to the one passable cell"""
+        swarm = SwarmArrays(1)
+        swarm.inhive[0] = False
+        swarm.x[0], swarm.y[0], swarm.energy[0] = 5, 5, 10
+        self.grid.fill_rect(3, 3, 5, 5, PropertyType.TREE.value)
+        self.grid.fill_rect(4, 4, 2, 1, self.grid.EMPTY)
+        step_swarm(swarm, np.arange(1), np.zeros(1), masks=NeighbourMasks(self.grid), **self.args)
+        self.assertEqual((swarm.x[0], swarm.y[0]), (4, 4))
+        self.assertEqual(swarm.energy[0], 10 - Bee.ENERGY_CONSUMPTION)
+
+    def test_follower_claims_flower_and_delivers(self):
+        """[1.4 Swarm] Test a following bee claims the flower it reaches and delivers the nectar in the hive"""
+        swarm = SwarmArrays(1)
+        swarm.inhive[0] = False
+        swarm.x[0], swarm.y[0], swarm.energy[0] = 5, 5, 30
+        swarm.state[0] = BeeState.FOLLOWING.value
+        swarm.target_x[0], swarm.target_y[0] = 7, 7
+        self.grid.fill_rect(7, 7, 1, 1, PropertyType.FLOWER.value)
+        args = dict(self.args, flower_cells={(7, 7): 0}, flower_nectar=np.ones(1, dtype=bool))
+        step_swarm(swarm, np.arange(1), np.zeros(1), **args)
+        claims, _ = step_swarm(swarm, np.arange(1), np.zeros(1), **args)
+        self.assertEqual(claims, [(0, 0)])
+
+        swarm.has_nectar[0] = True
+        swarm.state[0] = BeeState.RETURNING.value
+        swarm.target_x[0], swarm.target_y[0] = self.hive_pos
+        deliveries = []
+        for _ in range(2):
+            deliveries += step_swarm(swarm, np.arange(1), np.zeros(1), **args)[1]
+        self.assertEqual(deliveries, [0])
+        self.assertTrue(swarm.inhive[0])
+
+    def test_shared_swarm_attaches_by_name(self):
+        """[1.4 Swarm] Test a second view attached by name shares the swarm arrays"""
+        swarm = SwarmArrays(4, shared=True)
+        try:
+            other = SwarmArrays(4, name=swarm.name)
+            other.x[2] = 9
+            self.assertEqual(swarm.x[2], 9)
+            other.close()
+        finally:
+            swarm.close()
+            swarm.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
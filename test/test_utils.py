@@ -155,5 +155,11 @@ class TestUtils(unittest.TestCase):
             find_path_to_hive(self.hive_pos, "invalid")
 
 
+    def test_find_path_longer_than_small_worlds(self):
+        """Test a path across a 12000x12000 world is not cut short"""
+        path = find_path_to_hive((0, 0), (11999, 5000))
+        self.assertEqual(len(path), 11999)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
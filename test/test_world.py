@@ -1,6 +1,7 @@
 import unittest
 import json
 import tempfile
+from unittest.mock import Mock
 from model.world import World, PropertyType, Property
 
 class TestWorld(unittest.TestCase):
@@ -71,6 +72,90 @@ class TestWorld(unittest.TestCase):
         self.assertEqual(flower.height, 1)        # Height
         self.assertTrue(flower.has_nectar)        # Nectar status
 
+    def test_occupancy_grid(self):
+        """[1.2.2 Occupancy Grid] Test properties are rasterised into the occupancy grid"""
+        self.world.add_property(self.tree)
+        self.assertFalse(self.world.is_empty((11, 11)))
+        self.assertTrue(self.world.is_empty((12, 12)))
+
+    def test_remove_property(self):
+        """[1.2.3 Spatial Hash] Test removing a property repaints only its area"""
+        observer = Mock()
+        self.world.attach(observer)
+        overlap = Property(PropertyType.HOUSE, (11, 11), 2, 2, False)
+        self.world.add_property(self.tree)
+        self.world.add_property(overlap)
+        self.world.remove_property(overlap)
+
+        self.assertEqual(self.world.properties, [self.tree])
+        self.assertEqual(self.world.properties_at((11, 11)), [self.tree])
+        self.assertEqual(self.world.grid.get(11, 11), PropertyType.TREE.value)
+        self.assertTrue(self.world.is_empty((12, 12)))
+        self.assertEqual(self.world.last_change, (11, 11, 2, 2))
+        self.assertEqual(observer.update.call_count, 3)
+
+    def test_query_rect(self):
+        """[1.2.3 Spatial Hash] Test rectangle queries over the property index"""
+        self.world.add_property(self.tree)
+        self.world.add_property(self.water)
+        self.assertEqual(self.world.query_rect(0, 0, 25, 25), [self.tree])
+        self.assertEqual(self.world.query_rect(0, 0, 50, 50), [self.tree, self.water])
+
+    def test_nectar_regeneration(self):
+        """[1.2.4 Nectar regeneration] Test depleted flowers refill when they are due"""
+        flower = Property(PropertyType.FLOWER, (5, 5), 1, 1, True, regen_time=3)
+        static = Property(PropertyType.FLOWER, (6, 6), 1, 1, True)
+        self.world.add_property(flower)
+        self.world.add_property(static)
+
+        self.world.regenerate_nectar(1)
+        self.world.deplete_flower(flower)
+        self.world.deplete_flower(static)
+        self.assertFalse(flower.has_nectar)
+
+        self.assertEqual(self.world.regenerate_nectar(3), [])
+        self.assertFalse(flower.has_nectar)
+        self.assertEqual(self.world.regenerate_nectar(4), [flower])
+        self.assertTrue(flower.has_nectar)
+        # Flowers without a regeneration time never refill
+        self.assertFalse(static.has_nectar)
+        self.assertEqual(self.world._refills, [])
+
+    def test_removed_flower_not_refilled(self):
+        """[1.2.4 Nectar regeneration] Test flowers removed while empty stay empty"""
+        flower = Property(PropertyType.FLOWER, (5, 5), 1, 1, True, regen_time=1)
+        self.world.add_property(flower)
+        self.world.deplete_flower(flower)
+        self.world.remove_property(flower)
+        self.assertEqual(self.world.regenerate_nectar(5), [])
+        self.assertFalse(flower.has_nectar)
+
+    def test_nectar_flower_index(self):
+        """[1.2.4 Nectar regeneration] Test the live index of flowers holding nectar"""
+        flower = Property(PropertyType.FLOWER, (5, 5), 1, 1, True, regen_time=2)
+        self.world.add_property(flower)
+        self.world.add_property(self.flower)
+        self.world.add_property(self.tree)
+        self.assertEqual(self.world.nectar_count, 2)
+
+        self.world.deplete_flower(flower)
+        self.assertEqual(list(self.world.nectar_flowers), [self.flower])
+        self.world.remove_property(self.flower)
+        self.assertEqual(self.world.nectar_count, 0)
+
+        self.world.regenerate_nectar(2)
+        self.assertEqual(list(self.world.nectar_flowers), [flower])
+
+    def test_tiled_world(self):
+        """[1.2.2 Occupancy Grid] Test a huge tiled world only stores tiles holding properties"""
+        world = World(self.hive_pos, (100000, 100000), tile_size=256)
+        world.add_property(Property(PropertyType.FLOWER, (50000, 50000), 1, 1, True))
+        self.assertIsNone(world.world)
+        self.assertFalse(world.is_empty((50000, 50000)))
+        self.assertTrue(world.is_empty((10, 10)))
+        self.assertEqual(len(world.grid.tiles), 1)
+        world.grid.close()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -214,5 +214,116 @@ class TestWorldController(unittest.TestCase):
         self.controller._WorldController__update_bee_moved(bee)
         self._verify_bee_method_called(bee, 'step_back', times=1)
 
+    def test_crowded_cell_blocks_move(self):
+        """[2.1.3 Crowding] Test a bee waits instead of entering a full cell"""
+        controller = WorldController(self.world, self.world_size, cell_capacity=1)
+        first = self._create_test_bee(pos=(10, 10))
+        second = Bee(2, (11, 10), self.hive_pos, (40, 40), self.world_size)
+        second.inhive = False
+        self._mock_bee_methods(second, ['set_nectar_found', 'step_back', 'wait'])
+        controller.track(first)
+
+        second.pos = (10, 10)
+        controller._WorldController__update_bee_moved(second)
+        self._verify_bee_method_called(second, 'wait', times=1)
+        self._verify_bee_method_called(second, 'set_nectar_found', called=False)
+
+        # The bee already on the cell does not count against itself
+        self._mock_bee_methods(first, ['set_nectar_found', 'wait'])
+        controller._WorldController__update_bee_moved(first)
+        self._verify_bee_method_called(first, 'wait', called=False)
+        self._verify_bee_method_called(first, 'set_nectar_found', times=1)
+
+    def test_track_removes_bees_in_hive(self):
+        """[2.1.3 Crowding] Test bees leave the index when they enter the hive"""
+        controller = WorldController(self.world, self.world_size, cell_capacity=2)
+        bee = self._create_test_bee(pos=(5, 5))
+        controller.track(bee)
+        self.assertEqual(controller.bee_index.count((5, 5)), 1)
+        bee.inhive = True
+        controller.track(bee)
+        self.assertNotIn(bee, controller.bee_index)
+
+    def test_share_paths_in_field(self):
+        """[2.1.4 Field path sharing] Test bees within the radius receive a returning bee's path"""
+        controller = WorldController(self.world, self.world_size, share_radius=2)
+        sharer = self._create_test_bee(pos=(30, 10))
+        sharer.state = BeeState.RETURNING
+        sharer.path_to_flower = [(1, 1)] * 5
+        near = Bee(2, (31, 12), self.hive_pos, (40, 40), self.world_size)
+        far = Bee(3, (35, 10), self.hive_pos, (40, 40), self.world_size)
+        following = Bee(4, (29, 10), self.hive_pos, (40, 40), self.world_size)
+        following.state = BeeState.FOLLOWING
+        for bee in (sharer, near, far, following):
+            bee.inhive = False
+            bee.rng = Mock(uniform=Mock(return_value=0.9))
+            controller.track(bee)
+
+        self.assertEqual(controller.share_paths(), 1)
+        self.assertEqual(near.path_to_flower, [(1, 1)] * 5)
+        self.assertIsNot(near.path_to_flower, sharer.path_to_flower)
+        self.assertEqual(far.path_to_flower, [])
+        self.assertEqual(following.path_to_flower, [])
+
+    def test_share_paths_respects_chance(self):
+        """[2.1.4 Field path sharing] Test a low chance draw keeps the bee's own path"""
+        controller = WorldController(self.world, self.world_size, share_radius=2)
+        sharer = self._create_test_bee(pos=(30, 10))
+        sharer.path_to_flower = [(1, 1)] * 5
+        other = Bee(2, (30, 11), self.hive_pos, (40, 40), self.world_size)
+        other.rng = Mock(uniform=Mock(return_value=0.1))
+        for bee in (sharer, other):
+            bee.inhive = False
+            controller.track(bee)
+        self.assertEqual(controller.share_paths(), 0)
+        self.assertEqual(other.path_to_flower, [])
+
+    def test_share_paths_once_per_meeting(self):
+        """[2.1.4 Field path sharing] Test bees that stay within range are offered the path once"""
+        controller = WorldController(self.world, self.world_size, share_radius=2)
+        sharer = self._create_test_bee(pos=(30, 10))
+        sharer.path_to_flower = [(1, 1)] * 5
+        other = Bee(2, (30, 11), self.hive_pos, (40, 40), self.world_size)
+        other.rng = Mock(uniform=Mock(side_effect=[0.1, 0.9]))
+        for bee in (sharer, other):
+            bee.inhive = False
+            controller.track(bee)
+        for _ in range(3):
+            self.assertEqual(controller.share_paths(), 0)
+        self.assertEqual(other.rng.uniform.call_count, 1)
+
+        # Meeting again after parting rolls the chance again
+        other.pos = (40, 11)
+        controller.track(other)
+        self.assertEqual(controller.share_paths(), 0)
+        other.pos = (31, 11)
+        controller.track(other)
+        self.assertEqual(controller.share_paths(), 1)
+        self.assertEqual(other.path_to_flower, [(1, 1)] * 5)
+    def test_on_moves_checks_batch(self):
+        """[2.1.1 Collision detection] Test a batch of moves only handles bees on a property"""
+        flower_bee = self._create_test_bee(pos=(10, 10))
+        tree_bee = Bee(2, (20, 20), self.hive_pos, (40, 40), self.world_size)
+        tree_bee.inhive = False
+        free_bee = Bee(3, (5, 5), self.hive_pos, (40, 40), self.world_size)
+        free_bee.inhive = False
+        home_bee = Bee(4, (10, 10), self.hive_pos, (40, 40), self.world_size)
+        self.controller.on_moves([flower_bee, tree_bee, free_bee, home_bee])
+        self.assertTrue(flower_bee.hasNectar)
+        self.assertTrue(tree_bee._move_invalid)
+        self.assertFalse(free_bee._move_invalid)
+        self.assertFalse(home_bee.hasNectar)
+        self.assertEqual(self.controller.nectar_collected, 1)
+
+    def test_on_moves_crowding_in_batch_order(self):
+        """[2.1.3 Crowding] Test the first bee of a batch takes a free cell and the next one waits"""
+        controller = WorldController(self.world, self.world_size, cell_capacity=1)
+        first = self._create_test_bee(pos=(5, 5))
+        second = Bee(2, (5, 5), self.hive_pos, (40, 40), self.world_size)
+        second.inhive = False
+        controller.on_moves([first, second])
+        self.assertFalse(first._move_blocked)
+        self.assertTrue(second._move_blocked)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
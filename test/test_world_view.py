@@ -75,5 +75,29 @@ class TestWorldView(unittest.TestCase):
         
         plt.close(fig)
 
+    def test_non_square_world(self):
+        """[1.2 World] Test a world wider than it is tall draws properties past its height"""
+        world = World(self.hive_pos, (100, 40))
+        world.add_property(Property(PropertyType.TREE, (80, 10), 3, 2, False))
+        fig, ax = plt.subplots()
+        self.world_view.plot(world, [self.bee], ax)
+        self.assertEqual(world.world.shape, (40, 100))
+        self.assertEqual(ax.images[0].get_array().shape, (40, 100))
+        tree_value = PropertyType.TREE.value * (50/20)
+        self.assertTrue(np.all(world.world[10:12, 80:83] == int(tree_value)))
+        self.assertNotEqual(world.world[10, 79], int(tree_value))
+        plt.close(fig)
+
+    def test_scent_layer(self):
+        """[1.2.7 Scent Field] Test the scent layer is drawn over the world"""
+        from model.scent import ScentField
+        self.world.scent = ScentField(self.world_size)
+        self.world.scent.deposit([20], [25])
+        fig, ax = plt.subplots()
+        self.world_view.plot(self.world, [self.bee], ax)
+        self.assertEqual(len(ax.images), 2)
+        self.assertEqual(ax.images[1].get_array()[25, 20], 1.0)
+        plt.close(fig)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,277 @@
+import contextlib
+import itertools
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.step_engine import SerialEngine
+from controller.world_controller import WorldController
+from model.buzzness import Bee
+from model.hive import Hive
+from model.world import World
+from utils.constants import HIVE_POS
+from utils.utils import find_path_to_flower, find_path_to_hive
+from view.HiveView import HiveView
+from view.MainView import MainView
+from view.WorldView import WorldView
+
+# Metrics measured for every case, mapped to True when a higher value is better
+METRICS = {
+    "steps_per_sec": True,
+    "collision_checks_per_sec": True,
+    "pathfinding_calls_per_sec": True,
+    "peak_memory_bytes": False,
+    "render_fps": True,
+}
+
+DEFAULTS = {
+    "bee_counts": [10, 100],
+    "map_sizes": [50, 200],
+    "densities": [0.02, 0.1],
+    "steps": 100,
+    "collision_checks": 20000,
+    "pathfinding_calls": 200,
+    "render_frames": 5,
+    "seed": 1,
+    # Largest allowed change against a baseline, as a fraction of the baseline value
+    "thresholds": {"steps_per_sec": 0.25, "collision_checks_per_sec": 0.25, "pathfinding_calls_per_sec": 0.25,
+                   "peak_memory_bytes": 0.25, "render_fps": 0.4},
+}
+
+# Share of the generated properties of each type; only flowers hold nectar
+PROPERTY_MIX = (("flower", 0.4), ("trees", 0.3), ("house", 0.2), ("water", 0.1))
+
+
+def generate_map(map_size, density, seed=None, hive_pos=HIVE_POS):
+    """
+    [2.10 Benchmark] Map file contents for a square world of map_size cells where
+    properties cover about density of the cells, keeping the hive entrance clear.
+
+    Returns:
+        dict: The map in the layout of view/properties.json
+    """
+    rng = np.random.default_rng(seed)
+    hive_x, hive_y = hive_pos[0] % map_size, hive_pos[1] % map_size
+    properties = {name: [] for name, _ in PROPERTY_MIX}
+    names = [name for name, _ in PROPERTY_MIX]
+    shares = [share for _, share in PROPERTY_MIX]
+    covered = 0
+    target = density * map_size * map_size
+    while covered < target:
+        name = names[rng.choice(len(names), p=shares)]
+        width, height = (int(value) for value in rng.integers(1, 4, size=2))
+        x = int(rng.integers(0, map_size - width + 1))
+        y = int(rng.integers(0, map_size - height + 1))
+        if x - 1 <= hive_x <= x + width and y - 1 <= hive_y <= y + height:
+            continue
+        properties[name].append({"x": x, "y": y, "width": width, "height": height})
+        covered += width * height
+    return {"world": {"width": map_size, "height": map_size},
+            "hive": {"x": hive_x, "y": hive_y, "width": hive_pos[2], "height": hive_pos[3]},
+            "properties": properties}
+
+
+def _build(num_bees, map_file, seed):
+    """
+    Serial simulation of num_bees bees on the map in map_file.
+    """
+    main_view = MainView()
+    world_size, hive_pos, hive_size = main_view.read_geometry(map_file)
+    world = World(hive_pos, world_size)
+    main_view.read_property(map_file, world)
+    world_controller = WorldController(world)
+    hive_controller = HiveController(Hive(hive_size), world)
+    bees = []
+    for i in range(num_bees):
+        bee = Bee(i + 1, (0, 0), hive_pos[:2], hive_size, world_size)
+        bee.neighbour_masks = world_controller.neighbour_masks
+        bee.attach(world_controller)
+        bee.attach(hive_controller)
+        hive_controller.attach(bee)
+        world_controller.attach(bee)
+        bees.append(bee)
+    return SimulationController(world, world_controller, hive_controller, bees, engine=SerialEngine(seed))
+
+
+def _rate(count, seconds):
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def measure_steps(num_bees, map_file, steps, seed):
+    """
+    [2.10 Benchmark] Simulation steps per second with every bee stepped serially.
+    """
+    simulation = _build(num_bees, map_file, seed)
+    start = time.perf_counter()
+    for t in range(1, steps + 1):
+        simulation.step(t)
+    elapsed = time.perf_counter() - start
+    simulation.world.grid.close()
+    return _rate(steps, elapsed)
+
+
+def measure_peak_memory(num_bees, map_file, steps, seed):
+    """
+    [2.10 Benchmark] Peak bytes traced by tracemalloc while building and running a simulation.
+    """
+    tracemalloc.start()
+    try:
+        simulation = _build(num_bees, map_file, seed)
+        for t in range(1, steps + 1):
+            simulation.step(t)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    simulation.world.grid.close()
+    return peak
+
+
+def measure_collision_checks(map_file, checks, seed):
+    """
+    [2.10 Benchmark] Collision checks per second: the lookup a WorldController makes for a
+    bee on a random cell to find the property it hit, without handling the hit.
+    """
+    simulation = _build(0, map_file, seed)
+    world, world_controller = simulation.world, simulation.world_controller
+    rng = np.random.default_rng(seed)
+    cells = list(zip(rng.integers(0, world.world_size[0], checks).tolist(),
+                     rng.integers(0, world.world_size[1], checks).tolist()))
+    start = time.perf_counter()
+    for pos in cells:
+        if not world.is_empty(pos):
+            for property in world.properties_at(pos):
+                if world_controller._check_property_collision(pos, property):
+                    break
+    elapsed = time.perf_counter() - start
+    world.grid.close()
+    return _rate(checks, elapsed)
+
+
+def measure_pathfinding(map_size, calls, seed):
+    """
+    [2.10 Benchmark] Pathfinding calls per second, alternating paths out to random cells
+    and back to the hive.
+    """
+    rng = np.random.default_rng(seed)
+    hive = HIVE_POS[0] % map_size, HIVE_POS[1] % map_size
+    targets = list(zip(rng.integers(0, map_size, calls).tolist(), rng.integers(0, map_size, calls).tolist()))
+    start = time.perf_counter()
+    for i, target in enumerate(targets):
+        if i % 2:
+            find_path_to_hive(hive, target)
+        else:
+            find_path_to_flower(hive, target)
+    return _rate(calls, time.perf_counter() - start)
+
+
+def measure_render(num_bees, map_file, frames, seed):
+    """
+    [2.10 Benchmark] Frames per second drawing the hive and world views off screen, after
+    scattering the bees with a few simulation steps.
+    """
+    simulation = _build(num_bees, map_file, seed)
+    for t in range(1, 11):
+        simulation.step(t)
+    figure = Figure(figsize=(10, 5))
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.subplots(1, 2)
+    start = time.perf_counter()
+    for _ in range(frames):
+        axes[0].clear()
+        axes[1].clear()
+        HiveView().plot(simulation.hive_controller.hive, simulation.roster.in_hive(), ax=axes[0])
+        WorldView().plot(simulation.world, simulation.roster.outside(), ax=axes[1])
+        canvas.draw()
+    elapsed = time.perf_counter() - start
+    simulation.world.grid.close()
+    return _rate(frames, elapsed)
+
+
+def case_key(case):
+    return f"bees={case['bees']} map={case['map_size']} density={case['density']}"
+
+
+def run_suite(config=None, log=print):
+    """
+    [2.10 Benchmark] Measure every metric for each combination of bee count, map size and
+    property density. The simulation's own output is silenced while measuring.
+
+    Args:
+        config (dict): Overrides of DEFAULTS
+        log (callable): Called with a line of progress for each case
+
+    Returns:
+        dict: {"config": ..., "machine": ..., "results": [one dict per case]}
+    """
+    overrides = config or {}
+    config = {**DEFAULTS, **overrides}
+    # Thresholds left out of the overrides keep their defaults
+    config["thresholds"] = {**DEFAULTS["thresholds"], **overrides.get("thresholds", {})}
+    check_thresholds(config["thresholds"])
+    seed = config["seed"]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="beebench_") as directory:
+        for map_size, density in itertools.product(config["map_sizes"], config["densities"]):
+            map_file = os.path.join(directory, f"map_{map_size}_{density}.json")
+            with open(map_file, "w") as file:
+                json.dump(generate_map(map_size, density, seed), file)
+            for bees in config["bee_counts"]:
+                case = {"bees": bees, "map_size": map_size, "density": density}
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    case["steps_per_sec"] = measure_steps(bees, map_file, config["steps"], seed)
+                    case["collision_checks_per_sec"] = measure_collision_checks(map_file, config["collision_checks"], seed)
+                    case["pathfinding_calls_per_sec"] = measure_pathfinding(map_size, config["pathfinding_calls"], seed)
+                    case["peak_memory_bytes"] = measure_peak_memory(bees, map_file, config["steps"], seed)
+                    case["render_fps"] = measure_render(bees, map_file, config["render_frames"], seed)
+                log(f"{case_key(case)}: " + ", ".join(f"{metric} {case[metric]:.1f}" for metric in METRICS))
+                results.append(case)
+    return {"config": config,
+            "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                        "processor": platform.processor()},
+            "results": results}
+
+
+def check_thresholds(thresholds):
+    """
+    [2.10 Benchmark] Raise ValueError for a threshold that names no measured metric.
+    """
+    unknown = [metric for metric in thresholds if metric not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark metrics in thresholds: {', '.join(unknown)}; "
+                         f"use {', '.join(METRICS)}")
+
+
+def compare(report, baseline, thresholds):
+    """
+    [2.10 Benchmark] Regressions of report against baseline. A metric regresses when it is
+    worse than the baseline by more than its threshold, a fraction of the baseline value;
+    metrics without a threshold and cases missing from the baseline are not compared.
+
+    Returns:
+        list: One message per regression, empty when the run passes
+    """
+    check_thresholds(thresholds)
+    previous = {case_key(case): case for case in baseline["results"]}
+    regressions = []
+    for case in report["results"]:
+        old = previous.get(case_key(case))
+        if old is None:
+            continue
+        for metric, threshold in thresholds.items():
+            if metric not in old or metric not in case or not old[metric]:
+                continue
+            change = (case[metric] - old[metric]) / old[metric]
+            worse = -change if METRICS[metric] else change
+            if worse > threshold:
+                regressions.append(f"{case_key(case)}: {metric} {old[metric]:.1f} -> {case[metric]:.1f} "
+                                   f"({change:+.0%}, allowed {threshold:.0%})")
+    return regressions
@@ -1,4 +1,11 @@
 VALID_MOVE = [(1,0),(1,1),(-1,-1),(0,1),(-1,0),(0,-1),(-1,1),(1,-1)]
 MOVE_FORWARD = [(1,0),(1,1),(0,1)]
 PARAMETER_FILE = 'parameter.json'
-PROPERTY_FILE = 'view/properties.json'
\ No newline at end of file
+PROPERTY_FILE = 'view/properties.json'
+# Geometry used when the map file does not give its own
+WORLD_SIZE = (50, 50)
+HIVE_POS = (15, 15, 2, 2)
+HIVE_SIZE = (40, 40)
+# Run limits used when the parameter file does not give its own
+MAX_TIME_STEPS = 10000
+MAX_BEES = 100
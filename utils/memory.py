@@ -0,0 +1,82 @@
+import numpy as np
+
+from model.exploration import ExplorationMemory
+from model.swarm import SwarmArrays
+
+# Measured with tracemalloc: a new Bee with its random stream, before it learns any path
+BEE_BYTES = 2048
+# Measured with tracemalloc: one cell of a Hive, its array slot and its Comb object
+COMB_BYTES = 160
+# Bytes of each occupancy grid cell, and of each cell of the dense render buffer
+GRID_CELL_BYTES = np.dtype(np.uint8).itemsize
+RENDER_CELL_BYTES = np.dtype(np.int_).itemsize
+
+
+def estimate_memory(world_size, num_bees, hive_size=(40, 40), colonies=1, tile_size=None, processes=1,
+                    heatmap=False, scent=False, exploration_memory=False):
+    """
+    [2.9 Memory Estimate] Rough bytes a run needs, so a configuration too large for the
+    machine can be stopped before anything is allocated.
+
+    Tiled worlds keep their grid in a memory-mapped file and only page in the tiles bees
+    touch, so the full grid is listed as disk rather than memory. Multi-process runs
+    (processes > 1) hold bees in shared arrays instead of Bee objects.
+
+    Args:
+        world_size (tuple): Width and height of the world in cells
+        num_bees (int): Bees in every colony
+        hive_size (tuple): Width and height of each hive's comb
+        colonies (int): Number of colonies sharing the world
+
+    Returns:
+        dict: Maps each part of the run to its bytes, with the memory total under "total"
+        and the backing file of a tiled grid under "disk"
+    """
+    cells = world_size[0] * world_size[1]
+    bees = num_bees * colonies
+    parts = {}
+    if tile_size:
+        parts["disk"] = cells * GRID_CELL_BYTES
+    else:
+        parts["grid"] = cells * GRID_CELL_BYTES
+        if processes == 1:
+            parts["render buffer"] = cells * RENDER_CELL_BYTES
+    parts["hives"] = colonies * hive_size[0] * hive_size[1] * COMB_BYTES
+    if processes > 1:
+        per_bee = sum(np.dtype(dtype).itemsize for _, dtype in SwarmArrays.FIELDS)
+        # Random draws, plus two halo buffers of IDs and destinations per worker
+        per_bee += np.dtype(np.float64).itemsize + 4 * processes * np.dtype(np.int32).itemsize
+        parts["bees"] = bees * per_bee
+    else:
+        parts["bees"] = bees * BEE_BYTES
+        if exploration_memory:
+            parts["exploration memory"] = bees * ExplorationMemory(world_size).nbytes
+        if heatmap:
+            parts["heatmap"] = cells * np.dtype(np.int32).itemsize
+        if scent:
+            parts["scent"] = cells * np.dtype(np.float32).itemsize
+    parts["total"] = sum(size for name, size in parts.items() if name != "disk")
+    return parts
+
+
+def format_bytes(size):
+    """
+    [2.9 Memory Estimate] Size in the largest unit that keeps it at 1 or more, e.g. "1.5 GB".
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def print_estimate(parts):
+    """
+    [2.9 Memory Estimate] Print an estimate from estimate_memory, largest part first.
+    """
+    details = ", ".join(f"{name} {format_bytes(size)}"
+                        for name, size in sorted(parts.items(), key=lambda item: -item[1])
+                        if name not in ("total", "disk"))
+    print(f"Estimated memory: {format_bytes(parts['total'])} ({details})")
+    if "disk" in parts:
+        print(f"Estimated grid file: up to {format_bytes(parts['disk'])}, paged in per tile")
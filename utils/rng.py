@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def stream(seed, *key):
+    """
+    [1.1.6 Random streams] Independent NumPy generator for the stream named by key.
+    The same (seed, key) always gives the same draws, whichever process or thread uses it.
+
+    Args:
+        seed (int): Seed of the whole run, None for fresh entropy
+        key (int): Stream identifier, e.g. a bee ID
+    """
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=key)))
+
+
+class BeeRandom:
+    """
+    [1.1.6 Random streams] Per-bee random stream offering the random-module calls a Bee uses.
+    Uniform draws are taken from the generator in blocks so each move costs a list lookup
+    instead of a generator call.
+
+    Attributes:
+        block (int): Number of draws taken from the generator at a time
+    """
+    def __init__(self, seed, key, block=256):
+        self.block = block
+        self._generator = stream(seed, key)
+        self._draws = []
+        self._next = 0
+
+    def random(self):
+        """
+        [1.1.6 Random streams] Next uniform draw in [0, 1).
+        """
+        if self._next == len(self._draws):
+            self._draws = self._generator.random(self.block).tolist()
+            self._next = 0
+        value = self._draws[self._next]
+        self._next += 1
+        return value
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
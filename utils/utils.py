@@ -24,8 +24,9 @@ def find_path_to_flower(hive_pos: Position, flower_pos: Position) -> List[Move]:
     print(f"Starting pathfinding from {tuple(current_pos)} to {target_pos}")
 
     # Use a loop that continues as long as we haven't reached the target
-    # Add a safety break for potential infinite loops (though unlikely here)
-    max_iterations = 10000
+    # Add a safety break for potential infinite loops (though unlikely here); every move
+    # closes the gap on both axes, so no path is longer than the larger one
+    max_iterations = max(abs(target_pos[0] - current_pos[0]), abs(target_pos[1] - current_pos[1])) + 1
     iterations = 0
 
     while tuple(current_pos) != target_pos:
@@ -76,8 +77,9 @@ def find_path_to_hive(hive_pos: Position, current_pos: Position) -> List[Move]:
     print(f"Starting pathfinding from {tuple(current_pos)} to {target_pos}")
 
     # Use a loop that continues as long as we haven't reached the target
-    # Add a safety break for potential infinite loops (though unlikely here)
-    max_iterations = 10000
+    # Add a safety break for potential infinite loops (though unlikely here); every move
+    # closes the gap on both axes, so no path is longer than the larger one
+    max_iterations = max(abs(target_pos[0] - current_pos[0]), abs(target_pos[1] - current_pos[1])) + 1
     iterations = 0
 
     while tuple(current_pos) != target_pos:
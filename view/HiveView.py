@@ -10,8 +10,9 @@ class HiveView:
                 hive.hive[comb.pos[0], comb.pos[1]] = level
 
         # plot the bees
-        xvalues = [b.get_pos()[0] for b in blist if b.get_inhive()]
-        yvalues = [b.get_pos()[1] for b in blist if b.get_inhive()]
+        cells = [b.get_pos() for b in blist if b.get_inhive()]
+        xvalues = [cell[0] for cell in cells]
+        yvalues = [cell[1] for cell in cells]
 
         ax.imshow(hive.hive.T, origin="lower", cmap="YlOrBr")
         ax.scatter(xvalues, yvalues, color="yellow")
@@ -2,11 +2,20 @@ from typing import Tuple
 
 from matplotlib import pyplot as plt
 
+from controller.colony_controller import ColonyController
+from controller.domain_controller import DomainController
 from controller.hive_controller import HiveController
+from controller.simulation_controller import SimulationController
+from controller.step_engine import SerialEngine, TwoPhaseEngine
 from controller.world_controller import WorldController
 from model.buzzness import Bee
+from model.colony import Colony
+from model.exploration import ExplorationMemory
 from model.hive import Hive
+from model.scent import ScentField
 from model.world import World, PropertyType, Property
+from utils.constants import HIVE_POS, HIVE_SIZE, WORLD_SIZE
+from utils.memory import estimate_memory, print_estimate
 from view.HiveView import HiveView
 from view.WorldView import WorldView
 import json
@@ -17,6 +26,8 @@ class MainView():
         with open(property_file, 'r') as file:
             jsonFile = json.load(file)
         props = jsonFile.get("properties", {})
+        # Optional refill delay in timesteps per flower type, e.g. {"flower": 30}
+        regeneration = jsonFile.get("nectar_regeneration", {})
         # Loop over each property type and plot them with the specified colours.
         for prop_type, items in props.items():
             for item in items:
@@ -24,6 +35,7 @@ class MainView():
                 y = item.get("y", 0)
                 width = item.get("width", 0)
                 height = item.get("height", 0)
+                regen_time = None
                 if prop_type == "trees":
                     has_nectar = False
                     prop = PropertyType.TREE
@@ -36,62 +48,184 @@ class MainView():
                 elif prop_type == "flower":
                     has_nectar = True
                     prop = PropertyType.FLOWER
+                    regen_time = item.get("regen_time", regeneration.get(prop_type))
                 else:
                     value = None  # Fallback color in case other types are encountered
-                world.add_property(Property(prop, (x, y), width, height, has_nectar))
+                world.add_property(Property(prop, (x, y), width, height, has_nectar, regen_time))
 
-    def simulate(self,time_steps, num_bees, config_file, visualize=True):
-        hive_pos = (15,15,2,2)
-        hive_size = (40, 40)
-        world_size = (50, 50)
+    def read_geometry(self, property_file):
+        """
+        [1.2 World] World size, hive entrance and hive comb size given by a map file, e.g.
+        {"world": {"width": 10000, "height": 10000}, "hive": {"x": 15, "y": 15, "width": 2,
+        "height": 2}, "hive_size": {"width": 40, "height": 40}}, with defaults for missing keys.
 
-        world = World(hive_pos, world_size)
+        Returns:
+            tuple: (world_size, hive_pos, hive_size)
+        """
+        with open(property_file, 'r') as file:
+            jsonFile = json.load(file)
+        world = jsonFile.get("world", {})
+        world_size = (world.get("width", WORLD_SIZE[0]), world.get("height", WORLD_SIZE[1]))
+        hive = jsonFile.get("hive", {})
+        hive_pos = tuple(hive.get(key, default) for key, default in zip(("x", "y", "width", "height"), HIVE_POS))
+        comb = jsonFile.get("hive_size", {})
+        hive_size = (comb.get("width", HIVE_SIZE[0]), comb.get("height", HIVE_SIZE[1]))
+        return world_size, hive_pos, hive_size
+
+    def simulate(self,time_steps, num_bees, config_file, visualize=True, world_size=None, tile_size=None,
+                 stop_condition=None, steady_window=100, two_phase=False, workers=1, seed=None,
+                 cell_capacity=None, share_radius=None, sensing_radius=None, scent=False, scent_interval=1,
+                 heatmap=False, heatmap_file=None, exploration_memory=False, lifecycle=None,
+                 batch_dispatch=False, hives=None, hive_size=None):
+        # Geometry not passed in comes from the map file
+        map_world_size, map_hive_pos, map_hive_size = self.read_geometry(config_file)
+        world_size = tuple(world_size) if world_size else map_world_size
+        hive_size = tuple(hive_size) if hive_size else map_hive_size
+        # hives lists one (x, y, width, height) entrance per competing colony, each with num_bees bees
+        hive_positions = [tuple(pos) for pos in hives] if hives else [map_hive_pos]
+        hive_pos = hive_positions[0]
+        print_estimate(estimate_memory(world_size, num_bees, hive_size, colonies=len(hive_positions),
+                                       tile_size=tile_size, heatmap=heatmap or heatmap_file is not None,
+                                       scent=scent, exploration_memory=exploration_memory))
+
+        # tile_size switches the world to the memory-mapped tiled grid for huge maps
+        world = World(hive_pos, world_size, tile_size=tile_size)
+        for extra_pos in hive_positions[1:]:
+            world.add_hive(extra_pos)
         self.read_property(config_file,world)
-        world_controller = WorldController(world)
-
-        hive = Hive(hive_size)
-        hiveController = HiveController(hive)
-
-        bees = []
-        for i in range(num_bees):
-            bee = Bee(i+1, (0, 0), (hive_pos[0], hive_pos[1]), hive_size, world_size)
+        if scent:
+            world.scent = ScentField(world_size, interval=scent_interval)
+        world_controller = WorldController(world, world_size, cell_capacity=cell_capacity,
+                                           share_radius=share_radius, sensing_radius=sensing_radius)
+
+        colonies = []
+        for number, pos in enumerate(hive_positions, start=1):
+            colony_hive = Hive(hive_size)
+            colonies.append(Colony(number, pos, colony_hive, HiveController(colony_hive, world)))
+        hive = colonies[0].hive
+        hiveController = colonies[0].hive_controller
+
+        def setup(bee, colony=colonies[0]):
+            bee.neighbour_masks = world_controller.neighbour_masks
+            bee.flower_field = world_controller.flower_field
+            bee.scent_field = world.scent
+            bee.crowding = world_controller.cell_capacity is not None
+            if exploration_memory and bee.memory is None:
+                bee.memory = ExplorationMemory(world_size)
             # Register observers
             bee.attach(world_controller)
-            bee.attach(hiveController)
+            bee.attach(colony.hive_controller)
 
             # Register observable
-            hiveController.attach(bee)
+            colony.hive_controller.attach(bee)
             world_controller.attach(bee)
 
-            bees.append(bee)
-
+        # Bee IDs are unique across colonies
+        bees = []
+        for colony in colonies:
+            for i in range(num_bees):
+                bee = Bee(len(bees)+1, (0, 0), (colony.hive_pos[0], colony.hive_pos[1]), hive_size, world_size)
+                setup(bee, colony)
+                colony.bees.append(bee)
+                bees.append(bee)
+        hive_controllers = [colony.hive_controller for colony in colonies]
+
+        # Two-phase stepping resolves shared changes in bee ID order and can use worker threads
+        if two_phase:
+            # With several colonies each worker steps whole colonies
+            shard_by = (lambda bee: bee.hive_pos) if len(colonies) > 1 else None
+            engine = TwoPhaseEngine(world_controller, hive_controllers, workers, seed, shard_by=shard_by)
+        else:
+            engine = SerialEngine(seed)
+        simulation = SimulationController(world, world_controller, hive_controllers, bees,
+                                          stop_condition=stop_condition, steady_window=steady_window,
+                                          engine=engine, record_visits=heatmap or heatmap_file is not None,
+                                          batch_dispatch=batch_dispatch)
+        # Ageing, deaths and brood, e.g. {"lifespan": 500, "brood_cost": 2}; off when None
+        lifecycles = []
+        if lifecycle is not None:
+            if len(colonies) == 1:
+                lifecycles.append(ColonyController(simulation, setup, seed=seed, **lifecycle))
+            else:
+                for colony in colonies:
+                    lifecycles.append(ColonyController(simulation, lambda bee, colony=colony: setup(bee, colony),
+                                                       seed=seed, colony=colony, **lifecycle))
+        self.colonies = colonies
 
         history = []
         if visualize:
             plt.ion()
-            fig, axes = plt.subplots(1, 2, figsize=(10, 5))
+            panels = 3 if heatmap else 2
+            fig, axes = plt.subplots(1, panels, figsize=(5 * panels, 5))
 
         for t in range(1, time_steps + 1):
-            for bee in bees:
-                bee.step_change()
+            simulation.step(t)
+            for colony in lifecycles:
+                colony.step(t)
 #            history.append({'time': t, 'honey': world.hive.honey_storage, 'comb': world.hive.comb_built})
             if visualize:
                 axes[0].clear()
                 axes[1].clear()
                 # use original plot_hive from task4.py
                 hiveView = HiveView()
-                hiveView.plot(hive,bees, ax=axes[0])
+                in_hive = simulation.roster.in_hive()
+                if len(colonies) > 1:
+                    # The hive panel shows the first colony
+                    in_hive = [bee for bee in in_hive if bee in colonies[0]]
+                hiveView.plot(hive, in_hive, ax=axes[0])
 
                 worldView = WorldView()
-                worldView.plot(world,bees, ax=axes[1])
+                worldView.plot(world, simulation.roster.outside(), ax=axes[1])
+                if heatmap:
+                    axes[2].clear()
+                    worldView.plot_heatmap(simulation.heatmap, ax=axes[2])
                 fig.suptitle(f"Timestep {t}")
                 plt.pause(0.1)
+            if simulation.should_stop(t):
+                break
 
         if visualize:
             plt.ioff()
             plt.show()
+        simulation.engine.close()
+        world.grid.close()
+        # Visits per cell over the run, None unless the heatmap was recorded
+        self.visit_counts = simulation.heatmap.counts if simulation.heatmap is not None else None
+        if heatmap_file is not None:
+            simulation.heatmap.save(heatmap_file)
+            print(f"Visit heatmap saved to {heatmap_file}")
+        for colony in lifecycles:
+            size = len(colony.colony.bees) if colony.colony is not None else len(bees)
+            print(f"Bees born: {colony.births}, died: {colony.deaths}, colony size: {size}")
+        if len(colonies) > 1:
+            for colony in colonies:
+                print(f"{colony.name} at {colony.hive_pos[:2]}: nectar delivered {colony.nectar_delivered}")
         return history
 
+    def simulate_domains(self, time_steps, num_bees, config_file, processes=2, world_size=None,
+                         tile_size=None, seed=None, hive_size=None):
+        """
+        [2.7 Domain Decomposition] Run the simulation without visualisation, splitting the
+        world into vertical strips stepped by separate worker processes. This is the path
+        for the largest runs, e.g. 10^5 bees on a tiled 10000x10000 world.
+        """
+        map_world_size, hive_pos, map_hive_size = self.read_geometry(config_file)
+        world_size = tuple(world_size) if world_size else map_world_size
+        hive_size = tuple(hive_size) if hive_size else map_hive_size
+        print_estimate(estimate_memory(world_size, num_bees, hive_size, tile_size=tile_size, processes=processes))
+        world = World(hive_pos, world_size, tile_size=tile_size)
+        self.read_property(config_file,world)
+        hiveController = HiveController(Hive(hive_size))
+        domain = DomainController(world, hiveController, num_bees, workers=processes, seed=seed)
+        try:
+            for t in range(1, time_steps + 1):
+                domain.step(t)
+        finally:
+            domain.close()
+            world.grid.close()
+        print(f"Nectar collected: {domain.nectar_collected}, delivered: {hiveController.nectar_delivered}")
+        return domain.nectar_collected, hiveController.nectar_delivered
+
 if __name__ == "__main__":
     main = MainView()
     main.simulate(time_steps=120,num_bees=5,config_file='properties.json',visualize=True)
@@ -1,8 +1,13 @@
+import numpy as np
 from matplotlib.patches import Rectangle
 
 
 class WorldView:
     def plot(self, world, blist, ax):
+        if world.world is None:
+            self._plot_tiled(world, blist, ax)
+            return
+
         # Reset the world to background value
         world.world.fill(5 * (50/20))
         
@@ -23,15 +28,47 @@ class WorldView:
             world.world[start_y:end_y, start_x:end_x] = value
 
         # plot bee
-        xvalues = [b.get_pos()[0] for b in blist if not b.get_inhive()]
-        yvalues = [b.get_pos()[1] for b in blist if not b.get_inhive()]
+        xvalues, yvalues = self._bee_cells(blist)
 
         ax.imshow(world.world, origin="lower", cmap="tab20", vmin=0, vmax=50)
+        if world.scent is not None:
+            self.plot_scent(world, ax)
+        ax.scatter(xvalues, yvalues, color="yellow")
+
+        self._plot_hive(world, ax)
+
+    def _plot_tiled(self, world, blist, ax):
+        # Tiled worlds have no dense buffer, draw one pixel per tile instead
+        overview = world.grid.overview() * (50/20)
+        ax.imshow(overview, origin="lower", cmap="tab20", vmin=0, vmax=50,
+                  extent=(0, world.grid.width, 0, world.grid.height))
+        xvalues, yvalues = self._bee_cells(blist)
         ax.scatter(xvalues, yvalues, color="yellow")
+        self._plot_hive(world, ax)
+
+    def _bee_cells(self, blist):
+        # One pass over the bees, each position computed once
+        cells = [b.get_pos() for b in blist if not b.get_inhive()]
+        return [cell[0] for cell in cells], [cell[1] for cell in cells]
+
+    def plot_scent(self, world, ax, alpha=0.5):
+        # Scent layer drawn over the properties, transparent where there is none
+        field = np.ma.masked_less_equal(world.scent.field, 0.01)
+        ax.imshow(field, origin="lower", cmap="Greens", alpha=alpha,
+                  extent=(-0.5, world.scent.width - 0.5, -0.5, world.scent.height - 0.5))
+
+    def plot_heatmap(self, heatmap, ax):
+        # Visits per cell so far, on a log scale so rarely visited cells still show
+        ax.imshow(np.log1p(heatmap.counts), origin="lower", cmap="hot")
+        ax.set_title(f"Visits over {heatmap.steps} steps")
+        ax.set_xlabel("X position")
+        ax.set_ylabel("Y position")
 
-        # plot the hive
-        rect = Rectangle((world.hive_pos[0], world.hive_pos[1]), world.hive_pos[2], world.hive_pos[3])
-        ax.add_patch(rect)
+    def _plot_hive(self, world, ax):
+        # plot the hives
+        for hive_pos in world.hives:
+            rect = Rectangle((hive_pos[0], hive_pos[1]), hive_pos[2], hive_pos[3])
+            ax.add_patch(rect)
         ax.set_title("Property")
         ax.set_xlabel("X position")
         ax.set_ylabel("Y position")
\ No newline at end of file